@@ -182,3 +182,557 @@ def test_triangulation_trois_points_exact(client):
     offset_triangles = 4 + nombre_vertices * 8
     nombre_triangles = struct.unpack('>I', flux_output[offset_triangles:offset_triangles+4])[0]
     assert nombre_triangles == 1
+
+# Cas 15 : Cache des résultats
+def test_triangulation_cache_evite_recalcul():
+    """Un second appel sur le même PointSet est servi depuis le cache."""
+    from unittest.mock import patch
+
+    from triangulator.cache import CacheResultats
+
+    cache = CacheResultats()
+    app = create_app(point_set_manager=MagicMock(), cache=cache)
+    app.config['TESTING'] = True
+    app.point_set_manager.get_pointset.return_value = encoder_pointset(
+        [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    )
+
+    with app.test_client() as test_client:
+        premiere = test_client.get('/triangulation/cache_test')
+        with patch('triangulator.workers.triangulate') as triangulate_mock:
+            seconde = test_client.get('/triangulation/cache_test')
+            triangulate_mock.assert_not_called()
+
+    assert premiere.status_code == seconde.status_code == 200
+    assert premiere.data == seconde.data
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+def test_triangulation_cache_invalide_si_pointset_change():
+    """Si le PointSet change, l'empreinte change et le résultat est recalculé."""
+    from triangulator.cache import CacheResultats
+
+    cache = CacheResultats()
+    app = create_app(point_set_manager=MagicMock(), cache=cache)
+    app.config['TESTING'] = True
+
+    with app.test_client() as test_client:
+        app.point_set_manager.get_pointset.return_value = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+        premiere = test_client.get('/triangulation/change')
+        app.point_set_manager.get_pointset.return_value = encoder_pointset([(0.0, 0.0), (2.0, 0.0), (0.0, 2.0)])
+        seconde = test_client.get('/triangulation/change')
+
+    assert premiere.data != seconde.data
+    assert cache.stats()['hits'] == 0
+
+# Cas 16 : Calcul dans un pool de processus
+def test_triangulation_pool_processus():
+    """Le pool de processus renvoie le même flux que le calcul en ligne."""
+    from triangulator.workers import PoolTriangulation, calculer_triangles
+
+    flux = encoder_pointset([(0.0, 0.0), (2.0, 0.0), (1.0, 2.0), (0.0, 2.0), (1.0, 0.5)])
+    with PoolTriangulation(processus=1, timeout=60.0) as pool:
+        app = create_app(point_set_manager=MagicMock(), pool=pool)
+        app.config['TESTING'] = True
+        app.point_set_manager.get_pointset.return_value = flux
+
+        with app.test_client() as test_client:
+            response = test_client.get('/triangulation/pool')
+
+            app.point_set_manager.get_pointset.return_value = encoder_pointset([(0.0, 0.0), (1.0, 1.0)])
+            erreur = test_client.get('/triangulation/pool_erreur')
+
+    assert response.status_code == 200
+    assert response.data == calculer_triangles(flux)
+    assert erreur.status_code == 500
+    assert b'TRIANGULATION_FAILED' in erreur.data
+
+def test_triangulation_pool_sature():
+    """Quand la file du pool est pleine, la requête est refusée immédiatement."""
+    from triangulator.workers import PoolTriangulation
+
+    with PoolTriangulation(processus=1, file_max=0) as pool:
+        app = create_app(point_set_manager=MagicMock(), pool=pool)
+        app.config['TESTING'] = True
+        app.point_set_manager.get_pointset.return_value = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+        with app.test_client() as test_client:
+            response = test_client.get('/triangulation/sature')
+
+    assert response.status_code == 503
+    assert b'OVERLOADED' in response.data
+
+def test_triangulation_pool_processus_interrompu():
+    """Un processus de calcul mort donne une erreur JSON 503, puis le pool est redémarré."""
+    import os
+    from concurrent.futures.process import BrokenProcessPool
+
+    from triangulator.workers import PoolTriangulation, calculer_triangles
+
+    flux = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    with PoolTriangulation(processus=1, timeout=60.0) as pool:
+        app = create_app(point_set_manager=MagicMock(), pool=pool)
+        app.config['TESTING'] = True
+        app.point_set_manager.get_pointset.return_value = flux
+
+        # Tuer le processus de calcul pendant une tâche casse l'exécuteur
+        with pytest.raises(BrokenProcessPool):
+            pool._executeur.submit(os._exit, 1).result(timeout=60.0)
+
+        with app.test_client() as test_client:
+            interrompue = test_client.get('/triangulation/interrompu')
+            reprise = test_client.get('/triangulation/reprise')
+
+    assert interrompue.status_code == 503
+    assert interrompue.get_json()['code'] == 'OVERLOADED'
+    assert reprise.status_code == 200
+    assert reprise.data == calculer_triangles(flux)
+
+# Cas 17 : Requêtes simultanées sur le même PointSet
+def test_triangulation_requetes_simultanees_regroupees():
+    """Des requêtes concurrentes sur un même ID partagent une seule récupération."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    app = create_app(point_set_manager=MagicMock())
+    app.config['TESTING'] = True
+    client = app.test_client()
+
+    flux = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)])
+    libere = threading.Event()
+
+    def get_pointset_lent(_pointset_id):
+        libere.wait(5)
+        return flux
+
+    client.application.point_set_manager.get_pointset.side_effect = get_pointset_lent
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        reponses = [executor.submit(client.get, '/triangulation/populaire') for _ in range(8)]
+        time.sleep(0.2)
+        libere.set()
+        reponses = [r.result() for r in reponses]
+
+    assert all(r.status_code == 200 for r in reponses)
+    assert len({r.data for r in reponses}) == 1
+    assert client.application.point_set_manager.get_pointset.call_count == 1
+
+# Cas 18 : Réponse envoyée en streaming
+def test_triangulation_reponse_streaming(client):
+    """Sans cache ni pool, le flux est envoyé par morceaux avec sa taille annoncée."""
+    from triangulator.workers import calculer_triangles
+
+    flux = encoder_pointset([(float(i % 10), float(i // 10) + 0.01 * i) for i in range(100)])
+    client.application.point_set_manager.get_pointset.return_value = flux
+
+    response = client.get('/triangulation/streaming')
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == 'application/octet-stream'
+    assert response.data == calculer_triangles(flux)
+    assert int(response.headers['Content-Length']) == len(response.data)
+
+# Cas 19 : Tâches asynchrones
+def attendre_job(test_client, job_id, delai=10.0):
+    """Interroge l'état d'une tâche jusqu'à ce qu'elle soit terminée."""
+    import time
+
+    limite = time.monotonic() + delai
+    while True:
+        etat = test_client.get(f'/jobs/{job_id}').get_json()
+        if etat['status'] not in ('pending', 'running'):
+            return etat
+        assert time.monotonic() < limite
+        time.sleep(0.01)
+
+def test_job_triangulation(client):
+    """Soumission, suivi de la progression puis téléchargement du résultat."""
+    from triangulator.workers import calculer_triangles
+
+    flux = encoder_pointset([(float(i % 40), float(i // 40) + 0.01 * (i % 3)) for i in range(2000)])
+    client.application.point_set_manager.get_pointset.return_value = flux
+
+    response = client.post('/jobs', json={'pointSetId': 'grand'})
+    assert response.status_code == 202
+    job_id = response.get_json()['jobId']
+    assert response.headers['Location'] == f'/jobs/{job_id}'
+
+    etat = attendre_job(client, job_id)
+    assert etat['status'] == 'done'
+    assert etat['pointSetId'] == 'grand'
+    assert etat['progress'] == {'inserted': 2000, 'total': 2000}
+
+    resultat = client.get(f'/jobs/{job_id}/result')
+    assert resultat.status_code == 200
+    assert resultat.data == calculer_triangles(flux)
+
+def test_job_en_echec(client):
+    """Le résultat d'une tâche échouée renvoie l'erreur du calcul."""
+    client.application.point_set_manager.get_pointset.return_value = None
+
+    job_id = client.post('/jobs', json={'pointSetId': 'absent'}).get_json()['jobId']
+    etat = attendre_job(client, job_id)
+
+    assert etat['status'] == 'failed'
+    assert etat['error']['code'] == 'NOT_FOUND'
+    assert client.get(f'/jobs/{job_id}/result').status_code == 404
+
+def test_job_annulation(client):
+    """Une tâche en cours s'arrête à la prochaine progression signalée."""
+    import threading
+
+    libere = threading.Event()
+    flux = encoder_pointset([(float(i % 40), float(i // 40) + 0.01 * (i % 3)) for i in range(2000)])
+
+    def get_pointset_lent(_pointset_id):
+        libere.wait(5)
+        return flux
+
+    client.application.point_set_manager.get_pointset.side_effect = get_pointset_lent
+
+    job_id = client.post('/jobs', json={'pointSetId': 'annule'}).get_json()['jobId']
+    assert client.get(f'/jobs/{job_id}/result').status_code == 409
+
+    assert client.delete(f'/jobs/{job_id}').status_code == 200
+    libere.set()
+
+    assert attendre_job(client, job_id)['status'] == 'cancelled'
+    assert client.get(f'/jobs/{job_id}/result').status_code == 410
+
+@pytest.mark.parametrize("corps", [None, {}, {'pointSetId': ''}, {'pointSetId': 12}])
+def test_job_requete_invalide(client, corps):
+    response = client.post('/jobs', json=corps) if corps is not None else client.post('/jobs')
+    assert response.status_code == 400
+
+def test_job_inconnu(client):
+    assert client.get('/jobs/inconnu').status_code == 404
+    assert client.get('/jobs/inconnu/result').status_code == 404
+    assert client.delete('/jobs/inconnu').status_code == 404
+
+def test_jobs_satures():
+    """Au-delà de la file des tâches, la soumission est refusée."""
+    import threading
+
+    from triangulator.jobs import GestionnaireTaches
+
+    libere = threading.Event()
+    app = create_app(point_set_manager=MagicMock(), taches=GestionnaireTaches(file_max=1))
+    app.config['TESTING'] = True
+    app.point_set_manager.get_pointset.side_effect = lambda _id: libere.wait(5) and None
+
+    with app.test_client() as test_client:
+        premiere = test_client.post('/jobs', json={'pointSetId': 'a'})
+        seconde = test_client.post('/jobs', json={'pointSetId': 'b'})
+    libere.set()
+    app.taches.fermer()
+
+    assert premiere.status_code == 202
+    assert seconde.status_code == 503
+    assert b'OVERLOADED' in seconde.data
+
+
+# Cas : Métriques et en-tête Server-Timing
+def test_triangulation_server_timing(client):
+    """La réponse détaille la durée de chaque étape dans l'en-tête Server-Timing."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    client.application.point_set_manager.get_pointset.return_value = encoder_pointset(points)
+
+    response = client.get('/triangulation/chrono')
+
+    assert response.status_code == 200
+    etapes = [e.split(';')[0] for e in response.headers['Server-Timing'].split(', ')]
+    assert etapes == ['fetch', 'decode', 'triangulate', 'total']
+
+
+def test_metrics_etapes_tailles_et_erreurs(client):
+    """L'endpoint /metrics expose les durées par étape, les tailles et les erreurs."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    client.application.point_set_manager.get_pointset.return_value = encoder_pointset(points)
+    response = client.get('/triangulation/metriques')
+    # La durée d'encodage en streaming n'est connue qu'une fois le flux envoyé
+    assert len(response.data) > 0
+
+    client.application.point_set_manager.get_pointset.return_value = None
+    assert client.get('/triangulation/inconnu').status_code == 404
+
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    texte = response.get_data(as_text=True)
+    for etape in ('fetch', 'decode', 'triangulate', 'encode', 'total'):
+        assert f'triangulator_stage_duration_seconds_count{{stage="{etape}"}}' in texte
+    assert 'triangulator_stage_duration_seconds_count{stage="total"} 2' in texte
+    assert 'triangulator_points_count 1' in texte
+    assert 'triangulator_triangles_sum 2' in texte
+    assert 'triangulator_errors_total{code="NOT_FOUND"} 1' in texte
+
+
+def test_metrics_cache_compte_les_tailles():
+    """Avec un cache, les tailles sont relues dans le flux Triangles encodé."""
+    from triangulator.cache import CacheResultats
+
+    app = create_app(point_set_manager=MagicMock(), cache=CacheResultats())
+    app.point_set_manager.get_pointset.return_value = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+    with app.test_client() as test_client:
+        premiere = test_client.get('/triangulation/cache_metriques')
+        seconde = test_client.get('/triangulation/cache_metriques')
+        texte = test_client.get('/metrics').get_data(as_text=True)
+
+    assert 'encode;dur=' in premiere.headers['Server-Timing']
+    assert 'decode' not in seconde.headers['Server-Timing']
+    assert 'triangulator_points_sum 6' in texte
+    assert 'triangulator_triangles_sum 2' in texte
+
+
+# Cas : Profilage à la demande
+def test_profilage_desactive_par_defaut(client):
+    """Sans profileur configuré, l'en-tête X-Profile est ignoré."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    client.application.point_set_manager.get_pointset.return_value = encoder_pointset(points)
+
+    response = client.get('/triangulation/profil', headers={'X-Profile': 'cprofile'})
+
+    assert response.status_code == 200
+    assert 'X-Profile-Id' not in response.headers
+    assert client.get('/profiles/inconnu').status_code == 404
+
+
+def test_profilage_sur_demande_et_telechargement(tmp_path):
+    """Une requête avec X-Profile est profilée et son profil est téléchargeable."""
+    import pstats
+
+    from triangulator.profilage import Profileur
+
+    app = create_app(point_set_manager=MagicMock(), profileur=Profileur(intervalle=3600.0))
+    points = [(float(x), float(x * x % 100)) for x in range(500)]
+    app.point_set_manager.get_pointset.return_value = encoder_pointset(points)
+
+    with app.test_client() as test_client:
+        sans_entete = test_client.get('/triangulation/profil')
+        profilee = test_client.get('/triangulation/profil', headers={'X-Profile': 'cprofile'})
+        limitee = test_client.get('/triangulation/profil', headers={'X-Profile': 'cprofile'})
+        invalide = test_client.get('/triangulation/profil', headers={'X-Profile': 'perf'})
+        telechargement = test_client.get(f"/profiles/{profilee.headers['X-Profile-Id']}")
+
+    assert 'X-Profile-Id' not in sans_entete.headers
+    assert profilee.status_code == 200
+    assert 'X-Profile-Id' not in limitee.headers
+    assert invalide.status_code == 400
+    assert telechargement.status_code == 200
+    assert 'attachment' in telechargement.headers['Content-Disposition']
+
+    fichier = tmp_path / 'profil.pstats'
+    fichier.write_bytes(telechargement.data)
+    assert any(nom == 'triangulate' for _, _, nom in pstats.Stats(str(fichier)).stats)
+
+
+def test_profilage_automatique_collapsed():
+    """En mode automatique, les requêtes sans en-tête sont profilées (à débit limité)."""
+    from triangulator.profilage import Profileur
+
+    app = create_app(point_set_manager=MagicMock(), profileur=Profileur(intervalle=0.0, automatique='sampling'))
+    points = [(float(x), float(x * x % 100)) for x in range(2000)]
+    app.point_set_manager.get_pointset.return_value = encoder_pointset(points)
+
+    with app.test_client() as test_client:
+        response = test_client.get('/triangulation/auto')
+        telechargement = test_client.get(f"/profiles/{response.headers['X-Profile-Id']}")
+
+    assert telechargement.mimetype == 'text/plain'
+    assert b'triangulator.core:triangulate' in telechargement.data
+
+
+# Cas : Triangulation d'un lot de PointSet
+def test_lot_erreurs_par_element(client):
+    """Chaque élément du lot a son propre statut ; un PointSet invalide ne fait pas échouer le lot."""
+    import json
+
+    from triangulator.serializers import decoder_lot, decoder_pointset
+
+    pointsets = {
+        'carre': encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]),
+        'triangle': encoder_pointset([(0.0, 0.0), (2.0, 0.0), (0.0, 2.0)]),
+        'corrompu': b'\x00\x00',
+    }
+    client.application.point_set_manager.get_pointset.side_effect = pointsets.get
+
+    response = client.post(
+        '/triangulations', json={'pointSetIds': ['carre', 'absent', 'corrompu', '', 'triangle', 'carre']}
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/octet-stream'
+    elements = decoder_lot(response.data)
+    assert [statut for statut, _ in elements] == [200, 404, 400, 400, 200, 200]
+    assert json.loads(elements[1][1])['code'] == 'NOT_FOUND'
+    assert json.loads(elements[2][1])['code'] == 'INVALID_POINTSET'
+    assert json.loads(elements[3][1])['code'] == 'INVALID_ID'
+    # Le flux Triangles commence par les sommets, au format PointSet
+    assert decoder_pointset(elements[4][1]) == [(0.0, 0.0), (2.0, 0.0), (0.0, 2.0)]
+    assert elements[0][1] == elements[5][1]
+
+
+def test_lot_requete_invalide(client, monkeypatch):
+    """Un corps sans liste d'ID, ou un lot trop grand, est refusé en entier."""
+    import triangulator.api
+
+    assert client.post('/triangulations', json={'pointSetId': 'a'}).status_code == 400
+    assert client.post('/triangulations', data='pas du json').status_code == 400
+
+    monkeypatch.setattr(triangulator.api, 'TAILLE_MAX_LOT', 2)
+    response = client.post('/triangulations', json={'pointSetIds': ['a', 'b', 'c']})
+    assert response.status_code == 413
+    assert b'BATCH_TOO_LARGE' in response.data
+
+
+def test_lot_vide(client):
+    """Un lot vide donne un flux sans élément."""
+    from triangulator.serializers import decoder_lot
+
+    response = client.post('/triangulations', json={'pointSetIds': []})
+
+    assert response.status_code == 200
+    assert decoder_lot(response.data) == []
+
+
+def test_lot_recuperation_simultanee():
+    """Les PointSet d'un lot sont récupérés simultanément."""
+    import threading
+
+    from triangulator.serializers import decoder_lot
+
+    barriere = threading.Barrier(4, timeout=5)
+    flux = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+    def get_pointset(pointset_id):
+        # Ne se débloque que si quatre récupérations sont en cours en même temps
+        barriere.wait()
+        return flux
+
+    app = create_app(point_set_manager=MagicMock())
+    app.point_set_manager.get_pointset.side_effect = get_pointset
+
+    with app.test_client() as test_client:
+        response = test_client.post('/triangulations', json={'pointSetIds': ['a', 'b', 'c', 'd']})
+
+    assert [statut for statut, _ in decoder_lot(response.data)] == [200] * 4
+
+
+# Cas : PointSet envoyé directement dans le corps de la requête
+def test_post_triangulation_sans_point_set_manager(client):
+    """Un PointSet envoyé dans le corps est triangulé sans appeler le PointSetManager."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    client.application.point_set_manager.get_pointset.return_value = encoder_pointset(points)
+    attendu = client.get('/triangulation/reference').data
+    client.application.point_set_manager.get_pointset.reset_mock()
+
+    response = client.post(
+        '/triangulation', data=encoder_pointset(points), content_type='application/octet-stream'
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/octet-stream'
+    assert response.data == attendu
+    assert 'upload;dur=' in response.headers['Server-Timing']
+    client.application.point_set_manager.get_pointset.assert_not_called()
+
+
+def test_post_triangulation_corps_invalide(client):
+    """Un corps qui n'est pas un PointSet binaire valide est refusé."""
+    flux = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+    mauvais_type = client.post('/triangulation', data=flux, content_type='application/json')
+    tronque = client.post('/triangulation', data=flux[:-3], content_type='application/octet-stream')
+    colineaires = client.post(
+        '/triangulation',
+        data=encoder_pointset([(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)]),
+        content_type='application/octet-stream',
+    )
+
+    assert mauvais_type.status_code == 415
+    assert tronque.status_code == 400
+    assert b'INVALID_POINTSET' in tronque.data
+    assert colineaires.status_code == 500
+    assert b'TRIANGULATION_FAILED' in colineaires.data
+
+
+def test_post_triangulation_taille_limitee(client, monkeypatch):
+    """La limite de taille est appliquée à l'en-tête, au Content-Length et en cours de lecture."""
+    import io
+    import struct
+
+    import triangulator.api
+
+    monkeypatch.setattr(triangulator.api, 'POINTS_MAX_TELEVERSEMENT', 3)
+    monkeypatch.setattr(triangulator.api, 'TAILLE_MORCEAU_TELEVERSEMENT', 8)
+    quatre_points = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)])
+    trois_points = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+    # En-tête annonçant trop de points
+    entete = client.post('/triangulation', data=quatre_points, content_type='application/octet-stream')
+    # Content-Length au-delà de la limite (octets superflus après les points)
+    longueur = client.post(
+        '/triangulation', data=trois_points + bytes(100), content_type='application/octet-stream'
+    )
+    # Corps envoyé par morceaux, sans Content-Length (le serveur WSGI signale
+    # alors la fin du corps par wsgi.input_terminated)
+    par_morceaux = client.post(
+        '/triangulation',
+        input_stream=io.BytesIO(trois_points + bytes(100)),
+        headers={'Content-Type': 'application/octet-stream', 'Transfer-Encoding': 'chunked'},
+        environ_overrides={'wsgi.input_terminated': True},
+    )
+
+    # En-tête annonçant trop de points, suivi d'un corps trop court pour eux
+    entete_corps_court = client.post(
+        '/triangulation', data=struct.pack('>I', 4) + bytes(8), content_type='application/octet-stream'
+    )
+
+    for response in (entete, longueur, par_morceaux, entete_corps_court):
+        assert response.status_code == 413
+        assert b'PAYLOAD_TOO_LARGE' in response.data
+
+    accepte = client.post('/triangulation', data=trois_points, content_type='application/octet-stream')
+    assert accepte.status_code == 200
+
+
+def test_post_triangulation_pool_processus():
+    """Avec un pool de processus, le calcul d'un PointSet envoyé y est délégué."""
+    from triangulator.workers import PoolTriangulation, calculer_triangles
+
+    flux = encoder_pointset([(float(x), float(x * x % 100)) for x in range(200)])
+
+    with PoolTriangulation(processus=1, timeout=60.0) as pool:
+        app = create_app(pool=pool)
+        with app.test_client() as test_client:
+            response = test_client.post('/triangulation', data=flux, content_type='application/octet-stream')
+
+    assert response.status_code == 200
+    assert response.data == calculer_triangles(flux)
+    assert 'compute;dur=' in response.headers['Server-Timing']
+
+def test_post_triangulation_pool_corps_brut():
+    """Le pool reçoit le corps validé tel quel, sans construire ni réencoder les points."""
+    from unittest.mock import patch
+
+    from triangulator.serializers import DecodeurPointSet
+    from triangulator.workers import calculer_triangles
+
+    flux = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]) + b'\x00\x01'  # octets en trop conservés
+    pool = MagicMock()
+    pool.calculer.return_value = calculer_triangles(flux)
+    app = create_app(pool=pool)
+    with patch.object(DecodeurPointSet, 'terminer', side_effect=AssertionError("points construits")), \
+            app.test_client() as test_client:
+        response = test_client.post('/triangulation', data=flux, content_type='application/octet-stream')
+        tronque = test_client.post('/triangulation', data=flux[:-3], content_type='application/octet-stream')
+
+    assert response.status_code == 200
+    (corps,), _ = pool.calculer.call_args
+    assert bytes(corps) == flux
+    assert tronque.status_code == 400
+    assert pool.calculer.call_count == 1
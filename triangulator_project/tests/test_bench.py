@@ -0,0 +1,135 @@
+"""Tests unitaires du banc de mesure des performances."""
+
+import json
+
+import pytest
+from triangulator.bench import (
+    DISTRIBUTIONS,
+    ETAPES,
+    comparer,
+    executer,
+    generer_pointset,
+    main,
+    mesurer,
+    pente,
+    percentile,
+)
+from triangulator.serializers import decoder_pointset
+
+
+@pytest.mark.parametrize("distribution", sorted(DISTRIBUTIONS))
+def test_generer_pointset_points_distincts(distribution):
+    """Chaque distribution produit un PointSet valide de points distincts."""
+    points = decoder_pointset(generer_pointset(distribution, 200))
+
+    assert 0 < len(points) <= 200
+    assert len(set(points)) == len(points)
+
+
+def test_generer_pointset_reproductible():
+    """Une même graine produit le même PointSet."""
+    assert generer_pointset("uniforme", 100, graine=3) == generer_pointset("uniforme", 100, graine=3)
+    assert generer_pointset("uniforme", 100, graine=3) != generer_pointset("uniforme", 100, graine=4)
+
+
+def test_mesurer_une_duree_par_repetition():
+    """Chaque étape est chronométrée à chaque répétition."""
+    durees = mesurer(generer_pointset("grille", 50), repetitions=4)
+
+    assert set(durees) == set(ETAPES)
+    assert all(len(d) == 4 and all(t >= 0 for t in d) for d in durees.values())
+
+
+def test_percentile():
+    """Les percentiles sont interpolés entre les valeurs triées."""
+    valeurs = [4.0, 1.0, 3.0, 2.0, 5.0]
+
+    assert percentile(valeurs, 0.0) == 1.0
+    assert percentile(valeurs, 0.5) == 3.0
+    assert percentile(valeurs, 0.9) == pytest.approx(4.6)
+    assert percentile(valeurs, 1.0) == 5.0
+    assert percentile([2.0], 0.9) == 2.0
+
+
+def test_pente_loi_puissance():
+    """La pente log-log retrouve l'exposant d'une loi puissance."""
+    assert pente([(n, 1e-6 * n) for n in (10, 100, 1000)]) == pytest.approx(1.0)
+    assert pente([(n, 1e-6 * n * n) for n in (10, 100, 1000)]) == pytest.approx(2.0)
+    assert pente([(100, 1.0)]) is None
+
+
+def test_executer_rapport():
+    """Le rapport contient une mesure par combinaison et les pentes par étape."""
+    affichees = []
+    rapport = executer(("uniforme", "cercle"), (10, 100), repetitions=2, afficher=affichees.append)
+
+    assert len(rapport["mesures"]) == 2 * 2 * len(ETAPES)
+    assert affichees == rapport["mesures"]
+    for mesure in rapport["mesures"]:
+        assert mesure["min"] <= mesure["p50"] <= mesure["p90"] <= mesure["max"]
+    assert set(rapport["pentes"]) == {"uniforme", "cercle"}
+    assert set(rapport["pentes"]["uniforme"]) == set(ETAPES)
+    json.dumps(rapport)
+
+
+def _rapport(p50, pente_triangulation):
+    """Construit un rapport minimal pour les tests de comparaison."""
+    return {
+        "mesures": [{"distribution": "uniforme", "n": 1000, "etape": "triangulation", "p50": p50}],
+        "pentes": {"uniforme": {"triangulation": pente_triangulation}},
+    }
+
+
+def test_comparer_sans_regression():
+    """Des variations dans les tolérances ne sont pas des régressions."""
+    assert comparer(_rapport(0.11, 1.2), _rapport(0.1, 1.1)) == []
+
+
+def test_comparer_detecte_regressions():
+    """Un temps médian ou une pente en hausse au-delà des tolérances est signalé."""
+    regressions = comparer(_rapport(0.2, 2.0), _rapport(0.1, 1.1))
+
+    assert len(regressions) == 2
+    assert "médiane" in regressions[0]
+    assert "pente 2.00" in regressions[1]
+
+
+def test_comparer_ignore_mesures_absentes_de_la_reference():
+    """Seules les mesures présentes dans la référence sont comparées."""
+    assert comparer(_rapport(0.2, 2.0), {"mesures": [], "pentes": {}}) == []
+
+
+def test_main_enregistre_et_compare(tmp_path, capsys):
+    """La ligne de commande enregistre le rapport puis détecte une régression."""
+    sortie = tmp_path / "rapport.json"
+    arguments = ["--distributions", "grille", "--tailles", "10", "100", "--repetitions", "1"]
+
+    assert main([*arguments, "--sortie", str(sortie)]) == 0
+    rapport = json.loads(sortie.read_text(encoding="utf-8"))
+    assert {m["n"] for m in rapport["mesures"]} == {10, 100}
+
+    for mesure in rapport["mesures"]:
+        mesure["p50"] /= 1000
+    sortie.write_text(json.dumps(rapport), encoding="utf-8")
+
+    assert main([*arguments, "--reference", str(sortie)]) == 1
+    assert "RÉGRESSION" in capsys.readouterr().err
+
+
+def test_main_pentes_seulement(tmp_path):
+    """Une référence réduite aux pentes ne compare pas les temps absolus."""
+    sortie = tmp_path / "reference.json"
+    arguments = ["--distributions", "grille", "--tailles", "10", "100", "--repetitions", "1"]
+
+    assert main([*arguments, "--pentes-seulement", "--sortie", str(sortie)]) == 0
+    reference = json.loads(sortie.read_text(encoding="utf-8"))
+    assert "mesures" not in reference
+    assert set(reference["pentes"]["grille"]) == {"decodage", "triangulation", "encodage"}
+
+    assert comparer(_rapport(1000.0, 1.0), {"pentes": {}}) == []
+
+
+def test_main_tailles_invalides():
+    """Une taille inférieure à 3 est refusée."""
+    with pytest.raises(SystemExit):
+        main(["--tailles", "2"])
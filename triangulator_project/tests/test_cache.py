@@ -0,0 +1,79 @@
+"""Tests du cache des résultats de triangulation (cache.py)."""
+
+from triangulator.cache import CacheDisque, CacheResultats, cle_resultat
+
+
+def test_cle_depend_du_contenu():
+    assert cle_resultat("42", b"abc") == cle_resultat("42", b"abc")
+    assert cle_resultat("42", b"abc") != cle_resultat("42", b"abd")
+    assert cle_resultat("42", b"abc") != cle_resultat("43", b"abc")
+
+def test_cache_hit_miss():
+    cache = CacheResultats()
+    assert cache.get("a") is None
+    cache.put("a", b"resultat")
+    assert cache.get("a") == b"resultat"
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['octets'] == len(b"resultat")
+
+def test_cache_eviction_lru_par_taille():
+    cache = CacheResultats(taille_max_octets=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"5678")
+    cache.get("a")  # "a" devient la plus récente
+    cache.put("c", b"90ab")  # dépasse 10 octets : "b" est évincée
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"90ab"
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['octets'] <= 10
+
+def test_cache_entree_trop_grosse_ignoree():
+    cache = CacheResultats(taille_max_octets=4)
+    cache.put("a", b"12345")
+    assert cache.get("a") is None
+
+def test_cache_disque(tmp_path):
+    disque = CacheDisque(str(tmp_path / "cache"))
+    assert disque.get("a") is None
+    disque.put("a", b"resultat")
+    assert disque.get("a") == b"resultat"
+    # Aucun fichier temporaire ne doit rester
+    assert [f.suffix for f in (tmp_path / "cache").iterdir()] == [".bin"]
+
+def test_cache_disque_eviction(tmp_path):
+    """Au-delà de la taille maximale, les fichiers les moins récemment utilisés sont supprimés."""
+    import os
+
+    disque = CacheDisque(str(tmp_path), taille_max_octets=10)
+    for i, cle in enumerate(("a", "b", "c")):
+        disque.put(cle, b"1234")
+        # Dates de modification distinctes, quelle que soit la résolution du système de fichiers
+        os.utime(disque._chemin(cle), (i, i))
+    assert disque.evictions == 1
+    assert disque.get("a") is None
+
+    os.utime(disque._chemin("b"), (10, 10))  # "b" devient la plus récemment utilisée
+    disque.put("d", b"1234")
+    assert disque.get("b") == b"1234"
+    assert disque.get("c") is None
+    assert disque.evictions == 2
+
+    # Les fichiers existants sont comptés au redémarrage ; un flux trop gros est ignoré
+    reouvert = CacheDisque(str(tmp_path), taille_max_octets=10)
+    reouvert.put("e", b"12345678901")
+    assert reouvert.get("e") is None
+    assert sum(1 for f in tmp_path.iterdir()) == 2
+
+def test_cache_second_niveau(tmp_path):
+    disque = CacheDisque(str(tmp_path))
+    CacheResultats(second_niveau=disque).put("a", b"resultat")
+
+    # Un nouveau cache mémoire retrouve l'entrée sur disque
+    cache = CacheResultats(second_niveau=disque)
+    assert cache.get("a") == b"resultat"
+    assert cache.stats()['entrees'] == 1
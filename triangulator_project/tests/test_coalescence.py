@@ -0,0 +1,52 @@
+"""Tests du regroupement des calculs concurrents (coalescence.py)."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from triangulator.coalescence import Coalesceur
+
+
+def test_calcul_partage_entre_appels_concurrents():
+    coalesceur = Coalesceur()
+    demarre = threading.Event()
+    libere = threading.Event()
+    appels = []
+
+    def calcul():
+        appels.append(1)
+        demarre.set()
+        libere.wait(5)
+        return b"resultat"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        meneur = executor.submit(coalesceur.executer, "42", calcul)
+        demarre.wait(5)
+        suiveurs = [executor.submit(coalesceur.executer, "42", calcul) for _ in range(4)]
+        # Laisser aux suiveurs le temps de se bloquer sur le calcul en cours
+        time.sleep(0.1)
+        assert coalesceur.nombre_en_cours() == 1
+        libere.set()
+        resultats = [meneur.result()] + [f.result() for f in suiveurs]
+
+    assert resultats == [b"resultat"] * 5
+    assert len(appels) == 1
+    assert coalesceur.nombre_en_cours() == 0
+
+def test_exception_propagee_et_calcul_relance():
+    coalesceur = Coalesceur()
+
+    def echec():
+        raise ValueError("échec")
+
+    with pytest.raises(ValueError):
+        coalesceur.executer("42", echec)
+
+    # Le calcul en échec n'est pas mémorisé : un nouvel appel le relance
+    assert coalesceur.executer("42", lambda: 7) == 7
+
+def test_cles_differentes_independantes():
+    coalesceur = Coalesceur()
+    assert coalesceur.executer("a", lambda: 1) == 1
+    assert coalesceur.executer("b", lambda: 2) == 2
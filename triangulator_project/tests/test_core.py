@@ -1,7 +1,9 @@
 """Tests de l'algorithme de triangulation (core.py)."""
 
+import random
+
 import pytest
-from triangulator.core import triangulate
+from triangulator.core import DelaunayTriangulation, triangulate
 from triangulator.exceptions import ErreurTriangulation
 
 
@@ -327,3 +329,391 @@ def test_ordre_points_different():
         # Le nombre de triangles devrait être le même
         assert len(triangles) == nb_triangles_attendu
 
+
+def test_triangulation_respecte_critere_delaunay():
+    """Aucun point ne doit être strictement dans le cercle circonscrit d'un triangle."""
+    import random
+    random.seed(7)
+    points = [(random.uniform(0, 100), random.uniform(0, 100)) for _ in range(200)]
+    triangles = triangulate(points)
+
+    for (ax, ay), (bx, by), (cx, cy) in triangles:
+        for px, py in points:
+            # Déterminant du test du cercle circonscrit (signe corrigé par l'orientation)
+            adx, ady = ax - px, ay - py
+            bdx, bdy = bx - px, by - py
+            cdx, cdy = cx - px, cy - py
+            det = (
+                (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+                - (bdx * bdx + bdy * bdy) * (adx * cdy - cdx * ady)
+                + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+            )
+            orient = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+            assert det * orient <= 1e-6, f"Point {(px, py)} dans le cercle de {((ax, ay), (bx, by), (cx, cy))}"
+
+@pytest.mark.parametrize("order", ["input", "hilbert", "brio"])
+def test_ordre_insertion_meme_triangulation(order):
+    """L'ordre d'insertion ne doit pas changer les triangles (points en position générale)."""
+    import random
+    random.seed(3)
+    points = [(random.uniform(-50, 50), random.uniform(-50, 50)) for _ in range(300)]
+
+    reference = {frozenset(tri) for tri in triangulate(points, order="input")}
+    triangles = {frozenset(tri) for tri in triangulate(points, order=order)}
+    assert triangles == reference
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("order", ["hilbert", "brio"])
+def test_ordre_insertion_coordonnees_extremes(engine, order):
+    """Des coordonnées finies dont l'étendue déborde (±1e308) ou minuscules ne font pas échouer l'ordre."""
+    import warnings
+
+    from triangulator.core import _cles_hilbert
+
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    random.seed(5)
+    points = [(random.uniform(-1, 1) * 1.7e308, random.uniform(-1, 1) * 1.7e308) for _ in range(40)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        triangles = triangulate(points, order=order, engine=engine)
+
+    assert len(triangles) > 0
+    cles = _cles_hilbert(points)
+    assert all(0 <= cle < 1 << 20 for cle in cles)
+    assert _cles_hilbert([(0.0, 0.0), (5e-324, 0.0), (0.0, 5e-324), (1e-320, 3e-321)])
+
+def test_ordre_insertion_inconnu():
+    points = [(0, 0), (1, 0), (0, 1), (1, 1)]
+    with pytest.raises(ValueError):
+        triangulate(points, order="aleatoire")
+
+def test_moteur_numpy_memes_triangles():
+    """Le moteur NumPy doit donner les mêmes triangles que le moteur Python."""
+    np = pytest.importorskip("numpy")
+    import random
+    random.seed(11)
+    points = [(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(200)]
+
+    reference = {frozenset(tri) for tri in triangulate(points)}
+    resultat = triangulate(np.array(points), engine="numpy")
+
+    assert resultat.shape == (len(reference), 3, 2)
+    assert {frozenset(map(tuple, tri.tolist())) for tri in resultat} == reference
+
+@pytest.mark.parametrize("points", [
+    [(0, 0), (1, 1)],
+    [(0, 0), (1, 0), (float("nan"), 1)],
+    [(0, 0), (1, 0), (float("inf"), 1)],
+    [(0, 0), (1, 1), (2, 0), (1, 1)],
+    [(0, 0), (1, 1), (2, 2), (3, 3)],
+])
+def test_moteur_numpy_validation(points):
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ErreurTriangulation):
+        triangulate(np.array(points, dtype=float), engine="numpy")
+
+def test_moteur_inconnu():
+    with pytest.raises(ValueError):
+        triangulate([(0, 0), (1, 0), (0, 1)], engine="gpu")
+
+def test_resultat_triangulation_indices():
+    """Le résultat indexé référence directement les points d'entrée."""
+    from triangulator.core import Triangulation
+
+    points = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]
+    triangulation = triangulate(points, result="triangulation")
+
+    assert isinstance(triangulation, Triangulation)
+    assert triangulation.vertices is points
+    assert len(triangulation) == len(triangulate(points))
+    assert triangulation.triangles() == triangulate(points)
+    assert all(0 <= i < len(points) for i in triangulation.indices)
+
+def test_resultat_triangulation_numpy():
+    np = pytest.importorskip("numpy")
+    points = np.array([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.5, 0.4)])
+    triangulation = triangulate(points, engine="numpy", result="triangulation")
+
+    assert triangulation.indices.dtype == np.int32
+    assert triangulation.indices.shape == (len(triangulation), 3)
+    assert np.array_equal(triangulation.triangles(), triangulate(points, engine="numpy"))
+
+def test_resultat_inconnu():
+    with pytest.raises(ValueError):
+        triangulate([(0, 0), (1, 0), (0, 1)], result="dict")
+
+@pytest.mark.parametrize("decalage", [0.0, 1e6, 1e9])
+def test_grille_grandes_coordonnees(decalage):
+    """Une grille régulière loin de l'origine donne toujours 2 triangles par cellule."""
+    points = [(decalage + x * 0.5, decalage + y * 0.5) for x in range(10) for y in range(10)]
+    triangles = triangulate(points)
+
+    assert len(triangles) == 2 * 9 * 9
+
+def test_petit_triangle_non_colineaire():
+    """Un triangle minuscule n'est pas considéré comme colinéaire (pas de tolérance absolue)."""
+    points = [(0.0, 0.0), (1e-6, 0.0), (0.0, 1e-6)]
+    assert len(triangulate(points)) == 1
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_progression_insertion(engine):
+    """La progression est signalée régulièrement puis une dernière fois à la fin."""
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    from triangulator.core import PAS_PROGRESSION
+
+    points = [(float(i % 50), float(i // 50) + 0.001 * (i % 7)) for i in range(2500)]
+    appels = []
+    triangulate(points, engine=engine, progression=lambda inseres, total: appels.append((inseres, total)))
+
+    assert appels[0] == (0, 2500)
+    assert appels[-1] == (2500, 2500)
+    assert [inseres for inseres, _ in appels[:-1]] == list(range(0, 2500, PAS_PROGRESSION))
+
+def test_progression_interrompt_triangulation():
+    """Une exception levée par la fonction de progression arrête le calcul."""
+    class Arret(Exception):
+        pass
+
+    def arreter(inseres, total):
+        if inseres > 0:
+            raise Arret()
+
+    points = [(float(i % 50), float(i // 50) + 0.001 * (i % 7)) for i in range(2500)]
+    with pytest.raises(Arret):
+        triangulate(points, progression=arreter)
+
+def _cles_triangles(triangles):
+    """Ensemble des triangles, indépendant de l'ordre et du sens de parcours."""
+    return {frozenset(map(tuple, tri)) for tri in triangles}
+
+def test_delaunay_persistante_construction():
+    """La triangulation initiale est celle de triangulate."""
+    rng = random.Random(7)
+    points = [(rng.random(), rng.random()) for _ in range(200)]
+    dt = DelaunayTriangulation(points)
+
+    attendu = triangulate(points, algorithm="divide-and-conquer")
+    assert len(dt) == len(attendu)
+    assert _cles_triangles(dt.triangles()) == _cles_triangles(attendu)
+
+def test_delaunay_persistante_modifications_aleatoires():
+    """Après chaque insertion ou suppression, le résultat est celui d'une triangulation complète."""
+    rng = random.Random(11)
+    points = [(rng.random(), rng.random()) for _ in range(40)]
+    dt = DelaunayTriangulation(points)
+    presents = dict(enumerate(points))
+
+    for _ in range(150):
+        if rng.random() < 0.5 or len(presents) <= 4:
+            # Points aussi hors de l'enveloppe convexe courante
+            point = (rng.uniform(-0.5, 1.5), rng.uniform(-0.5, 1.5))
+            presents[dt.insert(point)] = point
+        else:
+            indice = rng.choice(list(presents))
+            dt.remove(indice)
+            del presents[indice]
+
+        attendu = triangulate(list(presents.values()), algorithm="divide-and-conquer")
+        assert _cles_triangles(dt.triangles()) == _cles_triangles(attendu)
+
+def test_delaunay_persistante_grille():
+    """Points alignés sur l'enveloppe et cocycliques : le nombre de triangles reste 2n - 2 - h."""
+    points = [(float(x), float(y)) for x in range(5) for y in range(4)]
+    dt = DelaunayTriangulation(points)
+    assert len(dt) == 2 * 20 - 2 - 14
+
+    dt.remove(0)        # coin
+    dt.remove(6)        # point intérieur
+    dt.insert((2.0, 4.0))  # au-delà du milieu d'un bord
+    dt.insert((5.0, 1.0))  # aligné avec un bord, hors de l'enveloppe
+    restants = [p for p in points if p not in ((0.0, 0.0), (1.0, 2.0))] + [(2.0, 4.0), (5.0, 1.0)]
+
+    attendu = triangulate(restants, algorithm="divide-and-conquer")
+    assert len(dt) == len(attendu)
+    aire = sum(abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) for a, b, c in dt.triangles())
+    assert aire == sum(abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) for a, b, c in attendu)
+
+def test_delaunay_persistante_erreurs():
+    """Doublon, indice inconnu et suppression laissant des points colinéaires sont refusés."""
+    dt = DelaunayTriangulation([(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (1.0, 1.0)])
+    with pytest.raises(ErreurTriangulation):
+        dt.insert((1.0, 0.0))
+    with pytest.raises(ErreurTriangulation):
+        dt.insert((float("nan"), 0.0))
+    with pytest.raises(IndexError):
+        dt.remove(10)
+    with pytest.raises(ErreurTriangulation):
+        dt.remove(3)
+
+    # La triangulation n'a pas été modifiée par les échecs
+    assert len(dt) == 2
+    dt.remove(1)
+    assert len(dt) == 1
+    with pytest.raises(IndexError):
+        dt.remove(1)
+
+def test_delaunay_persistante_pickle():
+    """Une triangulation relue depuis pickle peut être mise à jour."""
+    import pickle
+
+    rng = random.Random(3)
+    points = [(rng.random(), rng.random()) for _ in range(100)]
+    dt = DelaunayTriangulation(points)
+    dt.remove(5)
+
+    relue = pickle.loads(pickle.dumps(dt))
+    assert _cles_triangles(relue.triangles()) == _cles_triangles(dt.triangles())
+
+    relue.insert((0.5, 0.5))
+    relue.remove(17)
+    restants = [p for i, p in enumerate(points) if i not in (5, 17)] + [(0.5, 0.5)]
+    assert _cles_triangles(relue.triangles()) == _cles_triangles(
+        triangulate(restants, algorithm="divide-and-conquer")
+    )
+
+def test_delaunay_persistante_triangulation_compacte():
+    """Le résultat compact renumérote les points restants et s'encode comme celui de triangulate."""
+    from triangulator.serializers import encoder_triangulation, taille_triangles
+
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.5, 0.5)]
+    dt = DelaunayTriangulation(points)
+    dt.remove(1)
+
+    triangulation = dt.triangulation()
+    assert triangulation.vertices == [(0.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.5, 0.5)]
+    assert len(triangulation) == 2  # (0, 0), (0.5, 0.5) et (1, 1) sont alignés sur l'enveloppe
+    assert max(triangulation.indices) == 3
+    assert _cles_triangles(triangulation.triangles()) == _cles_triangles(dt.triangles())
+    assert len(encoder_triangulation(triangulation)) == taille_triangles(4, 2)
+
+def test_statistiques_points_un_seul_parcours():
+    """Boîte englobante et premier point hors de la droite des deux premiers."""
+    from triangulator.core import _statistiques_points
+
+    points = [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0), (5.0, -3.0), (-1.0, 4.0)]
+    assert _statistiques_points(points) == ((-1.0, 5.0, -3.0, 4.0), 3)
+    assert _statistiques_points(points[:3]) == ((0.0, 2.0, 0.0, 2.0), -1)
+
+@pytest.mark.parametrize("point, message", [
+    ((float("nan"), 0.0), "NaN"),
+    ((0.0, float("-inf")), "infinies"),
+])
+@pytest.mark.parametrize("position", [0, 1, 3])
+def test_statistiques_points_valeurs_non_finies(point, message, position):
+    """Une coordonnée non finie est signalée quelle que soit sa position, même sur la droite de référence."""
+    from triangulator.core import _statistiques_points
+
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    points[position] = point
+    with pytest.raises(ErreurTriangulation, match=message):
+        _statistiques_points(points)
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_doublons_fusionnes(engine):
+    """Avec duplicates="merge", les doublons sont fusionnés et la correspondance garde les indices d'entrée."""
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 0.0), (1.0, 1.0), (0.0, 1.0), (1.0, 1.0)]
+
+    triangulation = triangulate(points, engine=engine, duplicates="merge", result="triangulation")
+
+    assert [tuple(map(float, p)) for p in triangulation.vertices] == [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    assert list(triangulation.correspondance) == [0, 1, 0, 2, 3, 2]
+    assert len(triangulation) == 2
+    for i, p in enumerate(points):
+        assert tuple(map(float, triangulation.vertices[triangulation.correspondance[i]])) == p
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_doublons_fusionnes_avec_tolerance(engine):
+    """Les points à moins de ``tolerance`` du premier point rencontré lui sont rattachés."""
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    points = [(0.0, 0.0), (1.0, 0.0), (1e-4, -1e-4), (0.0, 1.0), (1.0, 1.0), (0.9995, 1.0)]
+
+    triangulation = triangulate(points, engine=engine, duplicates="merge", tolerance=1e-3, result="triangulation")
+
+    assert list(triangulation.correspondance) == [0, 1, 0, 2, 3, 3]
+    assert len(triangulation) == 2
+    # Sans tolérance, les points proches restent distincts
+    assert len(triangulate(points, engine=engine, duplicates="merge", result="triangulation").vertices) == 6
+
+def test_doublons_rejetes_par_defaut():
+    """Sans duplicates="merge", les doublons restent une erreur et la correspondance est absente."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (0.0, 0.0)]
+    with pytest.raises(ErreurTriangulation):
+        triangulate(points)
+    assert triangulate(points[:3], result="triangulation").correspondance is None
+
+def test_doublons_fusionnes_trop_peu_de_points():
+    """Une fois fusionnés, les points doivent encore pouvoir être triangulés."""
+    with pytest.raises(ErreurTriangulation):
+        triangulate([(0.0, 0.0), (1.0, 1.0), (0.0, 0.0), (1.0, 1.0)], duplicates="merge")
+
+@pytest.mark.parametrize("options", [
+    {"duplicates": "ignore"},
+    {"duplicates": "merge", "tolerance": -1.0},
+    {"duplicates": "merge", "tolerance": float("nan")},
+    {"tolerance": 0.1},
+])
+def test_doublons_options_invalides(options):
+    with pytest.raises(ValueError):
+        triangulate([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], **options)
+
+def test_grille_meme_triangulation_quel_que_soit_le_calcul():
+    """Grille cocyclique : ordre d'insertion, ordre d'entrée et algorithme donnent les mêmes triangles."""
+    points = [(float(x), float(y)) for x in range(9) for y in range(7)]
+    melanges = points[:]
+    random.Random(2).shuffle(melanges)
+
+    reference = _cles_triangles(triangulate(points, order="input"))
+    assert len(reference) == 2 * 63 - 2 - 28
+    for calcul in (
+        triangulate(points, order="hilbert"),
+        triangulate(points, order="brio"),
+        triangulate(melanges, order="input"),
+        triangulate(points, algorithm="divide-and-conquer"),
+        triangulate(melanges, algorithm="divide-and-conquer"),
+        DelaunayTriangulation(melanges).triangles(),
+    ):
+        assert _cles_triangles(calcul) == reference
+
+def test_bowyer_watson_enveloppe_complete():
+    """Aucun triangle du bord n'est perdu, même avec une enveloppe presque alignée."""
+    rng = random.Random(1)
+    for _ in range(100):
+        points = list({(rng.random(), rng.random()) for _ in range(rng.randint(4, 40))})
+        assert _cles_triangles(triangulate(points)) == _cles_triangles(
+            triangulate(points, algorithm="divide-and-conquer")
+        )
+
+    # Points sur un arc très plat : l'enveloppe est faite de segments presque alignés
+    arc = [(float(x), -1e-6 * x * (100 - x)) for x in range(101)] + [(50.0, 1.0)]
+    assert len(triangulate(arc)) == 100
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("points", [
+    [],
+    [(0.0, 0.0)],
+    [(0.0, 0.0), (1.0, 1.0)],
+    [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0), (3.0, 3.0)],
+])
+def test_entree_degeneree_resultat_vide(engine, points):
+    """Avec degenerate="empty", moins de 3 points ou des points alignés donnent un résultat vide."""
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    assert len(triangulate(points, engine=engine, degenerate="empty")) == 0
+    triangulation = triangulate(points, engine=engine, degenerate="empty", result="triangulation")
+    assert len(triangulation) == 0
+    assert len(triangulation.vertices) == len(points)
+    with pytest.raises(ErreurTriangulation):
+        triangulate(points, engine=engine)
+
+def test_entree_degeneree_reste_validee():
+    """Le mode "empty" ne masque ni les valeurs non finies, ni un traitement inconnu."""
+    with pytest.raises(ErreurTriangulation):
+        triangulate([(0.0, 0.0), (float("inf"), 1.0)], degenerate="empty")
+    with pytest.raises(ValueError):
+        triangulate([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], degenerate="hull")
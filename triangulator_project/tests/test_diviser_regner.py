@@ -0,0 +1,118 @@
+"""Tests de l'algorithme « diviser pour régner » (diviser_regner.py)."""
+
+import random
+
+import pytest
+from triangulator.core import triangulate
+from triangulator.diviser_regner import delaunay_diviser_regner
+from triangulator.predicates import incircle, orient2d
+
+
+def enveloppe_convexe(points):
+    """Retourne le nombre de sommets de l'enveloppe convexe (chaîne monotone)."""
+    tries = sorted(points)
+    def demi(pts):
+        chaine = []
+        for p in pts:
+            while len(chaine) >= 2 and orient2d(*chaine[-2], *chaine[-1], *p) <= 0:
+                chaine.pop()
+            chaine.append(p)
+        return chaine
+    return len(demi(tries)) + len(demi(reversed(tries))) - 2
+
+
+def test_deux_triangles():
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.2)]
+    triangles = delaunay_diviser_regner(points)
+    assert len(triangles) == 2
+    # Même sens de parcours (horaire) que Bowyer-Watson
+    assert all(orient2d(*points[a], *points[b], *points[c]) < 0 for a, b, c in triangles)
+
+@pytest.mark.parametrize("graine", range(10))
+def test_triangulation_de_delaunay_complete(graine):
+    """Nombre de triangles attendu (2n - 2 - h) et aucun point dans un cercle circonscrit."""
+    aleatoire = random.Random(graine)
+    points = list({(aleatoire.random(), aleatoire.random()) for _ in range(150)})
+    triangles = delaunay_diviser_regner(points)
+
+    assert len(triangles) == 2 * len(points) - 2 - enveloppe_convexe(points)
+    for a, b, c in triangles:
+        for p in points:
+            # Triangles en sens horaire : intérieur du cercle si incircle < 0
+            assert incircle(*points[a], *points[b], *points[c], *p) >= 0
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_memes_triangles_que_bowyer_watson(engine):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    aleatoire = random.Random(5)
+    points = [(-1.0, -1.0), (2.0, -1.0), (2.0, 2.0), (-1.0, 2.0)]
+    points += list({(aleatoire.random(), aleatoire.random()) for _ in range(300)})
+
+    reference = triangulate(points, result="triangulation")
+    resultat = triangulate(points, engine=engine, result="triangulation", algorithm="divide-and-conquer")
+
+    def triangles(indices):
+        return {frozenset(int(i) for i in tri) for tri in indices}
+
+    reference_indices = [reference.indices[k:k + 3] for k in range(0, len(reference.indices), 3)]
+    resultat_indices = resultat.indices if engine == "numpy" else [
+        resultat.indices[k:k + 3] for k in range(0, len(resultat.indices), 3)
+    ]
+    assert triangles(resultat_indices) == triangles(reference_indices)
+
+def test_grille_reguliere():
+    """Points cocycliques : la grille reste découpée en deux triangles par cellule."""
+    points = [(float(x), float(y)) for x in range(12) for y in range(9)]
+    assert len(triangulate(points, algorithm="divide-and-conquer")) == 2 * 11 * 8
+
+def test_sous_ensembles_alignes():
+    """Des colonnes de points alignés (cas dégénérés des sous-problèmes) sont gérées."""
+    points = [(float(x), float(y) * 0.1) for x in range(3) for y in range(40)]
+    # 2n - 2 - b, avec b = 40 + 40 + 2 sommets sur le bord (colonnes extérieures
+    # entières, extrémités de la colonne du milieu)
+    assert len(delaunay_diviser_regner(points)) == 2 * 120 - 2 - 82
+
+def test_progression():
+    appels = []
+    points = [(float(i % 60), float(i // 60) + 0.01 * (i % 7)) for i in range(3000)]
+    delaunay_diviser_regner(points, lambda traites, total: appels.append((traites, total)), 1000)
+
+    assert appels[-1] == (3000, 3000)
+    assert len(appels) >= 3
+    assert all(a[0] <= b[0] for a, b in zip(appels, appels[1:], strict=False))
+
+def test_validation_commune():
+    """Les points invalides sont rejetés avant de choisir l'algorithme."""
+    from triangulator.exceptions import ErreurTriangulation
+
+    with pytest.raises(ErreurTriangulation):
+        triangulate([(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)], algorithm="divide-and-conquer")
+
+def test_algorithme_inconnu():
+    with pytest.raises(ValueError):
+        triangulate([(0, 0), (1, 0), (0, 1)], algorithm="fortune")
+
+def test_bandes_en_parallele_identiques():
+    """Les bandes triangulées dans des processus puis fusionnées donnent la même triangulation."""
+    from triangulator.diviser_regner import TAILLE_MIN_BANDE
+
+    aleatoire = random.Random(11)
+    points = list({(aleatoire.random(), aleatoire.random()) for _ in range(4 * TAILLE_MIN_BANDE + 100)})
+    # Des colonnes alignées à cheval sur les coupures entre bandes
+    points += [(0.5, 1.0 + i * 0.01) for i in range(50)]
+
+    appels = []
+    sequentiel = delaunay_diviser_regner(points)
+    parallele = delaunay_diviser_regner(points, lambda traites, total: appels.append(traites), processus=4)
+
+    assert {frozenset(t) for t in parallele} == {frozenset(t) for t in sequentiel}
+    assert len(parallele) == len(sequentiel)
+    assert all(orient2d(*points[a], *points[b], *points[c]) < 0 for a, b, c in parallele)
+    assert appels[-1] == len(points)
+
+def test_processus_exige_diviser_pour_regner():
+    with pytest.raises(ValueError):
+        triangulate([(0, 0), (1, 0), (0, 1)], processes=4)
+    with pytest.raises(ValueError):
+        triangulate([(0, 0), (1, 0), (0, 1)], algorithm="divide-and-conquer", processes=0)
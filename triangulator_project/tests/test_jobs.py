@@ -0,0 +1,127 @@
+"""Tests du gestionnaire de tâches asynchrones (jobs.py)."""
+
+import threading
+import time
+
+import pytest
+from triangulator.exceptions import ErreurSurcharge
+from triangulator.jobs import ANNULEE, ECHOUEE, EN_ATTENTE, EN_COURS, TERMINEE, GestionnaireTaches
+
+
+def attendre_fin(tache, delai=5.0):
+    """Attend qu'une tâche atteigne un état final."""
+    limite = time.monotonic() + delai
+    while tache.etat not in (TERMINEE, ECHOUEE, ANNULEE):
+        assert time.monotonic() < limite, f"tâche toujours {tache.etat}"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def gestionnaire():
+    gestionnaire = GestionnaireTaches(travailleurs=1, file_max=2)
+    yield gestionnaire
+    gestionnaire.fermer()
+
+
+def test_tache_terminee(gestionnaire):
+    def calcul(tache):
+        tache.progresser(10, 10)
+        return b'resultat', 200
+
+    tache = gestionnaire.soumettre("ps", calcul)
+    attendre_fin(tache)
+
+    assert tache.etat == TERMINEE
+    assert tache.resultat == b'resultat'
+    assert gestionnaire.obtenir(tache.identifiant) is tache
+    assert tache.description()['progress'] == {'inserted': 10, 'total': 10}
+
+def test_tache_en_echec(gestionnaire):
+    erreur = gestionnaire.soumettre("ps", lambda tache: ({'code': 'NOT_FOUND', 'message': 'absent'}, 404))
+    exception = gestionnaire.soumettre("ps", lambda tache: 1 / 0)
+    attendre_fin(erreur)
+    attendre_fin(exception)
+
+    assert erreur.etat == ECHOUEE
+    assert erreur.statut_erreur == 404
+    assert erreur.description()['error']['code'] == 'NOT_FOUND'
+    assert exception.etat == ECHOUEE
+    assert exception.statut_erreur == 500
+
+def test_annulation_en_cours_et_en_attente(gestionnaire):
+    demarree = threading.Event()
+
+    def calcul_long(tache):
+        demarree.set()
+        while True:
+            tache.progresser(0, 100)
+            time.sleep(0.01)
+
+    en_cours = gestionnaire.soumettre("long", calcul_long)
+    en_attente = gestionnaire.soumettre("suivant", lambda tache: (b'', 200))
+    assert demarree.wait(5)
+    assert en_cours.etat == EN_COURS
+    assert en_attente.etat == EN_ATTENTE
+
+    # La tâche en attente est annulée sans jamais s'exécuter
+    assert gestionnaire.annuler(en_attente.identifiant).etat == ANNULEE
+    gestionnaire.annuler(en_cours.identifiant)
+    attendre_fin(en_cours)
+    assert en_cours.etat == ANNULEE
+    assert en_attente.resultat is None
+
+def test_file_bornee(gestionnaire):
+    libere = threading.Event()
+
+    def calcul_bloque(tache):
+        libere.wait(5)
+        return b'', 200
+
+    taches = [gestionnaire.soumettre(str(i), calcul_bloque) for i in range(2)]
+    with pytest.raises(ErreurSurcharge):
+        gestionnaire.soumettre("trop", calcul_bloque)
+
+    libere.set()
+    for tache in taches:
+        attendre_fin(tache)
+    # Les tâches terminées libèrent leur place
+    attendre_fin(gestionnaire.soumettre("ensuite", calcul_bloque))
+
+def test_retention():
+    gestionnaire = GestionnaireTaches(retention=0.0)
+    tache = gestionnaire.soumettre("ps", lambda tache: (b'', 200))
+    attendre_fin(tache)
+
+    gestionnaire.soumettre("autre", lambda tache: (b'', 200))
+    assert gestionnaire.obtenir(tache.identifiant) is None
+    gestionnaire.fermer()
+
+def test_retention_verifiee_a_la_consultation():
+    """Une tâche expirée est oubliée à sa consultation, sans nouvelle soumission."""
+    gestionnaire = GestionnaireTaches(retention=0.05)
+    tache = gestionnaire.soumettre("ps", lambda tache: (b'', 200))
+    attendre_fin(tache)
+    assert gestionnaire.obtenir(tache.identifiant) is tache
+
+    time.sleep(0.1)
+    assert gestionnaire.obtenir(tache.identifiant) is None
+    gestionnaire.fermer()
+
+@pytest.mark.parametrize(
+    "limites",
+    [{'conservees_max': 2}, {'taille_resultats_max': 2500}],
+)
+def test_taches_terminees_bornees(limites):
+    """Au-delà des limites, les tâches terminées les plus anciennes sont oubliées."""
+    gestionnaire = GestionnaireTaches(**limites)
+    taches = []
+    for i in range(4):
+        taches.append(gestionnaire.soumettre(f"ps{i}", lambda tache: (bytes(1000), 200)))
+        attendre_fin(taches[-1])
+
+    assert [gestionnaire.obtenir(t.identifiant) for t in taches] == [None, None, *taches[2:]]
+    gestionnaire.fermer()
+
+def test_tache_inconnue(gestionnaire):
+    assert gestionnaire.obtenir("inconnue") is None
+    assert gestionnaire.annuler("inconnue") is None
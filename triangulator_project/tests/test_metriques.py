@@ -0,0 +1,99 @@
+"""Tests unitaires des métriques du service."""
+
+import threading
+import time
+
+from triangulator.metriques import BORNES_DUREES, Chronometre, Histogramme, Metriques
+
+
+def test_histogramme_bornes_incluses():
+    """Une valeur égale à une borne tombe dans l'intervalle de cette borne."""
+    histogramme = Histogramme((1, 10))
+    for valeur in (0, 1, 5, 10, 11):
+        histogramme.observer(valeur)
+
+    assert histogramme.comptes == [2, 2, 1]
+    assert histogramme.somme == 27
+
+
+def test_chronometre_etapes_successives():
+    """Chaque étape dure depuis la fin de la précédente ; le total les englobe."""
+    chronometre = Chronometre()
+    time.sleep(0.01)
+    chronometre.etape("fetch")
+    chronometre.etape("decode")
+
+    assert list(chronometre.durees) == ["fetch", "decode"]
+    assert chronometre.durees["fetch"] >= 0.01
+    assert chronometre.durees["decode"] < chronometre.durees["fetch"]
+    assert chronometre.total() >= sum(chronometre.durees.values())
+
+
+def test_chronometre_server_timing():
+    """L'en-tête Server-Timing liste les étapes puis le total, en millisecondes."""
+    chronometre = Chronometre()
+    chronometre.durees["decode"] = 0.0012
+
+    entete = chronometre.server_timing()
+
+    assert entete.startswith("decode;dur=1.200, total;dur=")
+
+
+def test_exposition_histogrammes_cumules():
+    """Les séries _bucket sont cumulées et se terminent par +Inf = _count."""
+    metriques = Metriques()
+    metriques.observer_duree("decode", 0.0001)
+    metriques.observer_duree("decode", 0.002)
+    metriques.observer_duree("decode", 100.0)
+
+    texte = metriques.exposition()
+
+    assert '# TYPE triangulator_stage_duration_seconds histogram' in texte
+    assert f'triangulator_stage_duration_seconds_bucket{{stage="decode",le="{BORNES_DUREES[0]}"}} 1' in texte
+    assert 'triangulator_stage_duration_seconds_bucket{stage="decode",le="0.0025"} 2' in texte
+    assert 'triangulator_stage_duration_seconds_bucket{stage="decode",le="+Inf"} 3' in texte
+    assert 'triangulator_stage_duration_seconds_count{stage="decode"} 3' in texte
+    assert 'triangulator_stage_duration_seconds_sum{stage="decode"} 100.0021' in texte
+
+
+def test_exposition_tailles_et_erreurs():
+    """Les tailles ont leur propre histogramme et les erreurs sont comptées par code."""
+    metriques = Metriques()
+    metriques.observer_taille("points", 500)
+    metriques.compter_erreur("NOT_FOUND")
+    metriques.compter_erreur("NOT_FOUND")
+    metriques.compter_erreur("INVALID_ID")
+
+    texte = metriques.exposition()
+
+    assert 'triangulator_points_bucket{le="100"} 0' in texte
+    assert 'triangulator_points_bucket{le="1000"} 1' in texte
+    assert 'triangulator_points_count 1' in texte
+    assert 'triangulator_errors_total{code="NOT_FOUND"} 2' in texte
+    assert 'triangulator_errors_total{code="INVALID_ID"} 1' in texte
+    assert texte.endswith("\n")
+
+
+def test_exposition_additionne_les_threads():
+    """Les mesures de threads différents, terminés ou non, sont additionnées."""
+    metriques = Metriques()
+    metriques.observer_duree("decode", 0.001)
+
+    def mesurer():
+        for _ in range(100):
+            metriques.observer_duree("decode", 0.001)
+        metriques.compter_erreur("TIMEOUT")
+
+    threads = [threading.Thread(target=mesurer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    texte = metriques.exposition()
+
+    assert 'triangulator_stage_duration_seconds_count{stage="decode"} 401' in texte
+    assert 'triangulator_errors_total{code="TIMEOUT"} 4' in texte
+    # Les séries des threads terminés ont été cumulées dans l'archive
+    assert len(metriques._threads) == 1
+    assert metriques.exposition() == texte
@@ -1,13 +1,20 @@
 """Tests de performance du service de triangulation."""
 
+import json
+import math
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
 from triangulator.api import create_app
+from triangulator.bench import comparer, executer, generer_pointset, mesurer, percentile
 from triangulator.serializers import encoder_pointset
 
+# Mesure de référence produite par `make bench_reference`
+REFERENCE_BENCH = os.path.join(os.path.dirname(__file__), "reference_bench.json")
+
 
 @pytest.mark.performance
 def test_performance_petit_pointset():
@@ -455,3 +462,151 @@ def test_performance_temps_encodage_decodage():
     assert response.status_code == 200
     assert temps_encodage < 0.1, f"Encodage trop lent : {temps_encodage:.3f}s"
     assert temps_total < 1.5, f"Traitement total trop lent : {temps_total:.3f}s"
+
+
+@pytest.mark.performance
+def test_performance_triangulation_20000_points():
+    """Test de la triangulation seule sur 20000 points en lignes de balayage (médiane de 3 exécutions)."""
+    durees = mesurer(generer_pointset("balayage", 20000), repetitions=3)
+
+    duree = percentile(durees["triangulation"], 0.5)
+    assert duree < 2.0, f"Triangulation trop lente pour 20000 points : {duree:.3f}s"
+
+
+@pytest.mark.performance
+def test_performance_triangulation_20000_points_aleatoires():
+    """Test de la triangulation seule sur 20000 points uniformes (médiane de 3 exécutions)."""
+    durees = mesurer(generer_pointset("uniforme", 20000, graine=42), repetitions=3)
+
+    duree = percentile(durees["triangulation"], 0.5)
+    assert duree < 2.0, f"Triangulation trop lente pour 20000 points aléatoires : {duree:.3f}s"
+
+
+@pytest.mark.performance
+def test_performance_pentes_reference():
+    """La complexité de la triangulation ne se dégrade pas par rapport à la référence enregistrée.
+
+    Seules les pentes log-log sont comparées : les temps absolus de la
+    référence dépendent de la machine qui l'a produite.
+    """
+    with open(REFERENCE_BENCH, encoding="utf-8") as fichier:
+        reference = json.load(fichier)
+    reference = {
+        "pentes": {d: {"triangulation": p["triangulation"]} for d, p in reference["pentes"].items()},
+    }
+
+    rapport = executer(tailles=(1_000, 10_000), repetitions=3)
+
+    regressions = comparer(rapport, reference, tolerance_temps=math.inf, tolerance_pente=0.3)
+    assert not regressions, "\n".join(regressions)
+
+
+@pytest.mark.performance
+def test_performance_charge_pool_processus():
+    """Test de charge avec 10 requêtes simultanées calculées dans un pool de processus."""
+    from triangulator.workers import PoolTriangulation
+
+    points = [(float(x), float(x % 100)) for x in range(500)]
+    flux = encoder_pointset(points)
+
+    with PoolTriangulation(file_max=10, timeout=30.0) as pool:
+        app = create_app(point_set_manager=MagicMock(), pool=pool)
+        app.config['TESTING'] = True
+        client = app.test_client()
+        client.application.point_set_manager.get_pointset.return_value = flux
+
+        def requete(_):
+            return client.get('/triangulation/charge_pool').status_code
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(requete, range(10)))
+
+    assert all(r == 200 for r in results)
+
+
+@pytest.mark.performance
+def test_performance_diviser_pour_regner_20000_points():
+    """Test de l'algorithme diviser pour régner sur 20000 points en lignes de balayage (médiane de 3 exécutions)."""
+    durees = mesurer(generer_pointset("balayage", 20000), repetitions=3, algorithm="divide-and-conquer")
+
+    duree = percentile(durees["triangulation"], 0.5)
+    assert duree < 4.0, f"Diviser pour régner trop lent pour 20000 points : {duree:.3f}s"
+
+
+@pytest.mark.performance
+def test_performance_validation_fraction_triangulation():
+    """La validation des points reste une petite fraction du temps de triangulation."""
+    import random
+
+    from triangulator.core import _statistiques_points, triangulate
+
+    random.seed(7)
+    points = [(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(20000)]
+
+    start = time.time()
+    _statistiques_points(points)
+    len(set(points))
+    temps_validation = time.time() - start
+
+    start = time.time()
+    triangulate(points)
+    temps_total = time.time() - start
+
+    assert temps_validation < 0.05 * temps_total, (
+        f"Validation trop coûteuse : {temps_validation:.3f}s sur {temps_total:.3f}s"
+    )
+
+
+@pytest.mark.performance
+def test_performance_cout_enregistrement_metriques():
+    """Chronométrer une étape et l'enregistrer dans les métriques coûte moins d'une microseconde."""
+    from triangulator.metriques import Chronometre, Metriques
+
+    metriques = Metriques()
+    chronometre = Chronometre()
+    repetitions = 20_000
+
+    # Meilleure de 20 séries courtes : écarte les interruptions de la machine
+    meilleur = math.inf
+    for _ in range(20):
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            pass
+        boucle = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            chronometre.etape("decode")
+            metriques.observer_duree("decode", 0.001)
+        meilleur = min(meilleur, (time.perf_counter() - start - boucle) / repetitions)
+
+    assert meilleur < 1e-6, f"Enregistrement trop coûteux : {meilleur * 1e9:.0f} ns par étape"
+
+
+@pytest.mark.performance
+def test_performance_lot_petits_pointsets():
+    """Un lot de 500 petits PointSet est plus rapide qu'une requête par PointSet."""
+    import random
+
+    from triangulator.serializers import decoder_lot
+
+    random.seed(3)
+    pointsets = {
+        f'ps{i}': encoder_pointset([(random.uniform(0, 100), random.uniform(0, 100)) for _ in range(50)])
+        for i in range(500)
+    }
+    app = create_app(point_set_manager=MagicMock())
+    app.point_set_manager.get_pointset.side_effect = pointsets.get
+    client = app.test_client()
+
+    start = time.perf_counter()
+    for pointset_id in pointsets:
+        assert client.get(f'/triangulation/{pointset_id}').status_code == 200
+    temps_unitaire = time.perf_counter() - start
+
+    start = time.perf_counter()
+    response = client.post('/triangulations', json={'pointSetIds': list(pointsets)})
+    temps_lot = time.perf_counter() - start
+
+    assert all(statut == 200 for statut, _ in decoder_lot(response.data))
+    assert temps_lot < temps_unitaire, f"Lot : {temps_lot:.3f}s, requêtes unitaires : {temps_unitaire:.3f}s"
@@ -0,0 +1,173 @@
+"""Tests du client HTTP du PointSetManager (point_set_client.py)."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from triangulator.api import create_app
+from triangulator.exceptions import ErreurDecodage, ErreurPointSetManager, ErreurTailleExcessive
+from triangulator.point_set_client import PointSetClient
+from triangulator.serializers import decoder_pointset, encoder_pointset
+
+POINTSETS = {
+    "carre": encoder_pointset([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]),
+    "triangle": encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]),
+}
+
+
+class PointSetManagerFactice(BaseHTTPRequestHandler):
+    """Remplaçant local du PointSetManager (GET /pointset/{id})."""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_GET(self):  # noqa: N802 - nom imposé par BaseHTTPRequestHandler
+        """Répond selon l'ID demandé (200, 400, 404 ou 503)."""
+        serveur = self.server
+        serveur.requetes += 1
+        pointset_id = self.path.rsplit('/', 1)[-1]
+
+        if pointset_id == "indisponible" or (pointset_id == "instable" and serveur.requetes < 3):
+            self._repondre(503, json.dumps({'code': 'SERVICE_UNAVAILABLE', 'message': 'base indisponible'}))
+        elif pointset_id == "instable":
+            self._repondre(200, POINTSETS["triangle"])
+        elif pointset_id == "tronque":
+            # Content-Length cohérent, mais l'en-tête annonce plus de points
+            self._repondre(200, POINTSETS["carre"][:-8])
+        elif pointset_id == "mauvais-format":
+            self._repondre(400, json.dumps({'code': 'BAD_REQUEST', 'message': 'ID invalide'}))
+        elif pointset_id in POINTSETS:
+            self._repondre(200, POINTSETS[pointset_id])
+        else:
+            self._repondre(404, json.dumps({'code': 'NOT_FOUND', 'message': 'inconnu'}))
+
+    def _repondre(self, statut, corps):
+        if isinstance(corps, str):
+            corps = corps.encode()
+        self.send_response(statut)
+        self.send_header('Content-Length', str(len(corps)))
+        self.end_headers()
+        self.wfile.write(corps)
+
+    def log_message(self, *args):
+        """Désactive le journal des requêtes."""
+        pass
+
+
+class ServeurFactice(ThreadingHTTPServer):
+    """Serveur local comptant les requêtes et les connexions acceptées."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        """Ouvre le serveur sur un port libre."""
+        super().__init__(('127.0.0.1', 0), PointSetManagerFactice)
+        self.requetes = 0
+        self.connexions = 0
+
+    def get_request(self):
+        """Compte chaque nouvelle connexion."""
+        self.connexions += 1
+        return super().get_request()
+
+
+@pytest.fixture
+def serveur():
+    serveur = ServeurFactice()
+    thread = threading.Thread(target=serveur.serve_forever, daemon=True)
+    thread.start()
+    yield serveur
+    serveur.shutdown()
+    serveur.server_close()
+
+
+@pytest.fixture
+def client_psm(serveur):
+    client = PointSetClient(f"http://127.0.0.1:{serveur.server_address[1]}", delai_initial=0.001)
+    yield client
+    client.fermer()
+
+
+def test_get_pointset(client_psm):
+    assert client_psm.get_pointset("carre") == POINTSETS["carre"]
+
+def test_get_pointset_inconnu(client_psm):
+    assert client_psm.get_pointset("absent") is None
+
+def test_connexion_reutilisee(client_psm, serveur):
+    for _ in range(5):
+        assert client_psm.get_pointset("triangle") == POINTSETS["triangle"]
+    assert serveur.requetes == 5
+    assert serveur.connexions == 1
+
+def test_nouvelles_tentatives_sur_503(client_psm, serveur):
+    assert client_psm.get_pointset("instable") == POINTSETS["triangle"]
+    assert serveur.requetes == 3
+
+def test_503_persistant(client_psm, serveur):
+    with pytest.raises(ErreurPointSetManager) as erreur:
+        client_psm.get_pointset("indisponible")
+    assert erreur.value.statut == 503
+    assert serveur.requetes == client_psm.tentatives
+
+def test_400_sans_nouvelle_tentative(client_psm, serveur):
+    with pytest.raises(ErreurPointSetManager) as erreur:
+        client_psm.get_pointset("mauvais-format")
+    assert erreur.value.statut == 400
+    assert serveur.requetes == 1
+
+def test_serveur_injoignable():
+    serveur = ServeurFactice()
+    port = serveur.server_address[1]
+    serveur.server_close()
+
+    client = PointSetClient(f"http://127.0.0.1:{port}", tentatives=2, delai_initial=0.001)
+    with pytest.raises(ErreurPointSetManager) as erreur:
+        client.get_pointset("carre")
+    assert erreur.value.statut is None
+
+def test_get_pointset_points(client_psm, serveur):
+    """Le décodage au fil de l'eau retourne les points et garde la connexion."""
+    assert client_psm.get_pointset_points("carre", taille_morceau=5) == decoder_pointset(POINTSETS["carre"])
+    assert client_psm.get_pointset_points("absent") is None
+    assert serveur.connexions == 1
+
+def test_get_pointset_points_tronque(client_psm):
+    with pytest.raises(ErreurDecodage):
+        client_psm.get_pointset_points("tronque")
+    # La connexion abandonnée en cours de lecture n'est pas remise dans le pool
+    assert client_psm.get_pointset("triangle") == POINTSETS["triangle"]
+
+def test_get_pointset_points_limite(serveur):
+    """Un PointSet annonçant plus de points_max points est rejeté dès l'en-tête."""
+    client = PointSetClient(f"http://127.0.0.1:{serveur.server_address[1]}", points_max=3)
+    try:
+        assert len(client.get_pointset_points("triangle")) == 3
+        with pytest.raises(ErreurTailleExcessive):
+            client.get_pointset_points("carre")
+    finally:
+        client.fermer()
+
+def test_get_pointsets_groupe(client_psm):
+    resultats = client_psm.get_pointsets(["carre", "triangle", "absent", "carre"])
+    assert resultats == {"carre": POINTSETS["carre"], "triangle": POINTSETS["triangle"], "absent": None}
+
+def test_url_invalide():
+    with pytest.raises(ValueError):
+        PointSetClient("ftp://exemple")
+
+@pytest.mark.parametrize("pointset_id, statut, code", [
+    ("carre", 200, None),
+    ("absent", 404, b'NOT_FOUND'),
+    ("indisponible", 503, b'SERVICE_UNAVAILABLE'),
+    ("mauvais-format", 400, b'INVALID_ID'),
+])
+def test_api_avec_client_http(client_psm, pointset_id, statut, code):
+    app = create_app(point_set_manager=client_psm)
+    app.config['TESTING'] = True
+
+    with app.test_client() as test_client:
+        response = test_client.get(f'/triangulation/{pointset_id}')
+    assert response.status_code == statut
+    if code is not None:
+        assert code in response.data
@@ -0,0 +1,99 @@
+"""Tests des prédicats géométriques robustes (predicates.py)."""
+
+import pytest
+from triangulator.predicates import incircle, incircle_perturbe, orient2d
+
+
+def test_orientation_signe():
+    assert orient2d(0, 0, 1, 0, 0, 1) > 0  # sens trigonométrique
+    assert orient2d(0, 0, 0, 1, 1, 0) < 0  # sens horaire
+    assert orient2d(0, 0, 1, 1, 2, 2) == 0  # alignés
+
+def test_orientation_presque_alignes():
+    """Cas où le déterminant flottant naïf se trompe de signe ou s'annule à tort."""
+    # c est exactement sur la droite (a, b) : les coordonnées sont des dyadiques
+    assert orient2d(0.5, 0.5, 12.0, 12.0, 24.0, 24.0) == 0
+    # Décalage d'un ulp : le point n'est plus aligné
+    c = 24.0 + 2 ** -48
+    assert orient2d(0.5, 0.5, 12.0, 12.0, c, 24.0) < 0
+    assert orient2d(0.5, 0.5, 12.0, 12.0, 24.0, c) > 0
+
+def test_orientation_grandes_coordonnees():
+    base = 1e15
+    assert orient2d(base, base, base + 1, base, base, base + 1) > 0
+    assert orient2d(base, base, base + 1, base + 1, base + 2, base + 2) == 0
+
+def test_orientation_sous_normaux():
+    """Les produits sous-normaux arrondis à zéro ne doivent pas faire conclure à l'alignement."""
+    minimum = 5e-324
+    assert orient2d(minimum, 0, 0, minimum, 0, 0) > 0
+    assert orient2d(0, minimum, minimum, 0, 0, 0) < 0
+    assert orient2d(3 * minimum, minimum, minimum, 2 * minimum, 0, 0) > 0
+    assert orient2d(0, 0, minimum, minimum, 2 * minimum, 2 * minimum) == 0
+
+def test_cercle_signe():
+    # Cercle unité passant par (1, 0), (0, 1), (-1, 0) (sens trigonométrique)
+    assert incircle(1, 0, 0, 1, -1, 0, 0, 0) > 0
+    assert incircle(1, 0, 0, 1, -1, 0, 2, 2) < 0
+    # Le sens horaire inverse le signe
+    assert incircle(-1, 0, 0, 1, 1, 0, 0, 0) < 0
+
+@pytest.mark.parametrize("decalage", [0.0, 1e6, 1e12])
+def test_cercle_cocyclique_exact(decalage):
+    """Les quatre coins d'un carré sont exactement cocycliques, même loin de l'origine."""
+    d = decalage
+    assert incircle(d, d, d + 1, d, d + 1, d + 1, d, d + 1) == 0
+
+def test_cercle_presque_cocyclique():
+    d = 1e12
+    assert incircle(d, d, d + 1, d, d + 1, d + 1, d + 2 ** -10, d + 1) > 0
+    assert incircle(d, d, d + 1, d, d + 1, d + 1, d - 2 ** -10, d + 1) < 0
+
+@pytest.mark.parametrize("decalage", [0.0, 1e6, 1e12])
+def test_cercle_perturbe_departage_cocycliques(decalage):
+    """Pour un carré, la perturbation choisit une seule des deux diagonales, quelle que soit la translation."""
+    d = decalage
+    a, b, c, e = (d, d), (d + 1, d), (d + 1, d + 1), (d, d + 1)
+
+    # e dans le cercle de (a, b, c) <=> diagonale (b, e) <=> a hors du cercle de (b, c, e)
+    assert incircle_perturbe(*a, *b, *c, *e) != 0
+    assert (incircle_perturbe(*a, *b, *c, *e) > 0) != (incircle_perturbe(*b, *c, *e, *a) > 0)
+    # Le résultat ne dépend pas du sommet par lequel le triangle commence
+    assert (incircle_perturbe(*a, *b, *c, *e) > 0) == (incircle_perturbe(*b, *c, *a, *e) > 0)
+    assert (incircle_perturbe(*a, *b, *c, *e) > 0) == (incircle_perturbe(0, 0, 1, 0, 1, 1, 0, 1) > 0)
+
+def test_cercle_perturbe_cas_non_degeneres():
+    """Hors cocyclicité, le signe est celui de incircle ; points confondus ou alignés restent à 0."""
+    assert incircle_perturbe(1, 0, 0, 1, -1, 0, 0, 0) > 0
+    assert incircle_perturbe(1, 0, 0, 1, -1, 0, 2, 2) < 0
+    assert incircle_perturbe(0, 0, 1, 0, 0, 1, 0, 0) == 0
+    assert incircle_perturbe(0, 0, 1, 1, 2, 2, 3, 3) == 0
+
+@pytest.mark.parametrize("exposant", range(262, 273))
+def test_cercle_invariant_par_mise_a_l_echelle(exposant):
+    """Multiplier les coordonnées par une puissance de deux ne change ni les signes ni la triangulation.
+
+    Vers 1e-80, les produits du filtre deviennent sous-normaux et sa borne
+    d'erreur relative ne vaut plus.
+    """
+    import random
+
+    from triangulator.core import triangulate
+
+    def signe(valeur):
+        return (valeur > 0) - (valeur < 0)
+
+    def triangles(triangulation):
+        indices = triangulation.indices
+        return {frozenset(indices[k:k + 3]) for k in range(0, len(indices), 3)}
+
+    echelle = 2.0 ** -exposant
+    rng = random.Random(exposant)
+    for _ in range(500):
+        coords = [rng.uniform(-1, 1) for _ in range(8)]
+        assert signe(incircle(*(c * echelle for c in coords))) == signe(incircle(*coords))
+
+        points = list(zip(coords[0::2], coords[1::2], strict=True))
+        reduits = [(x * echelle, y * echelle) for x, y in points]
+        attendu = triangles(triangulate(points, result="triangulation"))
+        assert triangles(triangulate(reduits, result="triangulation")) == attendu
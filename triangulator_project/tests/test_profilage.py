@@ -0,0 +1,87 @@
+"""Tests unitaires du profilage à la demande."""
+
+import marshal
+import pstats
+
+import pytest
+from triangulator.core import triangulate
+from triangulator.profilage import Profileur
+
+
+def _calcul():
+    """Triangule assez de points pour être visible dans un profil."""
+    points = [(float(x), float(x * x % 97)) for x in range(2000)]
+    return triangulate(points)
+
+
+def test_cprofile_format_pstats(tmp_path):
+    """Le mode cprofile produit un fichier pstats lisible."""
+    profileur = Profileur(intervalle=0.0)
+
+    jeton = profileur.demarrer("cprofile")
+    _calcul()
+    profil = profileur.terminer(jeton)
+
+    fichier = tmp_path / profil.nom_fichier
+    fichier.write_bytes(profil.contenu)
+    statistiques = pstats.Stats(str(fichier))
+    fonctions = {nom for _, _, nom in statistiques.stats}
+    assert "_delaunay_triangulation" in fonctions
+    assert isinstance(marshal.loads(profil.contenu), dict)
+    assert profil.nom_fichier.endswith(".pstats")
+
+
+def test_sampling_format_collapsed():
+    """Le mode sampling produit des piles « appelant;...;appelé nombre »."""
+    profileur = Profileur(intervalle=0.0, periode=0.0005)
+
+    jeton = profileur.demarrer("sampling")
+    _calcul()
+    profil = profileur.terminer(jeton)
+
+    lignes = profil.contenu.decode("utf-8").splitlines()
+    assert lignes
+    for ligne in lignes:
+        pile, nombre = ligne.rsplit(" ", 1)
+        assert int(nombre) > 0
+    assert any("triangulator.core:_delaunay_triangulation" in ligne for ligne in lignes)
+    assert profil.type_mime.startswith("text/plain")
+
+
+def test_debit_limite():
+    """Un seul profil à la fois, et pas plus d'un par intervalle."""
+    profileur = Profileur(intervalle=3600.0)
+
+    jeton = profileur.demarrer("cprofile")
+    assert jeton is not None
+    assert profileur.demarrer("cprofile") is None
+    profileur.terminer(jeton)
+    assert profileur.demarrer("cprofile") is None
+
+
+def test_profil_en_cours_bloque_meme_sans_intervalle():
+    """Sans intervalle, un profil en cours empêche quand même d'en démarrer un autre."""
+    profileur = Profileur(intervalle=0.0)
+
+    jeton = profileur.demarrer("sampling")
+    assert profileur.demarrer("cprofile") is None
+    profileur.terminer(jeton)
+    profileur.terminer(profileur.demarrer("cprofile"))
+
+
+def test_conservation_bornee():
+    """Seuls les profils les plus récents sont conservés."""
+    profileur = Profileur(intervalle=0.0, conservation=2)
+
+    profils = [profileur.terminer(profileur.demarrer("cprofile")) for _ in range(3)]
+
+    assert profileur.obtenir(profils[0].identifiant) is None
+    assert profileur.obtenir(profils[2].identifiant) is profils[2]
+
+
+def test_mode_inconnu():
+    """Un mode inconnu est refusé."""
+    with pytest.raises(ValueError):
+        Profileur(automatique="perf")
+    with pytest.raises(ValueError):
+        Profileur().demarrer("perf")
@@ -3,7 +3,7 @@
 import struct
 
 import pytest
-from triangulator.exceptions import ErreurDecodage
+from triangulator.exceptions import ErreurDecodage, ErreurTailleExcessive
 from triangulator.serializers import decoder_pointset, encoder_pointset
 
 
@@ -321,3 +321,225 @@ def test_points_avec_precision_decimale():
     for i, pt in enumerate(points):
         assert abs(points_decodes[i][0] - pt[0]) < 1e-5
         assert abs(points_decodes[i][1] - pt[1]) < 1e-5
+
+def test_decodage_vue_sans_copie():
+    """La vue NumPy doit porter directement sur le flux, en lecture seule."""
+    np = pytest.importorskip("numpy")
+    from triangulator.serializers import decoder_pointset_vue
+
+    points = [(1.5, 2.5), (3.5, 4.5), (-5.5, 6.5)]
+    flux = encoder_pointset(points)
+    vue = decoder_pointset_vue(flux)
+
+    assert vue.shape == (3, 2)
+    assert np.shares_memory(vue, np.frombuffer(flux, dtype=np.uint8))
+    assert not vue.flags.writeable
+    assert [tuple(pt) for pt in vue.tolist()] == points
+
+def test_decodage_vue_sans_numpy(monkeypatch):
+    """Sans NumPy, la vue est un memoryview (N, 2) de floats natifs."""
+    import triangulator.serializers as serializers
+
+    monkeypatch.setattr(serializers, "np", None)
+    points = [(1.5, 2.5), (3.5, 4.5), (-5.5, 6.5)]
+    vue = serializers.decoder_pointset_vue(encoder_pointset(points) + b"\x00")
+
+    assert isinstance(vue, memoryview)
+    assert vue.shape == (3, 2)
+    assert vue.readonly
+    assert [tuple(pt) for pt in vue.tolist()] == points
+
+@pytest.mark.parametrize(
+    "flux_invalide",
+    [
+        b"",
+        b"\x00\x00\x00\x02",
+        b"\x00\x00\x00\x01\x3f\x80",
+    ]
+)
+def test_decodage_vue_flux_invalide(flux_invalide):
+    from triangulator.serializers import decoder_pointset_vue
+
+    with pytest.raises(ErreurDecodage):
+        decoder_pointset_vue(flux_invalide)
+
+def test_encoder_triangles_indices_identique():
+    """L'encodeur par indices doit produire exactement le même flux Triangles."""
+    from triangulator.serializers import encoder_triangles, encoder_triangles_indices
+
+    vertices = [(0.0, 0.0), (1.0, 0.0), (0.5, 1.0), (1.5, 1.0)]
+    indices = [(0, 1, 2), (1, 3, 2)]
+    triangles = [[vertices[i] for i in tri] for tri in indices]
+
+    flux = encoder_triangles_indices(vertices, indices)
+    assert flux == encoder_triangles(triangles)
+    assert flux == (
+        struct.pack('>I8f', 4, 0.0, 0.0, 1.0, 0.0, 0.5, 1.0, 1.5, 1.0)
+        + struct.pack('>I6I', 2, 0, 1, 2, 1, 3, 2)
+    )
+
+def test_encoder_triangles_indices_numpy():
+    np = pytest.importorskip("numpy")
+    from triangulator.serializers import encoder_triangles_indices
+
+    vertices = [(0.0, 0.0), (1.0, 0.0), (0.5, 1.0), (1.5, 1.0)]
+    indices = [(0, 1, 2), (1, 3, 2)]
+
+    flux_numpy = encoder_triangles_indices(np.array(vertices), np.array(indices, dtype=np.int32))
+    assert flux_numpy == encoder_triangles_indices(vertices, indices)
+
+def test_encoder_triangles_indices_vide():
+    from triangulator.serializers import encoder_triangles_indices
+
+    assert encoder_triangles_indices([], []) == struct.pack('>II', 0, 0)
+
+def test_encoder_triangulation():
+    """Le résultat indexé s'encode sans repasser par les coordonnées des triangles."""
+    from triangulator.core import triangulate
+    from triangulator.serializers import encoder_triangulation
+
+    points = [(0.0, 0.0), (2.0, 0.0), (1.0, 2.0), (0.0, 2.0)]
+    triangulation = triangulate(points, result="triangulation")
+    flux = encoder_triangulation(triangulation)
+
+    assert struct.unpack('>I', flux[:4])[0] == 4
+    assert decoder_pointset(flux) == points
+    offset = 4 + 4 * 8
+    nombre_triangles = struct.unpack('>I', flux[offset:offset + 4])[0]
+    assert nombre_triangles == len(triangulation)
+    indices = struct.unpack(f'>{3 * nombre_triangles}I', flux[offset + 4:])
+    assert list(indices) == list(triangulation.indices)
+
+@pytest.mark.parametrize("taille_morceau", [1, 2, 3, 8192])
+def test_encoder_triangles_morceaux_identique(taille_morceau):
+    """La concaténation des morceaux est exactement le flux complet."""
+    from array import array
+
+    from triangulator.serializers import encoder_triangles_indices, encoder_triangles_morceaux, taille_triangles
+
+    vertices = [(0.0, 0.0), (1.0, 0.0), (0.5, 1.0), (1.5, 1.0), (2.0, 0.0)]
+    indices = [(0, 1, 2), (1, 3, 2), (1, 4, 3)]
+    flux = encoder_triangles_indices(vertices, indices)
+
+    for indices_forme in (indices, array('I', [i for tri in indices for i in tri])):
+        morceaux = list(encoder_triangles_morceaux(vertices, indices_forme, taille_morceau))
+        assert b''.join(morceaux) == flux
+        assert len(flux) == taille_triangles(len(vertices), len(indices))
+        # En-têtes émis seuls, avant les données de leur partie
+        assert morceaux[0] == struct.pack('>I', len(vertices))
+
+def test_encoder_triangulation_morceaux_numpy():
+    np = pytest.importorskip("numpy")
+    from triangulator.core import triangulate
+    from triangulator.serializers import encoder_triangulation, encoder_triangulation_morceaux
+
+    points = [(float(i % 7), float(i // 7) + 0.1 * (i % 3)) for i in range(49)]
+    triangulation = triangulate(np.array(points), engine="numpy", result="triangulation")
+
+    flux = b''.join(encoder_triangulation_morceaux(triangulation, taille_morceau=10))
+    assert flux == encoder_triangulation(triangulation)
+
+def test_encoder_triangles_morceaux_vide():
+    from triangulator.serializers import encoder_triangles_morceaux
+
+    assert list(encoder_triangles_morceaux([], [])) == [struct.pack('>I', 0), struct.pack('>I', 0)]
+
+@pytest.mark.parametrize("taille_morceau", [1, 3, 5, 8, 1000])
+def test_decodeur_incremental_identique(taille_morceau):
+    """Quel que soit le découpage, le décodeur incrémental équivaut à decoder_pointset."""
+    from triangulator.serializers import DecodeurPointSet
+
+    points = [(float(i) * 0.5, -float(i) / 3) for i in range(50)]
+    flux = encoder_pointset(points) + b'\x00\x01'  # octets en trop ignorés
+
+    decodeur = DecodeurPointSet(taille_totale=len(flux))
+    for debut in range(0, len(flux), taille_morceau):
+        decodeur.ajouter(flux[debut:debut + taille_morceau])
+
+    assert decodeur.nombre_points == 50
+    assert decodeur.terminer() == decoder_pointset(flux)
+
+@pytest.mark.parametrize(
+    "flux_invalide",
+    [
+        b"",                        # flux vide
+        b"\x00\x00",                # en-tête incomplet
+        b"\x00\x00\x00\x02",        # indique 2 points mais aucune coordonnée
+        b"\x00\x00\x00\x01\x3f\x80", # flux trop court pour 1 point
+    ]
+)
+def test_decodeur_incremental_flux_tronque(flux_invalide):
+    from triangulator.serializers import DecodeurPointSet
+
+    decodeur = DecodeurPointSet()
+    decodeur.ajouter(flux_invalide)
+    with pytest.raises(ErreurDecodage):
+        decodeur.terminer()
+
+def test_decodeur_incremental_rejet_des_l_entete():
+    """L'en-tête est rejeté avant de recevoir les coordonnées."""
+    from triangulator.serializers import DecodeurPointSet
+
+    # 1000 points annoncés mais 100 octets au total
+    with pytest.raises(ErreurDecodage):
+        DecodeurPointSet(taille_totale=100).ajouter(struct.pack('>I', 1000))
+
+    # Le dépassement de la limite est distingué d'un flux invalide
+    with pytest.raises(ErreurTailleExcessive):
+        DecodeurPointSet(nombre_points_max=10).ajouter(struct.pack('>I', 11))
+
+def test_decodeur_incremental_sans_conversion():
+    """Sans conversion, la complétude est vérifiée sans construire les points."""
+    from triangulator.serializers import DecodeurPointSet
+
+    flux = encoder_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    decodeur = DecodeurPointSet(convertir=False)
+    for debut in range(0, len(flux), 5):
+        decodeur.ajouter(flux[debut:debut + 5])
+    decodeur.verifier()
+    assert decodeur.nombre_points == 3
+    assert len(decodeur._coordonnees) == 0
+    with pytest.raises(ValueError):
+        decodeur.terminer()
+
+    tronque = DecodeurPointSet(convertir=False)
+    tronque.ajouter(flux[:-1])
+    with pytest.raises(ErreurDecodage):
+        tronque.verifier()
+
+def test_decodeur_incremental_sans_allocation_anticipee():
+    """Un en-tête démesuré, sans taille ni limite connues, n'alloue rien d'avance."""
+    import tracemalloc
+
+    from triangulator.serializers import DecodeurPointSet
+
+    decodeur = DecodeurPointSet()
+    tracemalloc.start()
+    try:
+        decodeur.ajouter(struct.pack('>I', 0xFFFFFFFF) + struct.pack('>2f', 1.0, 2.0))
+        _, pic = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert pic < 1024 * 1024
+    with pytest.raises(ErreurDecodage):
+        decodeur.terminer()
+
+def test_lot_aller_retour():
+    """Les éléments d'un lot sont relus dans l'ordre, avec leur statut."""
+    from triangulator.serializers import decoder_lot, encoder_lot
+
+    elements = [(200, b"\x00\x01\x02"), (404, b'{"code": "NOT_FOUND"}'), (200, b"")]
+    flux = encoder_lot(elements)
+
+    assert len(flux) == 4 + 3 * 8 + 3 + 21
+    assert decoder_lot(flux) == elements
+    assert decoder_lot(encoder_lot([])) == []
+
+@pytest.mark.parametrize("coupure", [2, 10, 14])
+def test_lot_tronque(coupure):
+    from triangulator.serializers import decoder_lot, encoder_lot
+
+    flux = encoder_lot([(200, b"abcdef")])
+    with pytest.raises(ErreurDecodage):
+        decoder_lot(flux[:coupure])
@@ -1,4 +1,19 @@
 """Triangulator package."""
 
 
-__all__ = ["api", "core", "serializers", "exceptions"]
+__all__ = [
+    "api",
+    "bench",
+    "cache",
+    "coalescence",
+    "core",
+    "diviser_regner",
+    "jobs",
+    "metriques",
+    "point_set_client",
+    "profilage",
+    "predicates",
+    "serializers",
+    "workers",
+    "exceptions",
+]
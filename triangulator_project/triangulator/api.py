@@ -1,17 +1,66 @@
 """Module API Flask pour le service de triangulation."""
 
-from flask import Flask, Response, jsonify
+import json
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from time import perf_counter
 
+from flask import Flask, Response, jsonify, request
+
+from triangulator.cache import cle_resultat
+from triangulator.coalescence import Coalesceur
 from triangulator.core import triangulate
-from triangulator.exceptions import ErreurDecodage, ErreurTriangulation
-from triangulator.serializers import decoder_pointset, encoder_triangles
+from triangulator.exceptions import (
+    ErreurDecodage,
+    ErreurEncodage,
+    ErreurPointSetManager,
+    ErreurSurcharge,
+    ErreurTailleExcessive,
+    ErreurTriangulation,
+)
+from triangulator.jobs import ANNULEE, ECHOUEE, TERMINEE, GestionnaireTaches
+from triangulator.metriques import Chronometre, Metriques
+from triangulator.profilage import MODES as MODES_PROFILAGE
+from triangulator.serializers import (
+    DecodeurPointSet,
+    encoder_lot,
+    encoder_triangulation,
+    encoder_triangulation_morceaux,
+    taille_triangles,
+    tailles_triangles,
+)
+from triangulator.workers import calculer_triangles, calculer_triangulation
+
+# Nombre maximal de points d'un PointSet envoyé directement (POST /triangulation)
+POINTS_MAX_TELEVERSEMENT = 1_000_000
+
+# Taille des lectures du corps d'un PointSet envoyé directement (64 Kio)
+TAILLE_MORCEAU_TELEVERSEMENT = 65536
+
+# Nombre maximal de PointSetID par requête de lot
+TAILLE_MAX_LOT = 10_000
 
+# Nombre de PointSet d'un lot récupérés et calculés simultanément (borné par
+# la capacité du pool de processus s'il y en a un)
+TRAVAILLEURS_LOT = 8
 
-def create_app(point_set_manager=None):
+
+def create_app(point_set_manager=None, cache=None, pool=None, taches=None, metriques=None, profileur=None):
     """Crée et configure l'application Flask.
 
     :param point_set_manager: Instance du client PointSetManager
         (optionnel pour les tests)
+    :param cache: Cache des résultats encodés (par exemple
+        triangulator.cache.CacheResultats), None pour tout recalculer
+    :param pool: Pool de processus de calcul (triangulator.workers.PoolTriangulation),
+        None pour calculer dans le thread de la requête
+    :param taches: Gestionnaire des tâches asynchrones (triangulator.jobs.GestionnaireTaches),
+        un gestionnaire par défaut est créé si None
+    :param metriques: Métriques du service (triangulator.metriques.Metriques),
+        exposées sur /metrics ; des métriques vides sont créées si None
+    :param profileur: Profileur des requêtes (triangulator.profilage.Profileur),
+        None pour désactiver le profilage
     :return: Application Flask configurée
     """
     app = Flask(__name__)
@@ -20,6 +69,27 @@ def create_app(point_set_manager=None):
     if point_set_manager is not None:
         app.point_set_manager = point_set_manager
 
+    # Cache des flux Triangles, indexé par PointSetID + empreinte du PointSet
+    app.cache_resultats = cache
+
+    # Pool de processus pour sortir le calcul (lié au GIL) du thread de la requête
+    app.pool_triangulation = pool
+
+    # Requêtes simultanées sur un même PointSetID : une seule récupération
+    # et un seul calcul, partagés par toutes
+    app.coalesceur = Coalesceur()
+
+    # Tâches asynchrones (/jobs) pour les PointSet trop longs à trianguler
+    # dans le délai d'une requête
+    app.taches = taches if taches is not None else GestionnaireTaches()
+
+    # Durées par étape, tailles traitées et erreurs, exposées sur /metrics
+    app.metriques = metriques if metriques is not None else Metriques()
+
+    # Profilage à la demande (en-tête X-Profile), téléchargeable sur /profiles/<id> ;
+    # désactivé, il ne coûte qu'un test par requête
+    app.profileur = profileur
+
     @app.route('/triangulation/<pointset_id>', methods=['GET'])
     def get_triangulation(pointset_id):
         """Endpoint pour calculer la triangulation d'un PointSet.
@@ -29,65 +99,335 @@ def create_app(point_set_manager=None):
         """
         # Validation : vérifier que l'ID n'est pas vide
         if not pointset_id or pointset_id.strip() == '':
+            app.metriques.compter_erreur('INVALID_ID')
             return jsonify({
                 'code': 'INVALID_ID',
                 'message': 'PointSetID invalide ou vide'
             }), 400
 
+        jeton = None
+        if app.profileur is not None:
+            mode = request.headers.get('X-Profile') or app.profileur.automatique
+            if mode is not None and mode not in MODES_PROFILAGE:
+                return jsonify({
+                    'code': 'BAD_REQUEST',
+                    'message': f'Mode de profilage inconnu (X-Profile) : {mode}'
+                }), 400
+            if mode is not None:
+                jeton = app.profileur.demarrer(mode)
+
+        # Les étapes ne sont chronométrées que par la requête qui fait le
+        # calcul ; celles qui le partagent n'ont que leur durée totale
+        chronometre = Chronometre()
+        try:
+            corps, statut = app.coalesceur.executer(
+                pointset_id, lambda: trianguler_pointset(pointset_id, chronometre=chronometre)
+            )
+        finally:
+            profil = app.profileur.terminer(jeton) if jeton is not None else None
+
+        reponse = reponse_triangulation(corps, statut, chronometre)
+        if profil is not None:
+            reponse.headers['X-Profile-Id'] = profil.identifiant
+        return reponse
+
+    @app.route('/triangulation', methods=['POST'])
+    def post_triangulation():
+        """Endpoint pour trianguler un PointSet envoyé dans le corps de la requête.
+
+        Corps attendu : un PointSet binaire (application/octet-stream). Il est
+        décodé au fil de la réception, ce qui permet de refuser un corps trop
+        grand dès son en-tête (ou dès que la limite est dépassée) sans le
+        recevoir en entier.
+
+        :return: Flux binaire contenant les triangles ou erreur JSON
+        """
+        chronometre = Chronometre()
+
+        if request.mimetype != 'application/octet-stream':
+            return reponse_triangulation({
+                'code': 'UNSUPPORTED_MEDIA_TYPE',
+                'message': 'Corps application/octet-stream (PointSet binaire) requis'
+            }, 415, chronometre)
+
+        taille_max = 4 + POINTS_MAX_TELEVERSEMENT * 8
+        # Le pool de processus reçoit le corps tel quel (borné par taille_max) :
+        # sa structure est validée ici, mais les points ne sont décodés qu'une
+        # fois, dans le processus de calcul
+        brut = bytearray() if app.pool_triangulation is not None else None
+        decodeur = DecodeurPointSet(
+            taille_totale=request.content_length,
+            nombre_points_max=POINTS_MAX_TELEVERSEMENT,
+            convertir=brut is None,
+        )
+        recus = 0
+        try:
+            if request.content_length is not None and request.content_length > taille_max:
+                raise ErreurTailleExcessive(f"{request.content_length} octets annoncés")
+            while morceau := request.stream.read(TAILLE_MORCEAU_TELEVERSEMENT):
+                # Sans Content-Length (corps envoyé par morceaux), la limite est vérifiée en cours de lecture
+                recus += len(morceau)
+                if recus > taille_max:
+                    raise ErreurTailleExcessive(f"plus de {taille_max} octets reçus")
+                decodeur.ajouter(morceau)
+                if brut is not None:
+                    brut += morceau
+            if brut is None:
+                points = decodeur.terminer()
+            else:
+                decodeur.verifier()
+        except ErreurTailleExcessive as e:
+            return reponse_triangulation({
+                'code': 'PAYLOAD_TOO_LARGE',
+                'message': f'PointSet trop grand (au plus {POINTS_MAX_TELEVERSEMENT} points): {str(e)}'
+            }, 413, chronometre)
+        except ErreurDecodage as e:
+            return reponse_triangulation({
+                'code': 'INVALID_POINTSET',
+                'message': f'Erreur lors du décodage du PointSet: {str(e)}'
+            }, 400, chronometre)
+        chronometre.etape('upload')
+
+        if app.pool_triangulation is not None:
+            corps, statut = executer_calcul(app.pool_triangulation.calculer, brut)
+            chronometre.etape('compute')
+        else:
+            corps, statut = executer_calcul(partial(triangulate, result='triangulation'), points)
+            chronometre.etape('triangulate')
+        return reponse_triangulation(corps, statut, chronometre)
+
+    def reponse_triangulation(corps, statut, chronometre):
+        """Construit la réponse d'une triangulation et enregistre ses métriques.
+
+        :param corps: Flux Triangles, Triangulation non encodée ou erreur JSON
+        :param statut: Statut HTTP
+        :param chronometre: Chronomètre de la requête
+        :return: Réponse Flask (flux binaire, éventuellement en streaming, ou erreur JSON)
+        """
+        metriques = app.metriques
+        metriques.observer_durees(chronometre)
+        metriques.observer_duree('total', chronometre.total())
+        entetes = {'Server-Timing': chronometre.server_timing()}
+
+        if statut != 200:
+            metriques.compter_erreur(corps['code'])
+            reponse = jsonify(corps)
+            reponse.status_code = statut
+            reponse.headers.update(entetes)
+            return reponse
+
+        # Retourner le flux binaire
+        if isinstance(corps, bytes):
+            nombre_vertices, nombre_triangles = tailles_triangles(corps)
+            metriques.observer_taille('points', nombre_vertices)
+            metriques.observer_taille('triangles', nombre_triangles)
+            return Response(corps, mimetype='application/octet-stream', headers=entetes)
+
+        # Triangulation non encodée : le flux est produit par morceaux pendant
+        # l'envoi, sa taille étant connue d'avance. L'encodage se termine après
+        # l'envoi des en-têtes : sa durée n'apparaît que dans /metrics
+        metriques.observer_taille('points', len(corps.vertices))
+        metriques.observer_taille('triangles', len(corps))
+        entetes['Content-Length'] = str(taille_triangles(len(corps.vertices), len(corps)))
+        return Response(
+            encodage_chronometre(encoder_triangulation_morceaux(corps)),
+            mimetype='application/octet-stream',
+            headers=entetes,
+        )
+
+    def encodage_chronometre(morceaux):
+        """Transmet les morceaux d'un encodage en streaming en mesurant sa durée.
+
+        Seul le temps passé à produire les morceaux est compté, pas celui de
+        leur envoi au client.
+
+        :param morceaux: Générateur des morceaux du flux Triangles
+        :return: Générateur des mêmes morceaux
+        """
+        duree = 0.0
+        while True:
+            debut = perf_counter()
+            morceau = next(morceaux, None)
+            duree += perf_counter() - debut
+            if morceau is None:
+                break
+            yield morceau
+        app.metriques.observer_duree('encode', duree)
+
+    def trianguler_pointset(pointset_id, progression=None, chronometre=None):
+        """Récupère un PointSet et calcule (ou relit en cache) sa triangulation.
+
+        Le résultat est partagé entre requêtes concurrentes : il ne contient
+        donc que des données, pas d'objet Response. Sans cache ni pool, la
+        triangulation est retournée sans être encodée, pour être envoyée en
+        streaming ; sinon le flux Triangles complet est nécessaire.
+
+        :param pointset_id: L'ID du PointSet à trianguler
+        :param progression: Fonction de suivi de l'insertion ; si elle est
+            fournie, le calcul se fait dans le thread appelant et le flux
+            Triangles complet est retourné
+        :param chronometre: Chronomètre où enregistrer la durée de chaque étape
+            (``fetch``, ``cache``, ``decode``, ``triangulate``, ``encode``, ou
+            ``compute`` pour un calcul dans le pool de processus)
+        :return: Couple (flux Triangles ou Triangulation, 200) ou (erreur JSON, statut HTTP)
+        """
+        if chronometre is None:
+            chronometre = Chronometre()
+
         try:
             # Récupérer le PointSet depuis le PointSetManager
             if not hasattr(app, 'point_set_manager') or app.point_set_manager is None:
-                return jsonify({
+                return {
                     'code': 'SERVICE_UNAVAILABLE',
                     'message': 'PointSetManager non disponible'
-                }), 503
+                }, 503
 
             # Appeler le PointSetManager pour récupérer le flux binaire
             flux_binaire = app.point_set_manager.get_pointset(pointset_id)
+            chronometre.etape('fetch')
 
             if flux_binaire is None:
-                return jsonify({
+                return {
                     'code': 'NOT_FOUND',
                     'message': f'PointSet avec ID {pointset_id} non trouvé'
-                }), 404
+                }, 404
 
+        except ErreurPointSetManager as e:
+            # Le PointSetManager a rejeté l'ID lui-même (format invalide)
+            if e.statut == 400:
+                return {
+                    'code': 'INVALID_ID',
+                    'message': f'PointSetID refusé par le PointSetManager: {str(e)}'
+                }, 400
+            return {
+                'code': 'SERVICE_UNAVAILABLE',
+                'message': (
+                    f'Erreur lors de la communication avec PointSetManager: {str(e)}'
+                )
+            }, 503
         except Exception as e:
-            return jsonify({
+            return {
                 'code': 'SERVICE_UNAVAILABLE',
                 'message': (
                     f'Erreur lors de la communication avec PointSetManager: {str(e)}'
                 )
-            }), 503
+            }, 503
+
+        # Servir directement le résultat déjà calculé pour ce PointSet
+        cache_resultats = app.cache_resultats
+        if cache_resultats is not None:
+            cle = cle_resultat(pointset_id, flux_binaire)
+            flux_resultat = cache_resultats.get(cle)
+            chronometre.etape('cache')
+            if flux_resultat is not None:
+                return flux_resultat, 200
+
+        # Décoder, trianguler et encoder, dans le pool de processus s'il y en a un
+        dans_pool = progression is None and app.pool_triangulation is not None
+        if progression is not None:
+            # Les processus du pool ne peuvent pas signaler leur progression
+            calculer = partial(calculer_triangles, progression=progression, chronometre=chronometre)
+        elif dans_pool:
+            # Les étapes du processus de calcul ne sont pas visibles : une seule durée, attente comprise
+            calculer = app.pool_triangulation.calculer
+        elif cache_resultats is not None:
+            calculer = partial(calculer_triangles, chronometre=chronometre)
+        else:
+            # Les sommets viennent d'un PointSet float32 et les indices tiennent
+            # sur 32 bits : l'encodage en streaming ne peut pas échouer en cours d'envoi
+            calculer = partial(calculer_triangulation, chronometre=chronometre)
+        flux_resultat, statut = executer_calcul(calculer, flux_binaire)
+        if statut != 200:
+            return flux_resultat, statut
+        if dans_pool:
+            chronometre.etape('compute')
+
+        if cache_resultats is not None:
+            cache_resultats.put(cle, flux_resultat)
+
+        return flux_resultat, 200
 
+    def executer_calcul(calculer, donnees):
+        """Exécute un calcul de triangulation et traduit ses erreurs en erreurs JSON.
+
+        :param calculer: Fonction de calcul (voir workers)
+        :param donnees: Argument de la fonction (flux PointSet ou points)
+        :return: Couple (résultat du calcul, 200) ou (erreur JSON, statut HTTP)
+        """
         try:
-            # Décoder le flux binaire en liste de points
-            points = decoder_pointset(flux_binaire)
+            return calculer(donnees), 200
         except ErreurDecodage as e:
-            return jsonify({
+            return {
                 'code': 'INVALID_POINTSET',
                 'message': f'Erreur lors du décodage du PointSet: {str(e)}'
-            }), 400
-
-        try:
-            # Calculer la triangulation
-            triangles = triangulate(points)
+            }, 400
         except ErreurTriangulation as e:
-            return jsonify({
+            return {
                 'code': 'TRIANGULATION_FAILED',
                 'message': f'Erreur lors de la triangulation: {str(e)}'
-            }), 500
-
-        try:
-            # Encoder le résultat en format binaire Triangles
-            flux_resultat = encoder_triangles(triangles)
-        except Exception as e:
-            return jsonify({
+            }, 500
+        except ErreurEncodage as e:
+            return {
                 'code': 'ENCODING_FAILED',
                 'message': f'Erreur lors de l\'encodage du résultat: {str(e)}'
-            }), 500
+            }, 500
+        except (ErreurSurcharge, BrokenProcessPool) as e:
+            return {
+                'code': 'OVERLOADED',
+                'message': f'Service surchargé, réessayer plus tard: {str(e)}'
+            }, 503
+        except TimeoutError:
+            return {
+                'code': 'TIMEOUT',
+                'message': 'La triangulation a dépassé le temps imparti'
+            }, 504
 
-        # Retourner le flux binaire
-        return Response(flux_resultat, mimetype='application/octet-stream'), 200
+    @app.route('/triangulations', methods=['POST'])
+    def post_triangulations():
+        """Endpoint pour trianguler un lot de PointSet en une seule requête.
+
+        Corps attendu : {"pointSetIds": ["<id>", ...]}. Les PointSet sont
+        récupérés et calculés simultanément ; l'échec de l'un d'eux n'est
+        signalé que dans son propre élément de la réponse.
+
+        :return: Flux binaire du lot (voir serializers.encoder_lot), un
+            élément par ID dans l'ordre de la demande, ou erreur JSON
+        """
+        donnees = request.get_json(silent=True)
+        pointset_ids = donnees.get('pointSetIds') if isinstance(donnees, dict) else None
+        if not isinstance(pointset_ids, list):
+            return jsonify({
+                'code': 'BAD_REQUEST',
+                'message': 'Corps JSON {"pointSetIds": ["<id>", ...]} requis'
+            }), 400
+        if len(pointset_ids) > TAILLE_MAX_LOT:
+            return jsonify({
+                'code': 'BATCH_TOO_LARGE',
+                'message': f'{len(pointset_ids)} PointSetID demandés, au plus {TAILLE_MAX_LOT} acceptés'
+            }), 413
+
+        def element(pointset_id):
+            if not isinstance(pointset_id, str) or pointset_id.strip() == '':
+                corps, statut = {'code': 'INVALID_ID', 'message': 'PointSetID invalide ou vide'}, 400
+            else:
+                corps, statut = app.coalesceur.executer(pointset_id, lambda: trianguler_pointset(pointset_id))
+
+            if statut != 200:
+                app.metriques.compter_erreur(corps['code'])
+                return statut, json.dumps(corps).encode('utf-8')
+            if not isinstance(corps, bytes):
+                corps = encoder_triangulation(corps)
+            return 200, corps
+
+        # Au-delà de la capacité du pool, les calculs seraient refusés (OVERLOADED)
+        travailleurs = TRAVAILLEURS_LOT
+        if app.pool_triangulation is not None:
+            travailleurs = min(travailleurs, app.pool_triangulation.capacite)
+        travailleurs = max(1, min(travailleurs, len(pointset_ids)))
+        with ThreadPoolExecutor(max_workers=travailleurs, thread_name_prefix='triangulation-lot') as executeur:
+            elements = list(executeur.map(element, pointset_ids))
+
+        return Response(encoder_lot(elements), mimetype='application/octet-stream'), 200
 
     @app.route('/triangulation/', methods=['GET'])
     def get_triangulation_sans_id():
@@ -100,6 +440,122 @@ def create_app(point_set_manager=None):
             'message': 'PointSetID requis dans l\'URL'
         }), 400
 
+    @app.route('/metrics', methods=['GET'])
+    def get_metrics():
+        """Endpoint exposant les métriques du service au format texte de Prometheus.
+
+        :return: Texte des métriques
+        """
+        return Response(app.metriques.exposition(), content_type='text/plain; version=0.0.4; charset=utf-8'), 200
+
+    @app.route('/profiles/<profile_id>', methods=['GET'])
+    def get_profile(profile_id):
+        """Endpoint pour télécharger le profil capturé pendant une requête.
+
+        :param profile_id: Identifiant du profil (en-tête X-Profile-Id de la requête profilée)
+        :return: Profil au format pstats (mode cprofile) ou collapsed stacks
+            (mode sampling), ou erreur JSON
+        """
+        profil = app.profileur.obtenir(profile_id) if app.profileur is not None else None
+        if profil is None:
+            return jsonify({
+                'code': 'PROFILE_NOT_FOUND',
+                'message': f'Profil {profile_id} inconnu ou expiré'
+            }), 404
+        return Response(
+            profil.contenu,
+            content_type=profil.type_mime,
+            headers={'Content-Disposition': f'attachment; filename="{profil.nom_fichier}"'},
+        ), 200
+
+    @app.route('/jobs', methods=['POST'])
+    def post_job():
+        """Endpoint pour soumettre la triangulation asynchrone d'un PointSet.
+
+        Corps attendu : {"pointSetId": "<id>"}.
+
+        :return: État de la tâche créée (202) ou erreur JSON
+        """
+        donnees = request.get_json(silent=True)
+        pointset_id = donnees.get('pointSetId') if isinstance(donnees, dict) else None
+        if not isinstance(pointset_id, str) or pointset_id.strip() == '':
+            return jsonify({
+                'code': 'BAD_REQUEST',
+                'message': 'Corps JSON {"pointSetId": "<id>"} requis'
+            }), 400
+
+        try:
+            tache = app.taches.soumettre(
+                pointset_id, lambda tache: trianguler_pointset(tache.pointset_id, tache.progresser)
+            )
+        except ErreurSurcharge as e:
+            return jsonify({
+                'code': 'OVERLOADED',
+                'message': f'Trop de tâches en cours, réessayer plus tard: {str(e)}'
+            }), 503
+
+        return jsonify(tache.description()), 202, {'Location': f'/jobs/{tache.identifiant}'}
+
+    @app.route('/jobs/<job_id>', methods=['GET'])
+    def get_job(job_id):
+        """Endpoint pour consulter l'état et la progression d'une tâche.
+
+        :param job_id: Identifiant de la tâche
+        :return: État de la tâche ou erreur JSON
+        """
+        tache = app.taches.obtenir(job_id)
+        if tache is None:
+            return tache_inconnue(job_id)
+        return jsonify(tache.description()), 200
+
+    @app.route('/jobs/<job_id>', methods=['DELETE'])
+    def delete_job(job_id):
+        """Endpoint pour annuler une tâche.
+
+        :param job_id: Identifiant de la tâche
+        :return: État de la tâche après la demande d'annulation ou erreur JSON
+        """
+        tache = app.taches.annuler(job_id)
+        if tache is None:
+            return tache_inconnue(job_id)
+        return jsonify(tache.description()), 200
+
+    @app.route('/jobs/<job_id>/result', methods=['GET'])
+    def get_job_result(job_id):
+        """Endpoint pour télécharger le résultat d'une tâche terminée.
+
+        :param job_id: Identifiant de la tâche
+        :return: Flux binaire Triangles ou erreur JSON
+        """
+        tache = app.taches.obtenir(job_id)
+        if tache is None:
+            return tache_inconnue(job_id)
+
+        if tache.etat == TERMINEE:
+            return Response(tache.resultat, mimetype='application/octet-stream'), 200
+        if tache.etat == ECHOUEE:
+            return jsonify(tache.erreur), tache.statut_erreur
+        if tache.etat == ANNULEE:
+            return jsonify({
+                'code': 'JOB_CANCELLED',
+                'message': f'La tâche {job_id} a été annulée'
+            }), 410
+        return jsonify({
+            'code': 'JOB_NOT_READY',
+            'message': f'La tâche {job_id} n\'est pas terminée'
+        }), 409
+
+    def tache_inconnue(job_id):
+        """Retourne l'erreur JSON d'une tâche inconnue ou expirée.
+
+        :param job_id: Identifiant de la tâche
+        :return: Erreur JSON 404
+        """
+        return jsonify({
+            'code': 'JOB_NOT_FOUND',
+            'message': f'Tâche {job_id} inconnue ou expirée'
+        }), 404
+
     return app
 
 
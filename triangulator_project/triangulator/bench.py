@@ -0,0 +1,328 @@
+"""Banc de mesure des performances de la chaîne de triangulation.
+
+Pour chaque distribution de points et chaque taille N, les étapes du service
+sont chronométrées séparément (décodage du PointSet, triangulation, encodage
+des Triangles) sur plusieurs répétitions, puis résumées par percentiles. La
+pente log-log du temps médian en fonction de N estime la complexité de
+chaque étape : comparée à celle d'une mesure de référence, elle signale une
+régression de complexité (par exemple un _delaunay_triangulation devenu
+quadratique) même quand les temps absolus varient d'une machine à l'autre.
+
+Utilisation ::
+
+    python -m triangulator.bench --tailles 10 100 1000 10000 --sortie reference.json
+    python -m triangulator.bench --tailles 10 100 1000 10000 --reference reference.json
+
+Les temps absolus ne se comparent qu'à une référence mesurée sur la même
+machine. La référence versionnée (``tests/reference_bench.json``, produite
+par ``make bench_reference``) est enregistrée avec ``--pentes-seulement`` :
+elle ne contient que les pentes, et ``make bench`` ne compare donc que la
+complexité. Pour comparer aussi les temps, enregistrer d'abord une
+référence locale avec ``--sortie`` puis la passer à ``--reference``.
+
+Le code de sortie vaut 1 si une régression est détectée par rapport à la
+référence, 0 sinon.
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from triangulator.core import ALGORITHMES, triangulate
+from triangulator.serializers import decoder_pointset, encoder_pointset, encoder_triangulation
+
+# Tailles mesurées par défaut
+TAILLES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+# Étapes chronométrées, dans l'ordre du service
+ETAPES = ("decodage", "triangulation", "encodage")
+
+# Les pentes ne sont estimées qu'à partir de cette taille (en dessous, les
+# coûts fixes masquent la complexité), sauf s'il reste moins de deux tailles
+TAILLE_MIN_PENTE = 1_000
+
+
+def _uniforme(n: int, rng: random.Random) -> list[tuple[float, float]]:
+    """Retourne n points uniformes dans le carré [0, 1000]²."""
+    return [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(n)]
+
+
+def _amas(n: int, rng: random.Random) -> list[tuple[float, float]]:
+    """Retourne n points répartis en amas gaussiens (un amas pour 500 points)."""
+    centres = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(max(1, n // 500))]
+    points = []
+    for _ in range(n):
+        cx, cy = rng.choice(centres)
+        points.append((rng.gauss(cx, 10.0), rng.gauss(cy, 10.0)))
+    return points
+
+
+def _grille(n: int, rng: random.Random) -> list[tuple[float, float]]:
+    """Retourne les n premiers nœuds d'une grille carrée (points cocycliques)."""
+    cote = math.isqrt(n - 1) + 1
+    return [(float(i % cote), float(i // cote)) for i in range(n)]
+
+
+def _cercle(n: int, rng: random.Random) -> list[tuple[float, float]]:
+    """Retourne n points régulièrement espacés sur un cercle."""
+    return [
+        (1000.0 * math.cos(2 * math.pi * i / n), 1000.0 * math.sin(2 * math.pi * i / n))
+        for i in range(n)
+    ]
+
+
+def _balayage(n: int, rng: random.Random) -> list[tuple[float, float]]:
+    """Retourne n points triés par abscisse, comme des lignes de balayage."""
+    return [(float(x), float(x * x % 100)) for x in range(n)]
+
+
+# Générateurs de points, appelés avec (n, générateur aléatoire)
+DISTRIBUTIONS = {
+    "uniforme": _uniforme,
+    "amas": _amas,
+    "grille": _grille,
+    "cercle": _cercle,
+    "balayage": _balayage,
+}
+
+
+def generer_pointset(distribution: str, n: int, graine: int = 0) -> bytes:
+    """Retourne le flux PointSet d'une distribution de points.
+
+    Les coordonnées passent par le format PointSet (float32) : les points
+    devenus confondus après arrondi ne sont gardés qu'une fois.
+
+    :param distribution: Nom de la distribution (voir DISTRIBUTIONS)
+    :param n: Nombre de points
+    :param graine: Graine du générateur aléatoire
+    :return: Flux binaire PointSet
+    """
+    points = DISTRIBUTIONS[distribution](n, random.Random(graine))
+    uniques = list(dict.fromkeys(decoder_pointset(encoder_pointset(points))))
+    return encoder_pointset(uniques)
+
+
+def mesurer(flux: bytes, repetitions: int = 5, algorithm: str = "bowyer-watson") -> dict[str, list[float]]:
+    """Chronomètre chaque étape de la chaîne sur un PointSet.
+
+    :param flux: Flux binaire PointSet
+    :param repetitions: Nombre d'exécutions de la chaîne complète
+    :param algorithm: Algorithme de triangulation (voir core.triangulate)
+    :return: Durées de chaque étape (en secondes), une par répétition
+    """
+    durees = {etape: [] for etape in ETAPES}
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        points = decoder_pointset(flux)
+        apres_decodage = time.perf_counter()
+        triangulation = triangulate(points, result="triangulation", algorithm=algorithm)
+        apres_triangulation = time.perf_counter()
+        encoder_triangulation(triangulation)
+        fin = time.perf_counter()
+
+        durees["decodage"].append(apres_decodage - debut)
+        durees["triangulation"].append(apres_triangulation - apres_decodage)
+        durees["encodage"].append(fin - apres_triangulation)
+    return durees
+
+
+def percentile(valeurs: list[float], q: float) -> float:
+    """Retourne un percentile par interpolation linéaire entre les valeurs triées.
+
+    :param valeurs: Valeurs mesurées (au moins une)
+    :param q: Rang relatif entre 0 et 1 (0.5 pour la médiane)
+    :return: Percentile des valeurs
+    """
+    triees = sorted(valeurs)
+    position = (len(triees) - 1) * q
+    i = int(position)
+    if i + 1 >= len(triees):
+        return triees[-1]
+    return triees[i] + (triees[i + 1] - triees[i]) * (position - i)
+
+
+def pente(mesures: list[tuple[int, float]]) -> float | None:
+    """Retourne la pente de la droite des moindres carrés de log(temps) en fonction de log(N).
+
+    Une pente proche de 1 indique un coût linéaire, proche de 2 un coût
+    quadratique (N log N donne une pente légèrement supérieure à 1).
+
+    :param mesures: Couples (N, temps)
+    :return: Pente, ou None avec moins de deux tailles distinctes
+    """
+    xs = [math.log(n) for n, _ in mesures]
+    ys = [math.log(max(t, 1e-9)) for _, t in mesures]
+    if len(set(xs)) < 2:
+        return None
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys, strict=True)) / sum((x - mx) ** 2 for x in xs)
+
+
+def executer(
+    distributions=tuple(DISTRIBUTIONS),
+    tailles=TAILLES,
+    repetitions: int = 5,
+    algorithm: str = "bowyer-watson",
+    graine: int = 0,
+    afficher=None,
+) -> dict:
+    """Mesure toutes les combinaisons distribution x taille.
+
+    :param distributions: Noms des distributions à mesurer
+    :param tailles: Tailles N à mesurer
+    :param repetitions: Nombre d'exécutions par combinaison
+    :param algorithm: Algorithme de triangulation
+    :param graine: Graine des générateurs aléatoires
+    :param afficher: Fonction appelée avec chaque mesure dès qu'elle est
+        disponible (par exemple pour un affichage au fil de l'eau)
+    :return: Rapport sérialisable en JSON : environnement, mesures
+        (distribution, n, etape, min, p50, p90, max en secondes) et pentes
+        par distribution et par étape
+    """
+    mesures = []
+    for distribution in distributions:
+        for n in tailles:
+            durees = mesurer(generer_pointset(distribution, n, graine), repetitions, algorithm)
+            for etape in ETAPES:
+                mesure = {
+                    "distribution": distribution,
+                    "n": n,
+                    "etape": etape,
+                    "min": min(durees[etape]),
+                    "p50": percentile(durees[etape], 0.5),
+                    "p90": percentile(durees[etape], 0.9),
+                    "max": max(durees[etape]),
+                }
+                mesures.append(mesure)
+                if afficher is not None:
+                    afficher(mesure)
+
+    return {
+        "python": platform.python_version(),
+        "algorithme": algorithm,
+        "repetitions": repetitions,
+        "mesures": mesures,
+        "pentes": calculer_pentes(mesures),
+    }
+
+
+def calculer_pentes(mesures: list[dict]) -> dict[str, dict[str, float | None]]:
+    """Retourne la pente log-log du temps médian de chaque étape, par distribution.
+
+    :param mesures: Mesures d'un rapport (voir executer)
+    :return: Dictionnaire distribution -> étape -> pente
+    """
+    series: dict[tuple[str, str], list[tuple[int, float]]] = {}
+    for mesure in mesures:
+        series.setdefault((mesure["distribution"], mesure["etape"]), []).append((mesure["n"], mesure["p50"]))
+
+    pentes: dict[str, dict[str, float | None]] = {}
+    for (distribution, etape), serie in series.items():
+        grandes = [(n, t) for n, t in serie if n >= TAILLE_MIN_PENTE]
+        pentes.setdefault(distribution, {})[etape] = pente(grandes if len(grandes) >= 2 else serie)
+    return pentes
+
+
+def comparer(
+    rapport: dict, reference: dict, tolerance_temps: float = 0.25, tolerance_pente: float = 0.3
+) -> list[str]:
+    """Compare un rapport à une mesure de référence.
+
+    Les temps ne sont comparés que pour les mesures présentes dans la
+    référence : une référence réduite à ses pentes ne compare que celles-ci.
+
+    :param rapport: Rapport mesuré (voir executer)
+    :param reference: Rapport de référence
+    :param tolerance_temps: Hausse relative du temps médian tolérée (0.25 :
+        +25 %)
+    :param tolerance_pente: Hausse absolue de la pente tolérée (un passage
+        de N log N à N² l'augmente d'environ 1)
+    :return: Description de chaque régression (liste vide si aucune)
+    """
+    regressions = []
+
+    references = {(m["distribution"], m["n"], m["etape"]): m for m in reference.get("mesures", [])}
+    for mesure in rapport["mesures"]:
+        cle = (mesure["distribution"], mesure["n"], mesure["etape"])
+        ancienne = references.get(cle)
+        if ancienne is not None and mesure["p50"] > ancienne["p50"] * (1 + tolerance_temps):
+            regressions.append(
+                f"{cle[0]} n={cle[1]} {cle[2]} : médiane {mesure['p50'] * 1e3:.3f} ms "
+                f"(référence {ancienne['p50'] * 1e3:.3f} ms)"
+            )
+
+    for distribution, pentes in rapport["pentes"].items():
+        for etape, valeur in pentes.items():
+            ancienne = reference.get("pentes", {}).get(distribution, {}).get(etape)
+            if valeur is not None and ancienne is not None and valeur > ancienne + tolerance_pente:
+                regressions.append(
+                    f"{distribution} {etape} : pente {valeur:.2f} (référence {ancienne:.2f})"
+                )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entrée de la ligne de commande.
+
+    :param argv: Arguments (ceux de la ligne de commande si None)
+    :return: Code de sortie : 1 si une régression est détectée, 0 sinon
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m triangulator.bench",
+        description="Mesure les performances du décodage, de la triangulation et de l'encodage.",
+    )
+    parser.add_argument("--distributions", nargs="+", choices=tuple(DISTRIBUTIONS), default=tuple(DISTRIBUTIONS))
+    parser.add_argument("--tailles", nargs="+", type=int, default=TAILLES, help="Tailles N à mesurer")
+    parser.add_argument("--repetitions", type=int, default=5, help="Exécutions par combinaison")
+    parser.add_argument("--algorithme", choices=ALGORITHMES, default="bowyer-watson")
+    parser.add_argument("--graine", type=int, default=0, help="Graine des générateurs aléatoires")
+    parser.add_argument("--sortie", help="Fichier JSON où enregistrer le rapport")
+    parser.add_argument(
+        "--pentes-seulement",
+        action="store_true",
+        help="N'enregistrer que les pentes dans --sortie (référence indépendante de la machine)",
+    )
+    parser.add_argument("--reference", help="Rapport JSON de référence à comparer")
+    parser.add_argument("--tolerance-temps", type=float, default=0.25, help="Hausse relative tolérée du temps médian")
+    parser.add_argument("--tolerance-pente", type=float, default=0.3, help="Hausse tolérée de la pente log-log")
+    args = parser.parse_args(argv)
+
+    if any(n < 3 for n in args.tailles) or args.repetitions < 1:
+        parser.error("les tailles doivent valoir au moins 3 et les répétitions au moins 1")
+
+    def afficher(mesure):
+        print(
+            f"{mesure['distribution']:>10} {mesure['n']:>9} {mesure['etape']:>13}"
+            f"  p50 {mesure['p50'] * 1e3:10.3f} ms  p90 {mesure['p90'] * 1e3:10.3f} ms"
+        )
+
+    rapport = executer(args.distributions, args.tailles, args.repetitions, args.algorithme, args.graine, afficher)
+
+    for distribution, pentes in rapport["pentes"].items():
+        valeurs = "  ".join(f"{etape} {'-' if p is None else f'{p:.2f}'}" for etape, p in pentes.items())
+        print(f"pentes {distribution:>10} : {valeurs}")
+
+    if args.sortie:
+        enregistre = {k: v for k, v in rapport.items() if k != "mesures"} if args.pentes_seulement else rapport
+        with open(args.sortie, "w", encoding="utf-8") as fichier:
+            json.dump(enregistre, fichier, indent=2)
+
+    if args.reference:
+        with open(args.reference, encoding="utf-8") as fichier:
+            regressions = comparer(rapport, json.load(fichier), args.tolerance_temps, args.tolerance_pente)
+        for regression in regressions:
+            print(f"RÉGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""Module de cache des résultats de triangulation.
+
+Les résultats sont les flux binaires Triangles déjà encodés, indexés par une
+clé combinant le PointSetID et une empreinte du PointSet récupéré : si le
+PointSet change côté PointSetManager, l'ancienne entrée n'est plus servie.
+
+Tout objet exposant ``get(cle)`` et ``put(cle, valeur)`` peut servir de cache
+(ou de second niveau d'un CacheResultats).
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+def cle_resultat(pointset_id: str, flux: bytes) -> str:
+    """Construit la clé de cache d'un PointSet.
+
+    :param pointset_id: L'ID du PointSet
+    :param flux: Flux binaire du PointSet récupéré auprès du PointSetManager
+    :return: Clé "<pointset_id>:<sha256 du flux>"
+    """
+    return f"{pointset_id}:{hashlib.sha256(flux).hexdigest()}"
+
+
+class CacheResultats:
+    """Cache LRU en mémoire, borné par la taille totale des flux stockés.
+
+    Un second niveau optionnel (par exemple CacheDisque) est consulté en cas
+    d'absence en mémoire ; les entrées qu'il fournit sont remontées en mémoire.
+    Les compteurs ``hits``, ``misses`` et ``evictions`` sont mis à jour à
+    chaque accès.
+    """
+
+    def __init__(self, taille_max_octets: int = 64 * 1024 * 1024, second_niveau=None):
+        """Initialise le cache.
+
+        :param taille_max_octets: Taille totale maximale des flux gardés en mémoire
+        :param second_niveau: Cache consulté lorsque la clé est absente en
+            mémoire (optionnel)
+        """
+        self.taille_max_octets = taille_max_octets
+        self.second_niveau = second_niveau
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entrees: OrderedDict[str, bytes] = OrderedDict()
+        self._taille = 0
+        self._verrou = threading.Lock()
+
+    def get(self, cle: str) -> bytes | None:
+        """Retourne le flux associé à une clé, ou None s'il est absent.
+
+        :param cle: Clé construite par cle_resultat
+        :return: Flux Triangles encodé ou None
+        """
+        with self._verrou:
+            valeur = self._entrees.get(cle)
+            if valeur is not None:
+                self._entrees.move_to_end(cle)
+                self.hits += 1
+                return valeur
+
+        if self.second_niveau is not None:
+            valeur = self.second_niveau.get(cle)
+            if valeur is not None:
+                self._stocker(cle, valeur)
+                with self._verrou:
+                    self.hits += 1
+                return valeur
+
+        with self._verrou:
+            self.misses += 1
+        return None
+
+    def put(self, cle: str, valeur: bytes) -> None:
+        """Ajoute un flux au cache (et au second niveau s'il existe).
+
+        :param cle: Clé construite par cle_resultat
+        :param valeur: Flux Triangles encodé
+        """
+        self._stocker(cle, valeur)
+        if self.second_niveau is not None:
+            self.second_niveau.put(cle, valeur)
+
+    def stats(self) -> dict:
+        """Retourne les compteurs et l'occupation du cache.
+
+        :return: Dictionnaire hits / misses / evictions / entrees / octets
+        """
+        with self._verrou:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entrees': len(self._entrees),
+                'octets': self._taille,
+            }
+
+    def _stocker(self, cle: str, valeur: bytes) -> None:
+        """Insère une entrée en mémoire puis évince les plus anciennes si besoin.
+
+        :param cle: Clé de l'entrée
+        :param valeur: Flux à stocker
+        """
+        # Un flux plus gros que le cache entier ne ferait que le vider
+        if len(valeur) > self.taille_max_octets:
+            return
+
+        with self._verrou:
+            ancienne = self._entrees.pop(cle, None)
+            if ancienne is not None:
+                self._taille -= len(ancienne)
+            self._entrees[cle] = valeur
+            self._taille += len(valeur)
+
+            while self._taille > self.taille_max_octets:
+                _, evincee = self._entrees.popitem(last=False)
+                self._taille -= len(evincee)
+                self.evictions += 1
+
+
+class CacheDisque:
+    """Cache persistant : un fichier par entrée dans un répertoire.
+
+    La taille totale des fichiers est bornée : au-delà, les moins récemment
+    utilisés (date de modification, mise à jour à chaque lecture) sont
+    supprimés. Le compteur ``evictions`` compte les fichiers supprimés.
+    """
+
+    def __init__(self, repertoire: str, taille_max_octets: int = 1024 * 1024 * 1024):
+        """Initialise le cache (le répertoire est créé au besoin).
+
+        :param repertoire: Répertoire où stocker les flux
+        :param taille_max_octets: Taille totale maximale des fichiers du cache
+        """
+        self.repertoire = repertoire
+        self.taille_max_octets = taille_max_octets
+        self.evictions = 0
+        self._verrou = threading.Lock()
+        os.makedirs(repertoire, exist_ok=True)
+        # Les fichiers laissés par une exécution précédente comptent dans le budget
+        self._taille = sum(taille for _, _, taille in self._fichiers())
+
+    def get(self, cle: str) -> bytes | None:
+        """Retourne le flux stocké pour une clé, ou None s'il est absent.
+
+        :param cle: Clé de l'entrée
+        :return: Flux stocké ou None
+        """
+        chemin = self._chemin(cle)
+        try:
+            with open(chemin, 'rb') as fichier:
+                valeur = fichier.read()
+            # Rajeunir l'entrée : l'éviction supprime les moins récemment utilisées
+            os.utime(chemin)
+        except FileNotFoundError:
+            return None
+        return valeur
+
+    def put(self, cle: str, valeur: bytes) -> None:
+        """Écrit un flux sur disque de manière atomique, puis évince les plus anciens si besoin.
+
+        :param cle: Clé de l'entrée
+        :param valeur: Flux à stocker
+        """
+        # Un flux plus gros que le cache entier ne ferait que le vider
+        if len(valeur) > self.taille_max_octets:
+            return
+
+        chemin = self._chemin(cle)
+        # Écrire dans un fichier temporaire puis le renommer : un lecteur
+        # concurrent ne voit jamais de fichier partiellement écrit
+        descripteur, temporaire = tempfile.mkstemp(dir=self.repertoire, suffix='.tmp')
+        try:
+            with os.fdopen(descripteur, 'wb') as fichier:
+                fichier.write(valeur)
+            with self._verrou:
+                with contextlib.suppress(FileNotFoundError):
+                    self._taille -= os.path.getsize(chemin)
+                os.replace(temporaire, chemin)
+                self._taille += len(valeur)
+                if self._taille > self.taille_max_octets:
+                    self._evincer()
+        except BaseException:
+            if os.path.exists(temporaire):
+                os.unlink(temporaire)
+            raise
+
+    def _evincer(self) -> None:
+        """Supprime les fichiers les plus anciens jusqu'à respecter la taille maximale (verrou déjà pris).
+
+        Le répertoire est relu : la taille suivie est ainsi corrigée si
+        d'autres processus partagent le même répertoire.
+        """
+        fichiers = sorted(self._fichiers())
+        self._taille = sum(taille for _, _, taille in fichiers)
+        for _, chemin, taille in fichiers:
+            if self._taille <= self.taille_max_octets:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(chemin)
+            self._taille -= taille
+            self.evictions += 1
+
+    def _fichiers(self) -> list[tuple[float, str, int]]:
+        """Retourne les fichiers du cache présents sur disque.
+
+        :return: Triplets (date de modification, chemin, taille en octets)
+        """
+        fichiers = []
+        with os.scandir(self.repertoire) as entrees:
+            for entree in entrees:
+                if entree.name.endswith('.bin'):
+                    try:
+                        infos = entree.stat()
+                    except FileNotFoundError:
+                        continue
+                    fichiers.append((infos.st_mtime, entree.path, infos.st_size))
+        return fichiers
+
+    def _chemin(self, cle: str) -> str:
+        """Retourne le chemin du fichier d'une clé.
+
+        :param cle: Clé de l'entrée
+        :return: Chemin du fichier
+        """
+        nom = hashlib.sha256(cle.encode('utf-8')).hexdigest()
+        return os.path.join(self.repertoire, f"{nom}.bin")
@@ -0,0 +1,54 @@
+"""Module de regroupement des calculs identiques lancés en même temps.
+
+Quand plusieurs requêtes demandent simultanément le même résultat, seule la
+première l'exécute ; les suivantes attendent et reçoivent le même résultat
+(ou la même exception).
+"""
+
+import threading
+from concurrent.futures import Future
+
+
+class Coalesceur:
+    """Partage un calcul en cours entre tous les appelants d'une même clé."""
+
+    def __init__(self):
+        """Initialise le registre des calculs en cours."""
+        self._en_cours: dict[str, Future] = {}
+        self._verrou = threading.Lock()
+
+    def executer(self, cle: str, fonction):
+        """Exécute ``fonction()``, sauf si un calcul de même clé est déjà en cours.
+
+        :param cle: Identifiant du calcul
+        :param fonction: Fonction sans argument à exécuter
+        :return: Résultat de la fonction (partagé entre appelants concurrents)
+        :raises Exception: L'exception levée par la fonction, pour tous les appelants
+        """
+        with self._verrou:
+            future = self._en_cours.get(cle)
+            meneur = future is None
+            if meneur:
+                future = Future()
+                self._en_cours[cle] = future
+
+        if not meneur:
+            return future.result()
+
+        try:
+            resultat = fonction()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(resultat)
+            return resultat
+        finally:
+            # Les appelants suivants relanceront un nouveau calcul
+            with self._verrou:
+                del self._en_cours[cle]
+
+    def nombre_en_cours(self) -> int:
+        """Retourne le nombre de calculs en cours."""
+        with self._verrou:
+            return len(self._en_cours)
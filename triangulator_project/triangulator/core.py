@@ -1,59 +1,653 @@
 """Module de triangulation utilisant l'algorithme de Delaunay (Bowyer-Watson)."""
 
 import math
+import random
+from array import array
+from itertools import chain
 
+from triangulator.diviser_regner import delaunay_diviser_regner
 from triangulator.exceptions import ErreurTriangulation
+from triangulator.predicates import ERREUR_ORIENTATION, incircle_perturbe, orient2d
 
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : seul le moteur "numpy" en dépend
+    np = None
 
-def triangulate(points: list[tuple[float, float]]) -> list[list[tuple[float, float]]]:
+# Moteurs de calcul acceptés par triangulate
+MOTEURS = ("python", "numpy")
+
+# Formes de résultat acceptées par triangulate
+RESULTATS = ("triangles", "triangulation")
+
+# Algorithmes acceptés par triangulate
+ALGORITHMES = ("bowyer-watson", "divide-and-conquer")
+
+# Ordres d'insertion acceptés par triangulate
+ORDRES_INSERTION = ("input", "hilbert", "brio")
+
+# Traitements des points dupliqués acceptés par triangulate
+DOUBLONS = ("reject", "merge")
+
+# Traitements des entrées dégénérées (moins de 3 points, points tous alignés)
+DEGENERES = ("raise", "empty")
+
+# Nombre de niveaux de la courbe de Hilbert (grille de 2^10 x 2^10 cellules)
+_NIVEAUX_HILBERT = 10
+
+# Graine fixe : l'ordre BRIO est aléatoire mais la triangulation reste déterministe
+_GRAINE_BRIO = 20251
+
+# En dessous de cette taille, les tours BRIO ne sont plus découpés
+_TAILLE_MIN_TOUR_BRIO = 64
+
+# Nombre de points insérés entre deux appels de la fonction de progression
+PAS_PROGRESSION = 1024
+
+
+class Triangulation:
+    """Résultat compact d'une triangulation : sommets et indices des triangles.
+
+    Les sommets sont les points d'entrée eux-mêmes (sans copie) et les indices
+    sont stockés dans un tableau : array('I') à plat (3 entiers par triangle)
+    avec le moteur "python", tableau int32 de forme (T, 3) avec le moteur "numpy".
+
+    Si les doublons ont été fusionnés (``duplicates="merge"``), les sommets
+    sont les points uniques et ``correspondance[i]`` est l'indice du sommet
+    qui représente le i-ème point d'entrée.
+    """
+
+    __slots__ = ("vertices", "indices", "correspondance")
+
+    def __init__(self, vertices, indices, correspondance=None):
+        """Initialise le résultat.
+
+        :param vertices: Points triangulés (liste de tuples ou tableau (N, 2))
+        :param indices: Indices des sommets de chaque triangle
+        :param correspondance: Indice du sommet de chaque point d'entrée
+            (array('I') ou tableau int32), None si aucun point n'a été fusionné
+        """
+        self.vertices = vertices
+        self.indices = indices
+        self.correspondance = correspondance
+
+    def __len__(self) -> int:
+        """Retourne le nombre de triangles."""
+        if isinstance(self.indices, array):
+            return len(self.indices) // 3
+        return len(self.indices)
+
+    def triangles(self):
+        """Retourne les triangles sous forme de coordonnées.
+
+        :return: Liste de triangles, chaque triangle étant une liste de 3 points
+            (tableau de forme (T, 3, 2) pour un résultat NumPy)
+        """
+        if not isinstance(self.indices, array):
+            return self.vertices[self.indices]
+
+        points = self.vertices
+        indices = self.indices
+        return [
+            [points[indices[k]], points[indices[k + 1]], points[indices[k + 2]]]
+            for k in range(0, len(indices), 3)
+        ]
+
+
+def triangulate(
+    points: list[tuple[float, float]],
+    order: str = "brio",
+    engine: str = "python",
+    result: str = "triangles",
+    progression=None,
+    algorithm: str = "bowyer-watson",
+    processes: int = 1,
+    duplicates: str = "reject",
+    tolerance: float = 0.0,
+    degenerate: str = "raise",
+) -> list[list[tuple[float, float]]] | Triangulation:
     """Triangule un ensemble de points en 2D en utilisant l'algorithme de Delaunay.
 
-    :param points: Liste de tuples (x, y) représentant les points
+    :param points: Liste de tuples (x, y) représentant les points, ou tableau
+        NumPy de forme (N, 2) avec le moteur "numpy"
+    :param order: Ordre d'insertion des points : "input" (ordre d'entrée),
+        "hilbert" (tri selon une courbe de Hilbert) ou "brio" (tours
+        aléatoires de tailles croissantes, chacun trié selon la courbe de Hilbert)
+    :param engine: Moteur de calcul : "python" (listes de tuples) ou "numpy"
+        (tableaux float64 contigus, voir _triangulate_numpy)
+    :param result: Forme du résultat : "triangles" (coordonnées de chaque
+        triangle) ou "triangulation" (objet Triangulation, sommets + indices,
+        sans conversion en coordonnées)
+    :param progression: Fonction appelée avec (points insérés, nombre total
+        de points) tous les PAS_PROGRESSION points pendant l'insertion, puis à
+        la fin ; une exception qu'elle lève interrompt la triangulation
+    :param algorithm: Algorithme : "bowyer-watson" (insertion incrémentale)
+        ou "divide-and-conquer" (Guibas et Stolfi, O(n log n) dans le pire cas,
+        voir triangulator.diviser_regner ; ``order`` est alors sans effet)
+    :param processes: Nombre de processus pour l'algorithme
+        "divide-and-conquer" : au-delà de 1, des bandes de points sont
+        triangulées en parallèle puis fusionnées (résultat identique)
+    :param duplicates: Traitement des points dupliqués : "reject" (erreur)
+        ou "merge" (les points confondus sont fusionnés avant la
+        triangulation, voir Triangulation.correspondance)
+    :param tolerance: Avec "merge", distance en deçà de laquelle deux points
+        sont confondus (0.0 : coordonnées identiques)
+    :param degenerate: Traitement des entrées dégénérées (moins de 3 points
+        ou points tous alignés) : "raise" (erreur) ou "empty" (résultat sans
+        aucun triangle)
     :return: Liste de triangles, chaque triangle étant une liste de 3 points
+        (tableau de forme (T, 3, 2) avec le moteur "numpy"), ou Triangulation
     :raises ErreurTriangulation: Si la triangulation ne peut pas être effectuée
+    :raises ValueError: Si l'ordre d'insertion, le moteur, la forme du
+        résultat, l'algorithme ou le traitement des doublons ou des entrées
+        dégénérées est inconnu, ou si la tolérance est invalide
+    :raises ImportError: Si le moteur "numpy" est demandé sans NumPy installé
     """
+    if order not in ORDRES_INSERTION:
+        raise ValueError(f"Ordre d'insertion inconnu : {order!r} (attendu : {', '.join(ORDRES_INSERTION)})")
+    if engine not in MOTEURS:
+        raise ValueError(f"Moteur inconnu : {engine!r} (attendu : {', '.join(MOTEURS)})")
+    if result not in RESULTATS:
+        raise ValueError(f"Forme de résultat inconnue : {result!r} (attendu : {', '.join(RESULTATS)})")
+    if algorithm not in ALGORITHMES:
+        raise ValueError(f"Algorithme inconnu : {algorithm!r} (attendu : {', '.join(ALGORITHMES)})")
+    if processes < 1 or (processes > 1 and algorithm != "divide-and-conquer"):
+        raise ValueError(f"processes={processes!r} : le calcul parallèle exige algorithm='divide-and-conquer'")
+    if duplicates not in DOUBLONS:
+        raise ValueError(f"Traitement des doublons inconnu : {duplicates!r} (attendu : {', '.join(DOUBLONS)})")
+    if not (math.isfinite(tolerance) and tolerance >= 0) or (tolerance > 0 and duplicates != "merge"):
+        raise ValueError(f"tolerance={tolerance!r} : attendu un réel positif ou nul, avec duplicates='merge'")
+    if degenerate not in DEGENERES:
+        raise ValueError(f"Traitement des dégénérescences inconnu : {degenerate!r} (attendu : {', '.join(DEGENERES)})")
+
+    moteur = _triangulate_numpy if engine == "numpy" else _triangulate_python
+    triangulation = moteur(points, order, progression, algorithm, processes, duplicates, tolerance, degenerate)
+
+    if result == "triangulation":
+        return triangulation
+    return triangulation.triangles()
+
+
+def _triangulate_python(
+    points: list[tuple[float, float]],
+    order: str,
+    progression=None,
+    algorithm: str = "bowyer-watson",
+    processes: int = 1,
+    duplicates: str = "reject",
+    tolerance: float = 0.0,
+    degenerate: str = "raise",
+) -> Triangulation:
+    """Triangule une liste de tuples (x, y).
+
+    :param points: Liste de tuples (x, y) représentant les points
+    :param order: Ordre d'insertion ("input", "hilbert" ou "brio")
+    :param progression: Fonction de suivi de l'insertion (voir triangulate)
+    :param algorithm: "bowyer-watson" ou "divide-and-conquer"
+    :param processes: Nombre de processus ("divide-and-conquer" uniquement)
+    :param duplicates: "reject" ou "merge" (voir triangulate)
+    :param tolerance: Distance de fusion des points avec "merge"
+    :param degenerate: "raise" ou "empty" (voir triangulate)
+    :return: Triangulation dont les sommets sont ``points`` (les points
+        uniques avec "merge")
+    :raises ErreurTriangulation: Si la triangulation ne peut pas être effectuée
+    """
+    correspondance = None
+    if duplicates == "merge":
+        points, correspondance = _fusionner_doublons(points, tolerance)
+
     # Validation : au moins 3 points
     if len(points) < 3:
+        if degenerate == "empty":
+            for x, y in points:
+                _verifier_fini(x, y)
+            return _triangulation_vide(points, correspondance, progression)
         raise ErreurTriangulation(
             "Au moins 3 points sont nécessaires pour la triangulation"
         )
 
-    # Valider les points (pas de NaN ou Inf)
-    for x, y in points:
-        if math.isnan(x) or math.isnan(y):
-            raise ErreurTriangulation("Les points contiennent des valeurs NaN")
-        if math.isinf(x) or math.isinf(y):
-            raise ErreurTriangulation("Les points contiennent des valeurs infinies")
+    # Valider les points (pas de NaN ou Inf) en relevant au passage la boîte
+    # englobante et un point hors de la droite des deux premiers
+    boite, temoin = _statistiques_points(points)
 
-    # Validation : pas de doublons
+    # Validation : pas de doublons (hachage des couples de coordonnées)
     if len(points) != len(set(points)):
         raise ErreurTriangulation("Les points ne doivent pas être dupliqués")
 
     # Validation : points non colinéaires
-    if _sont_colineaires(points):
+    if temoin == -1:
+        if degenerate == "empty":
+            return _triangulation_vide(points, correspondance, progression)
         raise ErreurTriangulation("Les points ne doivent pas être tous colinéaires")
 
     # Cas spécial : exactement 3 points
     if len(points) == 3:
-        return [list(points)]
+        if progression is not None:
+            progression(3, 3)
+        return Triangulation(points, array('I', (0, 1, 2)), correspondance)
+
+    # Triangulation de Delaunay, les indices renvoyés se réfèrent
+    # toujours à la liste d'origine
+    if algorithm == "divide-and-conquer":
+        triangles_indices = delaunay_diviser_regner(points, progression, PAS_PROGRESSION, processes)
+    else:
+        ordre = _ordre_insertion(points, order, boite=boite)
+        triangles_indices = _delaunay_triangulation(points, ordre, progression)
+
+    return Triangulation(points, array('I', chain.from_iterable(triangles_indices)), correspondance)
+
+
+def _triangulation_vide(points, correspondance, progression=None) -> Triangulation:
+    """Retourne le résultat sans triangle d'une entrée dégénérée.
+
+    :param points: Points (validés) de l'entrée
+    :param correspondance: Correspondance des doublons fusionnés, ou None
+    :param progression: Fonction de suivi de l'insertion (voir triangulate)
+    :return: Triangulation dont les indices sont vides
+    """
+    if progression is not None:
+        progression(len(points), len(points))
+    return Triangulation(points, array('I'), correspondance)
+
+
+def _triangulate_numpy(
+    points,
+    order: str,
+    progression=None,
+    algorithm: str = "bowyer-watson",
+    processes: int = 1,
+    duplicates: str = "reject",
+    tolerance: float = 0.0,
+    degenerate: str = "raise",
+):
+    """Triangule un ensemble de points stockés dans des tableaux NumPy.
+
+    Les coordonnées restent dans un tableau float64 contigu de forme (N, 2) :
+    la validation (NaN/Inf, doublons, colinéarité), la boîte englobante et les
+    clés de Hilbert sont calculées par opérations vectorielles. Seule la boucle
+    d'insertion, séquentielle par nature, travaille sur des flottants Python.
+
+    :param points: Tableau (N, 2) ou séquence de points (x, y)
+    :param order: Ordre d'insertion ("input", "hilbert" ou "brio")
+    :param progression: Fonction de suivi de l'insertion (voir triangulate)
+    :param algorithm: "bowyer-watson" ou "divide-and-conquer"
+    :param processes: Nombre de processus ("divide-and-conquer" uniquement)
+    :param duplicates: "reject" ou "merge" (voir triangulate)
+    :param tolerance: Distance de fusion des points avec "merge"
+    :param degenerate: "raise" ou "empty" (voir triangulate)
+    :return: Triangulation dont les sommets sont le tableau float64 (N, 2) (les
+        points uniques avec "merge") et les indices un tableau int32 (T, 3)
+    :raises ErreurTriangulation: Si la triangulation ne peut pas être effectuée
+    :raises ImportError: Si NumPy n'est pas installé
+    """
+    if np is None:
+        raise ImportError("NumPy est requis pour le moteur 'numpy'")
+
+    coords = np.ascontiguousarray(points, dtype=np.float64)
+    if coords.size == 0:
+        coords = coords.reshape(0, 2)
+    if coords.ndim != 2 or coords.shape[1] != 2:
+        raise ErreurTriangulation(f"Les points doivent former un tableau (N, 2), reçu {coords.shape}")
+
+    correspondance = None
+    if duplicates == "merge":
+        coords, correspondance = _fusionner_doublons_numpy(coords, tolerance)
+
+    indices = _triangles_indices_numpy(coords, order, progression, algorithm, processes, degenerate)
+    return Triangulation(coords, indices, correspondance)
+
+
+def _triangles_indices_numpy(
+    coords,
+    order: str,
+    progression=None,
+    algorithm: str = "bowyer-watson",
+    processes: int = 1,
+    degenerate: str = "raise",
+):
+    """Retourne les triangles sous forme d'indices après validation des points.
+
+    :param coords: Tableau float64 contigu de forme (N, 2)
+    :param order: Ordre d'insertion ("input", "hilbert" ou "brio")
+    :param progression: Fonction de suivi de l'insertion (voir triangulate)
+    :param algorithm: "bowyer-watson" ou "divide-and-conquer"
+    :param processes: Nombre de processus ("divide-and-conquer" uniquement)
+    :param degenerate: "raise" ou "empty" (voir triangulate)
+    :return: Tableau int32 de forme (T, 3) d'indices dans ``coords``
+    :raises ErreurTriangulation: Si la triangulation ne peut pas être effectuée
+    """
+    n = coords.shape[0]
+    xs = coords[:, 0]
+    ys = coords[:, 1]
+
+    # Validation : au moins 3 points
+    if n < 3 and degenerate != "empty":
+        raise ErreurTriangulation(
+            "Au moins 3 points sont nécessaires pour la triangulation"
+        )
+
+    # Valider les points (pas de NaN ou Inf)
+    if np.isnan(coords).any():
+        raise ErreurTriangulation("Les points contiennent des valeurs NaN")
+    if np.isinf(coords).any():
+        raise ErreurTriangulation("Les points contiennent des valeurs infinies")
+
+    if n < 3:
+        if progression is not None:
+            progression(n, n)
+        return np.empty((0, 3), dtype=np.int32)
+
+    # Validation : pas de doublons (tri lexicographique puis comparaison des voisins)
+    tri = np.lexsort((ys, xs))
+    if ((np.diff(xs[tri]) == 0) & (np.diff(ys[tri]) == 0)).any():
+        raise ErreurTriangulation("Les points ne doivent pas être dupliqués")
+
+    # Validation : points non colinéaires. Le filtre vectoriel suffit dès qu'un
+    # point est sûrement hors de la droite, sinon le test exact tranche
+    x0, y0 = coords[0]
+    x1, y1 = coords[1]
+    gauche = (x1 - x0) * (ys[2:] - y0)
+    droite = (xs[2:] - x0) * (y1 - y0)
+    temoin = np.abs(gauche - droite) > ERREUR_ORIENTATION * (np.abs(gauche) + np.abs(droite))
+    if not temoin.any() and _sont_colineaires(coords.tolist()):
+        if degenerate == "empty":
+            if progression is not None:
+                progression(n, n)
+            return np.empty((0, 3), dtype=np.int32)
+        raise ErreurTriangulation("Les points ne doivent pas être tous colinéaires")
+
+    # Cas spécial : exactement 3 points
+    if n == 3:
+        if progression is not None:
+            progression(3, 3)
+        return np.array([[0, 1, 2]], dtype=np.int32)
+
+    if algorithm == "divide-and-conquer":
+        triangles_indices = delaunay_diviser_regner(coords.tolist(), progression, PAS_PROGRESSION, processes)
+        return np.array(triangles_indices, dtype=np.int32).reshape(-1, 3)
+
+    boite = (float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max()))
+    ordre = None
+    if order != "input":
+        ordre = _ordre_insertion(None, order, _cles_hilbert_numpy(coords, boite).tolist())
+
+    # Triangulation par Delaunay (Bowyer-Watson) sur des flottants Python,
+    # la boîte englobante étant déjà connue
+    triangles_indices = _delaunay_triangulation(coords.tolist(), ordre, progression)
+    return np.array(triangles_indices, dtype=np.int32).reshape(-1, 3)
+
+
+def _fusionner_doublons_numpy(coords, tolerance: float = 0.0):
+    """Version vectorielle de _fusionner_doublons (coordonnées identiques).
+
+    Avec une tolérance, la recherche par grille de _fusionner_doublons est
+    appliquée aux coordonnées converties en flottants Python.
+
+    :param coords: Tableau float64 de forme (N, 2)
+    :param tolerance: Distance de fusion (0.0 : coordonnées identiques)
+    :return: Couple (tableau float64 (M, 2) des points uniques, tableau int32
+        (N,) de l'indice du point unique représentant chaque point)
+    """
+    if tolerance > 0:
+        uniques, correspondance = _fusionner_doublons(coords.tolist(), tolerance)
+        return np.array(uniques, dtype=np.float64).reshape(-1, 2), np.asarray(correspondance, dtype=np.int32)
+
+    # np.unique trie les points : les représentants sont remis dans l'ordre
+    # de leur première apparition
+    _, premiers, inverse = np.unique(coords, axis=0, return_index=True, return_inverse=True)
+    ordre = np.argsort(premiers)
+    rang = np.empty_like(ordre)
+    rang[ordre] = np.arange(len(ordre))
+    return coords[premiers[ordre]], rang[inverse.reshape(-1)].astype(np.int32)
+
+
+def _demi_etendue(boite: tuple[float, float, float, float]) -> float:
+    """Retourne la moitié du plus grand côté de la boîte englobante.
+
+    Les bornes sont divisées par deux avant la soustraction : l'étendue reste
+    finie même quand max_x - min_x dépasserait le plus grand flottant (points
+    proches de ±1e308). Les distances au coin de la boîte sont calculées de
+    la même façon, et divisées par cette demi-étendue plutôt que multipliées
+    par une échelle qui pourrait déborder pour une boîte minuscule.
+
+    :param boite: Boîte englobante (min_x, max_x, min_y, max_y)
+    :return: Demi-étendue, strictement positive (1.0 pour une boîte réduite à un point)
+    """
+    min_x, max_x, min_y, max_y = boite
+    return max(max_x * 0.5 - min_x * 0.5, max_y * 0.5 - min_y * 0.5) or 1.0
+
+
+def _cles_hilbert_numpy(coords, boite: tuple[float, float, float, float]):
+    """Version vectorielle de _cles_hilbert.
+
+    :param coords: Tableau float64 de forme (N, 2)
+    :param boite: Boîte englobante (min_x, max_x, min_y, max_y)
+    :return: Tableau int64 des clés de Hilbert de chaque point
+    """
+    min_x, max_x, min_y, max_y = boite
+    cote = 1 << _NIVEAUX_HILBERT
+    etendue = _demi_etendue(boite)
+
+    # Rapport au plus 1 : les cellules restent dans la grille
+    cx = np.minimum((coords[:, 0] * 0.5 - min_x * 0.5) / etendue * (cote - 1), cote - 1).astype(np.int64)
+    cy = np.minimum((coords[:, 1] * 0.5 - min_y * 0.5) / etendue * (cote - 1), cote - 1).astype(np.int64)
+    cles = np.zeros(coords.shape[0], dtype=np.int64)
+    demi = cote >> 1
+    while demi:
+        rx = (cx & demi) > 0
+        ry = (cy & demi) > 0
+        cles += demi * demi * ((3 * rx) ^ ry)
+        # Rotation du quadrant pour que la courbe reste continue
+        retourne = rx & ~ry
+        cx = np.where(retourne, cote - 1 - cx, cx)
+        cy = np.where(retourne, cote - 1 - cy, cy)
+        echange = ~ry
+        cx, cy = np.where(echange, cy, cx), np.where(echange, cx, cy)
+        demi >>= 1
+    return cles
+
+
+def _fusionner_doublons(
+    points: list[tuple[float, float]],
+    tolerance: float = 0.0,
+) -> tuple[list[tuple[float, float]], array]:
+    """Fusionne les points confondus.
+
+    Sans tolérance, les points de coordonnées identiques sont regroupés par
+    hachage. Avec une tolérance, les points uniques sont rangés dans une
+    grille de cellules de côté ``tolerance`` : chaque point est rattaché au
+    premier point unique situé à moins de ``tolerance`` dans les 9 cellules
+    voisines, ou devient lui-même un point unique.
+
+    :param points: Liste de tuples (x, y)
+    :param tolerance: Distance de fusion (0.0 : coordonnées identiques)
+    :return: Couple (points uniques dans l'ordre de leur première apparition,
+        array('I') de l'indice du point unique représentant chaque point)
+    :raises ErreurTriangulation: Si un point contient une valeur NaN ou infinie
+    """
+    uniques = []
+    correspondance = array('I')
+
+    if tolerance == 0:
+        representants = {}
+        for point in points:
+            i = representants.setdefault(point, len(uniques))
+            if i == len(uniques):
+                uniques.append(point)
+            correspondance.append(i)
+        return uniques, correspondance
+
+    carre = tolerance * tolerance
+    cellules: dict[tuple[int, int], list[int]] = {}
+    for x, y in points:
+        _verifier_fini(x, y)
+        cx = math.floor(x / tolerance)
+        cy = math.floor(y / tolerance)
+        i = next(
+            (
+                r
+                for voisine in ((cx + dx, cy + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+                for r in cellules.get(voisine, ())
+                if (uniques[r][0] - x) ** 2 + (uniques[r][1] - y) ** 2 <= carre
+            ),
+            -1,
+        )
+        if i == -1:
+            i = len(uniques)
+            uniques.append((x, y))
+            cellules.setdefault((cx, cy), []).append(i)
+        correspondance.append(i)
+    return uniques, correspondance
+
+
+def _ordre_insertion(
+    points: list[tuple[float, float]] | None,
+    order: str,
+    cles: list[int] | None = None,
+    boite: tuple[float, float, float, float] | None = None,
+) -> list[int] | None:
+    """Retourne l'ordre dans lequel insérer les points.
+
+    Insérer des points voisins l'un après l'autre raccourcit la marche de
+    localisation et garde des cavités petites, même lorsque l'entrée est triée
+    par lignes de balayage.
+
+    :param points: Liste de points à trianguler (inutile si ``cles`` est fourni)
+    :param order: Ordre d'insertion ("input", "hilbert" ou "brio")
+    :param cles: Clés de Hilbert déjà calculées (calculées depuis ``points`` si None)
+    :param boite: Boîte englobante (min_x, max_x, min_y, max_y) des points si
+        elle est déjà connue
+    :return: Indices des points dans l'ordre d'insertion (None pour l'ordre d'entrée)
+    """
+    if order == "input":
+        return None
+
+    if cles is None:
+        cles = _cles_hilbert(points, boite)
+
+    if order == "hilbert":
+        return sorted(range(len(cles)), key=cles.__getitem__)
+
+    # BRIO : mélanger, découper en tours dont la taille double à chaque fois,
+    # puis trier chaque tour selon la courbe de Hilbert
+    indices = list(range(len(cles)))
+    random.Random(_GRAINE_BRIO).shuffle(indices)
+    tours = []
+    fin = len(indices)
+    while fin > _TAILLE_MIN_TOUR_BRIO:
+        debut = fin // 2
+        tours.append(indices[debut:fin])
+        fin = debut
+    tours.append(indices[:fin])
+
+    ordre = []
+    for tour in reversed(tours):
+        tour.sort(key=cles.__getitem__)
+        ordre.extend(tour)
+    return ordre
 
-    # Triangulation par Delaunay (Bowyer-Watson)
-    triangles_indices = _delaunay_triangulation(points)
 
-    # Convertir les indices en points réels
-    triangles = []
-    for tri_idx in triangles_indices:
-        triangle = [points[tri_idx[0]], points[tri_idx[1]], points[tri_idx[2]]]
-        triangles.append(triangle)
+def _cles_hilbert(
+    points: list[tuple[float, float]],
+    boite: tuple[float, float, float, float] | None = None,
+) -> list[int]:
+    """Retourne la position de chaque point le long d'une courbe de Hilbert.
+
+    Les points sont ramenés sur une grille de 2^_NIVEAUX_HILBERT cellules de
+    côté couvrant leur boîte englobante.
+
+    :param points: Liste de points
+    :param boite: Boîte englobante (min_x, max_x, min_y, max_y) si elle est
+        déjà connue
+    :return: Clé de Hilbert de chaque point
+    """
+    if boite is None:
+        boite, _ = _statistiques_points(points)
+    min_x, max_x, min_y, max_y = boite
+
+    cote = 1 << _NIVEAUX_HILBERT
+    etendue = _demi_etendue(boite)
+    demi_min_x = min_x * 0.5
+    demi_min_y = min_y * 0.5
+
+    cles = []
+    for x, y in points:
+        # Rapport au plus 1 : les cellules restent dans la grille
+        cx = min(int((x * 0.5 - demi_min_x) / etendue * (cote - 1)), cote - 1)
+        cy = min(int((y * 0.5 - demi_min_y) / etendue * (cote - 1)), cote - 1)
+        cle = 0
+        demi = cote >> 1
+        while demi:
+            rx = 1 if cx & demi else 0
+            ry = 1 if cy & demi else 0
+            cle += demi * demi * ((3 * rx) ^ ry)
+            # Rotation du quadrant pour que la courbe reste continue
+            if not ry:
+                if rx:
+                    cx = cote - 1 - cx
+                    cy = cote - 1 - cy
+                cx, cy = cy, cx
+            demi >>= 1
+        cles.append(cle)
+    return cles
+
+
+def _statistiques_points(
+    points: list[tuple[float, float]],
+) -> tuple[tuple[float, float, float, float], int]:
+    """Retourne la boîte englobante des points et un témoin de non-colinéarité, en un seul parcours.
+
+    Le témoin est l'indice du premier point strictement hors de la droite
+    passant par les deux premiers points (prédicat exact) ; une fois trouvé,
+    le reste du parcours ne fait plus que les comparaisons de la boîte.
+
+    :param points: Liste d'au moins 2 points
+    :return: Couple ((min_x, max_x, min_y, max_y), témoin), le témoin valant
+        -1 si tous les points sont colinéaires
+    :raises ErreurTriangulation: Si un point contient une valeur NaN ou infinie
+    """
+    (x0, y0), (x1, y1) = points[0], points[1]
+    # La droite de référence doit être finie avant le premier test d'orientation
+    _verifier_fini(x0, y0)
+    _verifier_fini(x1, y1)
+
+    min_x = min_y = math.inf
+    max_x = max_y = -math.inf
+    temoin = -1
+    for i, (x, y) in enumerate(points):
+        # x - x vaut 0.0 pour un flottant fini, NaN sinon
+        if x - x != 0.0 or y - y != 0.0:
+            _verifier_fini(x, y)
+        if x < min_x:
+            min_x = x
+        if x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        if y > max_y:
+            max_y = y
+        if temoin == -1 and orient2d(x0, y0, x1, y1, x, y) != 0:
+            temoin = i
+    return (min_x, max_x, min_y, max_y), temoin
 
-    return triangles
 
+def _verifier_fini(x: float, y: float) -> None:
+    """Vérifie qu'un point ne contient ni NaN ni valeur infinie.
+
+    :param x: Abscisse
+    :param y: Ordonnée
+    :raises ErreurTriangulation: Si une coordonnée est NaN ou infinie
+    """
+    if math.isnan(x) or math.isnan(y):
+        raise ErreurTriangulation("Les points contiennent des valeurs NaN")
+    if math.isinf(x) or math.isinf(y):
+        raise ErreurTriangulation("Les points contiennent des valeurs infinies")
 
-def _sont_colineaires(points: list[tuple[float, float]], tolerance: float = 1e-10) -> bool:
-    """Vérifie si tous les points sont colinéaires.
+
+def _sont_colineaires(points: list[tuple[float, float]]) -> bool:
+    """Vérifie si tous les points sont exactement colinéaires.
 
     :param points: Liste de points à vérifier
-    :param tolerance: Tolérance pour la vérification de colinéarité
     :return: True si tous les points sont colinéaires
     """
     if len(points) < 3:
@@ -63,90 +657,197 @@ def _sont_colineaires(points: list[tuple[float, float]], tolerance: float = 1e-1
     x1, y1 = points[1]
 
     # Vérifier que tous les autres points sont sur la même droite
-    for x2, y2 in points[2:]:
-        # Produit vectoriel (cross product)
-        cross = (x1 - x0) * (y2 - y0) - (x2 - x0) * (y1 - y0)
-        if abs(cross) > tolerance:
-            return False
-
-    return True
+    # (prédicat d'orientation robuste, sans tolérance arbitraire)
+    return all(orient2d(x0, y0, x1, y1, x2, y2) == 0 for x2, y2 in points[2:])
 
 
 def _delaunay_triangulation(
     points: list[tuple[float, float]],
+    ordre: list[int] | None = None,
+    progression=None,
 ) -> list[tuple[int, int, int]]:
     """Retourne la triangulation de Delaunay via Bowyer-Watson.
 
-    :param points: Liste de points à trianguler
-    :return: Liste de triangles (indices)
+    Chaque triangle connaît ses trois voisins (``voisins[t][k]`` est le
+    triangle situé en face du sommet ``k``). L'insertion d'un point commence
+    par une marche depuis le dernier triangle créé jusqu'au triangle qui le
+    contient, puis la cavité est étendue par parcours des voisins au lieu de
+    tester tous les triangles.
+
+    Il n'y a pas de super-triangle : chaque arête de l'enveloppe convexe est
+    bordée par un triangle fantôme dont le troisième sommet, d'indice
+    ``len(points)``, est à l'infini. Un point hors de l'enveloppe est inséré
+    comme les autres (sa cavité contient les triangles fantômes qui le
+    voient), et aucun triangle du bord n'est perdu, même lorsque les points
+    de l'enveloppe sont presque alignés. Les triangles sont stockés dans le
+    sens trigonométrique.
+
+    :param points: Liste de points à trianguler (non tous colinéaires)
+    :param ordre: Indices des points dans l'ordre d'insertion (ordre de la
+        liste si None)
+    :param progression: Fonction appelée avec (points insérés, nombre total)
+        tous les PAS_PROGRESSION points, puis une dernière fois à la fin
+    :return: Liste de triangles (indices dans ``points``), dans le sens horaire
     """
-    # Créer un super-triangle qui englobe tous les points
-    min_x = min(x for x, _ in points)
-    max_x = max(x for x, _ in points)
-    min_y = min(y for _, y in points)
-    max_y = max(y for _, y in points)
+    n = len(points)
+    infini = n
+    if ordre is None:
+        ordre = range(n)
 
-    dx = max_x - min_x
-    dy = max_y - min_y
-    delta_max = max(dx, dy) if max(dx, dy) > 0 else 1.0
-    mid_x = (min_x + max_x) / 2
-    mid_y = (min_y + max_y) / 2
+    # Premier triangle : les deux premiers points et le premier point non
+    # aligné avec eux, entouré de trois triangles fantômes
+    a, b = ordre[0], ordre[1]
+    (ax, ay), (bx, by) = points[a], points[b]
+    rang_c = next(r for r in range(2, n) if orient2d(ax, ay, bx, by, *points[ordre[r]]) != 0)
+    c = ordre[rang_c]
+    if orient2d(ax, ay, bx, by, *points[c]) < 0:
+        a, b = b, a
 
-    # Super-triangle (suffisamment grand pour englober tous les points)
-    p1 = (mid_x - 20 * delta_max, mid_y - delta_max)
-    p2 = (mid_x, mid_y + 20 * delta_max)
-    p3 = (mid_x + 20 * delta_max, mid_y - delta_max)
+    # Les emplacements libérés par les triangles supprimés sont réutilisés
+    # (sommets à None tant qu'ils sont libres)
+    sommets: list[tuple[int, int, int] | None] = [(a, b, c), (c, b, infini), (a, c, infini), (b, a, infini)]
+    voisins: list[list[int]] = [[1, 2, 3], [3, 2, 0], [1, 3, 0], [2, 1, 0]]
+    fantomes = bytearray((0, 1, 1, 1))
+    libres: list[int] = []
+    dernier = 0
 
-    # Liste étendue des points (points originaux + super-triangle)
-    extended_points = list(points) + [p1, p2, p3]
-    n = len(points)
+    if progression is not None:
+        progression(0, n)
+
+    # Ajouter les autres points un par un (ceux alignés avec les deux
+    # premiers et passés avant le troisième sommet sont insérés à la fin)
+    reste = chain(ordre[rang_c + 1:], ordre[2:rang_c])
+    for rang, i in enumerate(reste, 3):
+        if progression is not None and rang % PAS_PROGRESSION == 0:
+            progression(rang, n)
+        point = points[i]
+
+        # Localiser le triangle qui contient le point (ou le triangle fantôme
+        # par lequel il sort de l'enveloppe)
+        depart = _localiser_triangle(points, sommets, voisins, dernier, point, infini)
+
+        # Étendre la cavité (triangles dont le cercle circonscrit contient le point)
+        # par parcours des voisins depuis le triangle contenant
+        cavite = {depart}
+        pile = [depart]
+        bord = []
+        while pile:
+            t = pile.pop()
+            tri = sommets[t]
+            for k in range(3):
+                voisin = voisins[t][k]
+                if voisin in cavite:
+                    continue
+                if fantomes[voisin]:
+                    dedans = _dans_demi_plan(points, sommets[voisin], point, infini)
+                else:
+                    dedans = _in_circumcircle(points, sommets[voisin], point)
+                if dedans:
+                    cavite.add(voisin)
+                    pile.append(voisin)
+                else:
+                    # Arête du bord de la cavité, dans le sens du triangle
+                    bord.append((tri[(k + 1) % 3], tri[(k + 2) % 3], voisin, t))
+
+        # Re-trianguler la cavité en reliant chaque arête du bord au point
+        par_debut = {}
+        par_fin = {}
+        for a, b, voisin, ancien in bord:
+            t = libres.pop() if libres else len(sommets)
+            fantome = a == infini or b == infini
+            if t == len(sommets):
+                sommets.append((a, b, i))
+                voisins.append([-1, -1, voisin])
+                fantomes.append(fantome)
+            else:
+                sommets[t] = (a, b, i)
+                voisins[t] = [-1, -1, voisin]
+                fantomes[t] = fantome
+            liens = voisins[voisin]
+            liens[liens.index(ancien)] = t
+            par_debut[a] = t
+            par_fin[b] = t
+            if not fantome:
+                dernier = t
+
+        # Relier les nouveaux triangles entre eux : (a, b, i) partage l'arête
+        # (b, i) avec le triangle qui commence en b et l'arête (i, a) avec
+        # celui qui finit en a
+        for a, t in par_debut.items():
+            b = sommets[t][1]
+            voisins[t][0] = par_debut[b]
+            voisins[t][1] = par_fin[a]
+
+        # Libérer les emplacements des triangles de la cavité (après la création
+        # des nouveaux triangles pour ne pas fausser la mise à jour des voisins)
+        for t in cavite:
+            sommets[t] = None
+            libres.append(t)
 
-    # Initialiser avec le super-triangle
-    triangles = [(n, n + 1, n + 2)]
-
-    # Ajouter les points un par un
-    for i in range(n):
-        bad_triangles = []
-
-        # Trouver tous les triangles dont le cercle circonscrit contient le point
-        for tri in triangles:
-            if _in_circumcircle(extended_points, tri, extended_points[i]):
-                bad_triangles.append(tri)
-
-        # Trouver les arêtes du polygone formé par les bad_triangles
-        # Une arête est sur le bord si elle apparaît dans exactement un bad_triangle
-        edge_count = {}
-        for tri in bad_triangles:
-            for edge in _get_edges(tri):
-                # Normaliser l'arête (ordre canonique)
-                normalized = tuple(sorted(edge))
-                if normalized not in edge_count:
-                    edge_count[normalized] = []
-                edge_count[normalized].append(edge)
-
-        # Garder uniquement les arêtes qui apparaissent une seule fois
-        polygon = []
-        for _normalized, edge_list in edge_count.items():
-            if len(edge_list) == 1:
-                polygon.append(edge_list[0])
-
-        # Supprimer les bad_triangles
-        for tri in bad_triangles:
-            if tri in triangles:
-                triangles.remove(tri)
-
-        # Re-trianguler le polygone
-        for edge in polygon:
-            new_tri = (edge[0], edge[1], i)
-            triangles.append(new_tri)
-
-    # Supprimer les triangles qui contiennent des sommets du super-triangle
-    result = []
-    for tri in triangles:
-        if all(idx < n for idx in tri):
-            result.append(tri)
-
-    return result
+    if progression is not None:
+        progression(n, n)
+
+    # Garder les triangles réels, dans le sens horaire
+    return [
+        (tri[0], tri[2], tri[1])
+        for t, tri in enumerate(sommets)
+        if tri is not None and not fantomes[t]
+    ]
+
+
+def _localiser_triangle(
+    points: list[tuple[float, float] | None],
+    sommets: list[tuple[int, int, int] | None],
+    voisins: list[list[int]],
+    depart: int,
+    point: tuple[float, float],
+    infini: int,
+) -> int:
+    """Trouve le triangle qui contient un point par marche de visibilité.
+
+    À chaque pas, on traverse la première arête qui sépare le triangle courant
+    du point. La marche s'arrête sur un triangle fantôme si le point est hors
+    de l'enveloppe convexe. Si elle ne converge pas, on se rabat sur un
+    parcours de tous les triangles.
+
+    :param points: Liste de tous les points
+    :param sommets: Sommets de chaque triangle (None si l'emplacement est libre)
+    :param voisins: Voisins de chaque triangle
+    :param depart: Triangle réel à partir duquel commencer la marche
+    :param point: Point à localiser
+    :param infini: Indice du sommet à l'infini des triangles fantômes
+    :return: Indice du triangle réel contenant le point, ou d'un triangle
+        fantôme dont le demi-plan contient le point
+    """
+    px, py = point
+    t = depart
+    for pas in range(len(sommets) + 1):
+        tri = sommets[t]
+        if infini in tri:
+            return t
+        suivant = -1
+        # Faire tourner l'arête de départ évite les cycles sur les cas dégénérés
+        for d in range(3):
+            k = (d + pas) % 3
+            ax, ay = points[tri[(k + 1) % 3]]
+            bx, by = points[tri[(k + 2) % 3]]
+            if orient2d(ax, ay, bx, by, px, py) < 0:
+                suivant = voisins[t][k]
+                break
+        if suivant == -1:
+            return t
+        t = suivant
+
+    for t, tri in enumerate(sommets):
+        if tri is not None and infini not in tri and all(
+            orient2d(*points[tri[(k + 1) % 3]], *points[tri[(k + 2) % 3]], px, py) >= 0
+            for k in range(3)
+        ):
+            return t
+    for t, tri in enumerate(sommets):
+        if tri is not None and infini in tri and _dans_demi_plan(points, tri, point, infini):
+            return t
+    return depart
 
 
 def _in_circumcircle(
@@ -154,10 +855,16 @@ def _in_circumcircle(
     triangle: tuple[int, int, int],
     point: tuple[float, float],
 ) -> bool:
-    """Vérifie si un point est à l'intérieur du cercle circonscrit d'un triangle.
+    """Vérifie si un point est strictement à l'intérieur du cercle circonscrit d'un triangle.
+
+    Utilise les prédicats robustes, quelle que soit l'échelle des
+    coordonnées ; un point cocyclique est intérieur ou non selon la
+    perturbation symbolique de incircle_perturbe, qui ne dépend que des
+    coordonnées des quatre points.
 
     :param points: Liste de tous les points
-    :param triangle: Triple d'indices définissant le triangle
+    :param triangle: Triple d'indices définissant le triangle, dans le sens
+        trigonométrique
     :param point: Point à tester
     :return: True si le point est dans le cercle circonscrit
     """
@@ -166,42 +873,459 @@ def _in_circumcircle(
     bx, by = points[j]
     cx, cy = points[k]
     px, py = point
+    return incircle_perturbe(ax, ay, bx, by, cx, cy, px, py) > 0
 
-    # Calculer le centre et le rayon du cercle circonscrit
-    # Formule basée sur les perpendiculaires bissectrices
 
-    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+def _dans_demi_plan(
+    points: list[tuple[float, float]],
+    triangle: tuple[int, int, int],
+    point: tuple[float, float],
+    infini: int,
+) -> bool:
+    """Vérifie si un point est dans le « cercle circonscrit » d'un triangle fantôme.
 
-    # Si d est proche de 0, les points sont colinéaires
-    if abs(d) < 1e-10:
-        return False
+    Pour un triangle fantôme (a, b, infini), ce cercle dégénère en demi-plan
+    ouvert à gauche de a -> b (hors de l'enveloppe), plus l'intérieur du
+    segment [a, b].
 
-    ux = (
-        (ax * ax + ay * ay) * (by - cy)
-        + (bx * bx + by * by) * (cy - ay)
-        + (cx * cx + cy * cy) * (ay - by)
-    ) / d
-    uy = (
-        (ax * ax + ay * ay) * (cx - bx)
-        + (bx * bx + by * by) * (ax - cx)
-        + (cx * cx + cy * cy) * (bx - ax)
-    ) / d
+    :param points: Liste de tous les points
+    :param triangle: Triple d'indices dont l'un vaut ``infini``, dans le sens
+        trigonométrique
+    :param point: Point à tester
+    :param infini: Indice du sommet à l'infini
+    :return: True si le point est dans le demi-plan
+    """
+    i, j, k = triangle
+    # Arête finie dans le sens du triangle
+    if i == infini:
+        i, j = j, k
+    elif j == infini:
+        i, j = k, i
+    a = points[i]
+    b = points[j]
+
+    orientation = orient2d(*a, *b, *point)
+    if orientation != 0:
+        return orientation > 0
+    # Point aligné avec l'arête : dedans s'il est strictement entre a et b
+    axe = 0 if a[0] != b[0] else 1
+    return min(a[axe], b[axe]) < point[axe] < max(a[axe], b[axe])
 
-    # Rayon du cercle circonscrit
-    radius_squared = (ax - ux) * (ax - ux) + (ay - uy) * (ay - uy)
 
-    # Distance du point au centre
-    dist_squared = (px - ux) * (px - ux) + (py - uy) * (py - uy)
+def _dans_cercle_ou_demi_plan(
+    points: list[tuple[float, float] | None],
+    triangle: tuple[int, int, int],
+    point: tuple[float, float],
+    infini: int,
+) -> bool:
+    """Vérifie si un point est dans le cercle circonscrit d'un triangle, réel ou fantôme.
+
+    :param points: Liste de tous les points
+    :param triangle: Triple d'indices dans le sens trigonométrique
+    :param point: Point à tester
+    :param infini: Indice du sommet à l'infini des triangles fantômes
+    :return: True si le point est dans le cercle (demi-plan pour un triangle fantôme)
+    """
+    if infini in triangle:
+        return _dans_demi_plan(points, triangle, point, infini)
+    return _in_circumcircle(points, triangle, point)
 
-    # Le point est dans le cercle si sa distance est inférieure au rayon
-    return dist_squared < radius_squared + 1e-10
 
+# Sommet fictif « à l'infini » des triangles fantômes de DelaunayTriangulation
+_INFINI = -1
 
-def _get_edges(triangle: tuple[int, int, int]) -> list[tuple[int, int]]:
-    """Retourne les arêtes d'un triangle.
 
-    :param triangle: Triple d'indices
-    :return: Liste des 3 arêtes (paires d'indices)
+class DelaunayTriangulation:
+    """Triangulation de Delaunay persistante, modifiable point par point.
+
+    ``insert`` et ``remove`` ne re-triangulent que la zone touchée : la cavité
+    du point inséré (Bowyer-Watson) ou l'étoile du point supprimé, remplie par
+    découpage en oreilles de Delaunay, soit O(1) triangles en moyenne. Le
+    point inséré est localisé par une marche partant du plus proche de
+    quelques sommets tirés au hasard (« jump and walk ») : environ n^(1/3)
+    triangles traversés pour un point quelconque, O(1) pour des points
+    insérés à la suite les uns des autres. Une suppression coûte O(d³)
+    pour un sommet de degré d (chaque oreille candidate est comparée à tous
+    les sommets restants du trou), soit O(1) en moyenne puisque d vaut 6 en
+    moyenne.
+
+    Chaque arête de l'enveloppe convexe est bordée par un triangle fantôme
+    (a, b, _INFINI), où l'extérieur est à gauche de a -> b : l'insertion d'un
+    point hors de l'enveloppe et la suppression d'un sommet de l'enveloppe
+    suivent ainsi le cas général, sans super-triangle. Les triangles réels
+    sont stockés dans le sens trigonométrique.
+
+    Les indices des points sont stables : ``insert`` retourne l'indice du
+    nouveau point et un point supprimé libère son indice sans décaler les
+    autres. L'objet est sérialisable avec pickle (état compact en tableaux),
+    pour être mis en cache puis mis à jour.
     """
-    i, j, k = triangle
-    return [(i, j), (j, k), (k, i)]
+
+    def __init__(self, points: list[tuple[float, float]]):
+        """Initialise la triangulation d'un ensemble de points.
+
+        :param points: Liste de tuples (x, y), au moins 3 points distincts non
+            tous colinéaires
+        :raises ErreurTriangulation: Si les points ne peuvent pas être triangulés
+        """
+        points = [(float(x), float(y)) for x, y in points]
+        # L'algorithme diviser pour régner donne l'enveloppe convexe exacte
+        initiale = triangulate(points, algorithm="divide-and-conquer", result="triangulation")
+
+        self._points: list[tuple[float, float] | None] = points
+        self._sommets: list[tuple[int, int, int] | None] = []
+        self._voisins: list[list[int]] = []
+        self._libres: list[int] = []
+        self._triangle_du_sommet = [-1] * len(points)
+        self._nombre_reels = 0
+        self._nombre_points = len(points)
+
+        indices = initiale.indices
+        aretes = {}
+        for k in range(0, len(indices), 3):
+            a, b, c = indices[k], indices[k + 1], indices[k + 2]
+            if orient2d(*points[a], *points[b], *points[c]) < 0:
+                b, c = c, b
+            self._ajouter_triangle((a, b, c), aretes)
+
+        # Un triangle fantôme derrière chaque arête de l'enveloppe
+        for a, b in [arete for arete in aretes if (arete[1], arete[0]) not in aretes]:
+            self._ajouter_triangle((b, a, _INFINI), aretes)
+
+        for (a, b), (t, k) in aretes.items():
+            self._voisins[t][k] = aretes[(b, a)][0]
+        self._dernier = 0
+
+    def __len__(self) -> int:
+        """Retourne le nombre de triangles (hors triangles fantômes)."""
+        return self._nombre_reels
+
+    @property
+    def nombre_points(self) -> int:
+        """Nombre de points présents dans la triangulation."""
+        return self._nombre_points
+
+    def insert(self, point: tuple[float, float]) -> int:
+        """Insère un point et re-triangule sa cavité.
+
+        :param point: Tuple (x, y)
+        :return: Indice du point inséré
+        :raises ErreurTriangulation: Si le point est invalide (NaN, infini) ou
+            déjà présent
+        """
+        x, y = float(point[0]), float(point[1])
+        if not (math.isfinite(x) and math.isfinite(y)):
+            raise ErreurTriangulation("Le point contient des valeurs NaN ou infinies")
+        point = (x, y)
+
+        depart = self._localiser(point)
+        for v in self._sommets[depart]:
+            if v != _INFINI and self._points[v] == point:
+                raise ErreurTriangulation(f"Le point {point} est déjà présent (indice {v})")
+
+        # Cavité : triangles (réels ou fantômes) dont le cercle contient le point
+        cavite = {depart}
+        pile = [depart]
+        bord = []
+        while pile:
+            t = pile.pop()
+            tri = self._sommets[t]
+            for k in range(3):
+                voisin = self._voisins[t][k]
+                if voisin in cavite:
+                    continue
+                if self._dans_cercle(voisin, point):
+                    cavite.add(voisin)
+                    pile.append(voisin)
+                else:
+                    bord.append((tri[(k + 1) % 3], tri[(k + 2) % 3], voisin))
+
+        i = len(self._points)
+        self._points.append(point)
+        self._triangle_du_sommet.append(-1)
+        self._nombre_points += 1
+        self._remplacer(cavite, [(a, b, i) for a, b, _ in bord], {(a, b): voisin for a, b, voisin in bord})
+        return i
+
+    def remove(self, index: int) -> None:
+        """Supprime un point et re-triangule son étoile.
+
+        :param index: Indice du point à supprimer
+        :raises IndexError: Si aucun point n'a cet indice
+        :raises ErreurTriangulation: Si les points restants ne pourraient plus
+            être triangulés (moins de 3 points, ou tous colinéaires)
+        """
+        if not 0 <= index < len(self._points) or self._points[index] is None:
+            raise IndexError(f"Aucun point d'indice {index}")
+        if self._nombre_points <= 3:
+            raise ErreurTriangulation("Au moins 3 points sont nécessaires pour la triangulation")
+
+        # Étoile du point, parcourue dans le sens trigonométrique : le lien
+        # (sommets opposés) forme un polygone autour du point
+        etoile = []
+        lien = []
+        exterieur = {}
+        t = self._triangle_du_sommet[index]
+        while True:
+            tri = self._sommets[t]
+            k = tri.index(index)
+            a, b = tri[(k + 1) % 3], tri[(k + 2) % 3]
+            etoile.append(t)
+            lien.append(a)
+            exterieur[(a, b)] = self._voisins[t][k]
+            t = self._voisins[t][(k + 1) % 3]
+            if t == etoile[0]:
+                break
+
+        nouveaux = self._remplir(lien)
+        reels_etoile = sum(1 for t in etoile if self._sommets[t][2] != _INFINI)
+        reels_nouveaux = sum(1 for tri in nouveaux if tri[2] != _INFINI)
+        if self._nombre_reels - reels_etoile + reels_nouveaux == 0:
+            raise ErreurTriangulation("Les points restants seraient tous colinéaires")
+
+        self._points[index] = None
+        self._triangle_du_sommet[index] = -1
+        self._nombre_points -= 1
+        self._remplacer(set(etoile), nouveaux, exterieur)
+
+    def triangulation(self) -> Triangulation:
+        """Retourne la triangulation courante sous forme compacte.
+
+        Les points supprimés sont retirés : les indices du résultat sont ceux
+        des points restants, renumérotés dans l'ordre.
+
+        :return: Triangulation (triangles dans le sens horaire, comme triangulate)
+        """
+        renumerotation = {}
+        vertices = []
+        for i, p in enumerate(self._points):
+            if p is not None:
+                renumerotation[i] = len(vertices)
+                vertices.append(p)
+
+        indices = array('I')
+        for tri in self._sommets:
+            if tri is not None and tri[2] != _INFINI:
+                a, b, c = tri
+                indices.extend((renumerotation[a], renumerotation[c], renumerotation[b]))
+        return Triangulation(vertices, indices)
+
+    def triangles(self) -> list[list[tuple[float, float]]]:
+        """Retourne les triangles sous forme de coordonnées (sens horaire).
+
+        :return: Liste de triangles, chaque triangle étant une liste de 3 points
+        """
+        points = self._points
+        return [
+            [points[tri[0]], points[tri[2]], points[tri[1]]]
+            for tri in self._sommets
+            if tri is not None and tri[2] != _INFINI
+        ]
+
+    def __getstate__(self) -> dict:
+        """Retourne l'état compact de la triangulation (pour pickle).
+
+        :return: Dictionnaire de tableaux ; un point supprimé est codé (NaN, NaN)
+            et un emplacement de triangle libre (-2, -2, -2)
+        """
+        nan = math.nan
+        return {
+            'points': array('d', chain.from_iterable((nan, nan) if p is None else p for p in self._points)),
+            'sommets': array('q', chain.from_iterable((-2, -2, -2) if t is None else t for t in self._sommets)),
+            'voisins': array('q', chain.from_iterable(self._voisins)),
+            'libres': array('q', self._libres),
+            'triangle_du_sommet': array('q', self._triangle_du_sommet),
+            'dernier': self._dernier,
+        }
+
+    def __setstate__(self, etat: dict) -> None:
+        """Restaure la triangulation depuis l'état retourné par __getstate__.
+
+        :param etat: État compact
+        """
+        coords = etat['points']
+        self._points = [
+            None if math.isnan(coords[k]) else (coords[k], coords[k + 1]) for k in range(0, len(coords), 2)
+        ]
+        sommets = etat['sommets']
+        self._sommets = [
+            None if sommets[k] == -2 else (sommets[k], sommets[k + 1], sommets[k + 2])
+            for k in range(0, len(sommets), 3)
+        ]
+        voisins = etat['voisins']
+        self._voisins = [list(voisins[k:k + 3]) for k in range(0, len(voisins), 3)]
+        self._libres = list(etat['libres'])
+        self._triangle_du_sommet = list(etat['triangle_du_sommet'])
+        self._dernier = etat['dernier']
+        self._nombre_reels = sum(1 for t in self._sommets if t is not None and t[2] != _INFINI)
+        self._nombre_points = sum(1 for p in self._points if p is not None)
+
+    def _ajouter_triangle(self, tri: tuple[int, int, int], aretes: dict) -> int:
+        """Crée un triangle (voisins non reliés) dans un emplacement libre.
+
+        :param tri: Sommets du triangle, _INFINI en dernière position pour un
+            triangle fantôme
+        :param aretes: Dictionnaire complété par arête orientée -> (triangle,
+            indice du sommet opposé)
+        :return: Indice du triangle créé
+        """
+        if self._libres:
+            t = self._libres.pop()
+            self._sommets[t] = tri
+            self._voisins[t] = [-1, -1, -1]
+        else:
+            t = len(self._sommets)
+            self._sommets.append(tri)
+            self._voisins.append([-1, -1, -1])
+
+        for k in range(3):
+            aretes[(tri[(k + 1) % 3], tri[(k + 2) % 3])] = (t, k)
+            if tri[k] != _INFINI:
+                self._triangle_du_sommet[tri[k]] = t
+        if tri[2] != _INFINI:
+            self._nombre_reels += 1
+            self._dernier = t
+        return t
+
+    def _remplacer(self, anciens: set[int], nouveaux: list[tuple[int, int, int]], exterieur: dict) -> None:
+        """Remplace un groupe de triangles par d'autres couvrant la même zone.
+
+        :param anciens: Triangles supprimés
+        :param nouveaux: Triangles créés (sens trigonométrique, _INFINI à
+            n'importe quelle position)
+        :param exterieur: Arête orientée du bord de la zone -> triangle
+            voisin à l'extérieur de la zone
+        """
+        for t in anciens:
+            if self._sommets[t][2] != _INFINI:
+                self._nombre_reels -= 1
+            self._sommets[t] = None
+            self._libres.append(t)
+
+        aretes = {}
+        crees = []
+        for a, b, c in nouveaux:
+            # Rotation qui place le sommet à l'infini en dernier
+            if a == _INFINI:
+                a, b, c = b, c, a
+            elif b == _INFINI:
+                a, b, c = c, a, b
+            crees.append(self._ajouter_triangle((a, b, c), aretes))
+
+        for (a, b), (t, k) in aretes.items():
+            if (a, b) in exterieur:
+                voisin = exterieur[(a, b)]
+                k_voisin = self._sommets[voisin].index(next(v for v in self._sommets[voisin] if v not in (a, b)))
+                self._voisins[voisin][k_voisin] = t
+            else:
+                voisin = aretes[(b, a)][0]
+            self._voisins[t][k] = voisin
+
+        # La marche de localisation part d'un triangle réel : à défaut d'en
+        # avoir créé un, celui qui borde le dernier triangle fantôme créé
+        if self._sommets[self._dernier] is None or self._sommets[self._dernier][2] == _INFINI:
+            self._dernier = self._voisins[crees[-1]][2]
+
+    def _remplir(self, polygone: list[int]) -> list[tuple[int, int, int]]:
+        """Retourne la triangulation de Delaunay du trou laissé par un sommet supprimé.
+
+        Le polygone (lien du sommet, sens trigonométrique) est découpé en
+        oreilles : une oreille convexe dont le cercle circonscrit ne contient
+        aucun autre sommet du polygone est un triangle de Delaunay. Si le
+        sommet était sur l'enveloppe, le polygone contient _INFINI : les
+        arêtes restantes après découpage forment la nouvelle enveloppe et
+        reçoivent des triangles fantômes. Pour d sommets, chacune des d
+        découpes essaie jusqu'à d oreilles contre d sommets : O(d³).
+
+        :param polygone: Sommets du lien
+        :return: Triangles créés (sens trigonométrique)
+        """
+        points = self._points
+        polygone = list(polygone)
+        triangles = []
+        while len(polygone) >= 3:
+            m = len(polygone)
+            for i in range(m):
+                a, b, c = polygone[i - 1], polygone[i], polygone[(i + 1) % m]
+                if _INFINI in (a, b, c):
+                    continue
+                pa, pb, pc = points[a], points[b], points[c]
+                if orient2d(*pa, *pb, *pc) <= 0:
+                    continue
+                if any(
+                    incircle_perturbe(*pa, *pb, *pc, *points[w]) > 0
+                    for w in polygone
+                    if w not in (a, b, c, _INFINI)
+                ):
+                    continue
+                triangles.append((a, b, c))
+                del polygone[i]
+                break
+            else:
+                break
+
+        if _INFINI in polygone:
+            m = len(polygone)
+            triangles.extend(
+                (polygone[i], polygone[(i + 1) % m], _INFINI)
+                for i in range(m)
+                if _INFINI not in (polygone[i], polygone[(i + 1) % m])
+            )
+        elif len(polygone) > 2:
+            raise ErreurTriangulation("Le trou laissé par le point supprimé n'a pas pu être re-triangulé")
+        return triangles
+
+    def _dans_cercle(self, t: int, point: tuple[float, float]) -> bool:
+        """Vérifie si un point est strictement dans le cercle circonscrit d'un triangle.
+
+        Pour un triangle fantôme (a, b, _INFINI), le « cercle » est le
+        demi-plan ouvert à gauche de a -> b, plus l'intérieur du segment [a, b].
+
+        :param t: Indice du triangle
+        :param point: Point à tester
+        :return: True si le point est dans le cercle circonscrit
+        """
+        return _dans_cercle_ou_demi_plan(self._points, self._sommets[t], point, _INFINI)
+
+    def _depart_marche(self, point: tuple[float, float]) -> int:
+        """Retourne le triangle réel d'où partir pour localiser un point (« jump and walk »).
+
+        Parmi les sommets du dernier triangle créé et environ n^(1/3) sommets
+        tirés au hasard, le plus proche du point donne le départ : la marche
+        ne traverse alors qu'environ n^(1/3) triangles en moyenne au lieu de
+        √n, et reste courte quand les points insérés se suivent.
+
+        :param point: Point à localiser
+        :return: Indice d'un triangle réel
+        """
+        points = self._points
+        px, py = point
+        meilleur = None
+        # Le dernier triangle créé reste le départ si aucun sommet tiré n'est plus proche
+        distance = min((points[v][0] - px) ** 2 + (points[v][1] - py) ** 2 for v in self._sommets[self._dernier])
+        for _ in range(round(self._nombre_points ** (1 / 3))):
+            v = random.randrange(len(points))
+            q = points[v]
+            if q is None:
+                continue
+            d = (q[0] - px) ** 2 + (q[1] - py) ** 2
+            if d < distance:
+                meilleur, distance = v, d
+
+        if meilleur is None:
+            return self._dernier
+        t = self._triangle_du_sommet[meilleur]
+        if self._sommets[t][2] == _INFINI:
+            # Triangle fantôme : le triangle réel qui borde son arête
+            t = self._voisins[t][2]
+        return t
+
+    def _localiser(self, point: tuple[float, float]) -> int:
+        """Trouve le triangle réel qui contient un point, ou le triangle fantôme par lequel il sort de l'enveloppe.
+
+        :param point: Point à localiser
+        :return: Indice du triangle
+        """
+        return _localiser_triangle(
+            self._points, self._sommets, self._voisins, self._depart_marche(point), point, _INFINI
+        )
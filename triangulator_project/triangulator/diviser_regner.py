@@ -0,0 +1,447 @@
+"""Triangulation de Delaunay par « diviser pour régner » (Guibas et Stolfi).
+
+Les points sont triés par abscisse puis ordonnée, découpés récursivement en
+deux moitiés triangulées séparément, puis les deux triangulations sont
+fusionnées en remontant de l'arête commune basse de leurs enveloppes. Le
+coût est O(n log n) dans tous les cas, quel que soit l'ordre ou la
+répartition des points, contrairement à l'insertion incrémentale.
+
+La subdivision est représentée par une structure quad-edge : chaque arête
+est un groupe de quatre arêtes orientées (l'arête, sa duale, l'arête
+inverse, la duale inverse) numérotées 4k à 4k + 3, et seul le pointeur
+« onext » de chacune est stocké, dans une liste indexée par l'arête.
+"""
+
+import multiprocessing
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from triangulator.predicates import incircle_perturbe, orient2d
+
+# Nombre minimal de points par bande en mode parallèle : en dessous, le coût
+# de démarrage des processus dépasse le gain
+TAILLE_MIN_BANDE = 2048
+
+
+def delaunay_diviser_regner(
+    points: list[tuple[float, float]],
+    progression=None,
+    pas_progression: int = 1024,
+    processus: int = 1,
+) -> list[tuple[int, int, int]]:
+    """Retourne la triangulation de Delaunay par l'algorithme de Guibas et Stolfi.
+
+    Les points doivent être distincts et non tous colinéaires.
+
+    :param points: Liste de points à trianguler
+    :param progression: Fonction appelée avec (points traités, nombre total)
+        au fil de la construction des triangulations élémentaires, puis une
+        dernière fois à la fin
+    :param pas_progression: Nombre de points traités entre deux appels de
+        ``progression``
+    :param processus: Nombre de processus ; au-delà de 1, les bandes
+        verticales sont triangulées en parallèle (voir _delaunay_parallele)
+    :return: Liste de triangles (indices dans ``points``), dans le même sens
+        de parcours (horaire) que _delaunay_triangulation
+    """
+    n = len(points)
+    tries = sorted(range(n), key=points.__getitem__)
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+
+    if processus > 1 and n >= 2 * TAILLE_MIN_BANDE:
+        triangles = _delaunay_parallele(xs, ys, tries, processus, progression)
+        if progression is not None:
+            progression(n, n)
+        return triangles
+
+    suivant: list[int] = []
+    origine: list[int] = []
+    supprimee = bytearray()
+    traites = [0]
+
+    def signaler(nombre: int) -> None:
+        avant = traites[0]
+        traites[0] += nombre
+        if progression is not None and avant // pas_progression != traites[0] // pas_progression:
+            progression(traites[0], n)
+
+    if n >= 2:
+        _construire(xs, ys, tries, 0, n, suivant, origine, supprimee, signaler=signaler)
+    if progression is not None:
+        progression(n, n)
+
+    return _extraire_triangles(xs, ys, suivant, origine, supprimee)
+
+
+def _construire(
+    xs, ys, tries, debut: int, fin: int, suivant, origine, supprimee, blocs=None, signaler=None, journal=None
+):
+    """Construit la triangulation des points ``tries[debut:fin]`` dans une subdivision.
+
+    :param xs: Abscisses des points (indexées par leur indice d'origine)
+    :param ys: Ordonnées des points
+    :param tries: Indices des points triés par abscisse puis ordonnée
+    :param debut: Début de la plage de ``tries`` à trianguler
+    :param fin: Fin (exclue) de la plage
+    :param suivant: Pointeurs onext de la subdivision, complétés sur place
+    :param origine: Origines des arêtes, complétées sur place
+    :param supprimee: Marqueurs de suppression (un octet par groupe de quatre
+        arêtes), complétés sur place
+    :param blocs: Plages déjà triangulées dans la subdivision, associées à
+        leurs arêtes d'enveloppe (ldo, rdo) ; elles ne sont alors que fusionnées
+    :param signaler: Fonction appelée avec le nombre de points de chaque
+        triangulation élémentaire construite
+    :param journal: Liste recevant le groupe de chaque arête supprimée
+    :return: Couple (ldo, rdo) : arête de l'enveloppe sortant du sommet le plus
+        à gauche dans le sens trigonométrique, arête sortant du plus à droite
+        dans le sens horaire
+    """
+    blocs = blocs or {}
+
+    def ccw(a: int, b: int, c: int) -> bool:
+        return orient2d(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) > 0
+
+    def dans_cercle(a: int, b: int, c: int, d: int) -> bool:
+        return incircle_perturbe(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], xs[d], ys[d]) > 0
+
+    def lnext(e: int) -> int:
+        # rot(onext(rot⁻¹(e)))
+        s = suivant[(e & ~3) | ((e + 3) & 3)]
+        return (s & ~3) | ((s + 1) & 3)
+
+    def oprev(e: int) -> int:
+        # rot(onext(rot(e)))
+        s = suivant[(e & ~3) | ((e + 1) & 3)]
+        return (s & ~3) | ((s + 1) & 3)
+
+    def creer_arete(a: int, b: int) -> int:
+        e = len(suivant)
+        suivant.extend((e, e + 3, e + 2, e + 1))
+        origine.extend((a, -1, b, -1))
+        supprimee.append(0)
+        return e
+
+    def raccorder(a: int, b: int) -> None:
+        # Opération « splice » : échange les anneaux onext de a et b, et ceux de leurs duales
+        sa = suivant[a]
+        sb = suivant[b]
+        alpha = (sa & ~3) | ((sa + 1) & 3)
+        beta = (sb & ~3) | ((sb + 1) & 3)
+        suivant[a] = sb
+        suivant[b] = sa
+        suivant[alpha], suivant[beta] = suivant[beta], suivant[alpha]
+
+    def relier(a: int, b: int) -> int:
+        # Nouvelle arête de la destination de a vers l'origine de b (même face à gauche)
+        e = creer_arete(origine[a ^ 2], origine[b])
+        raccorder(e, lnext(a))
+        raccorder(e ^ 2, b)
+        return e
+
+    def supprimer(e: int) -> None:
+        raccorder(e, oprev(e))
+        raccorder(e ^ 2, oprev(e ^ 2))
+        supprimee[e >> 2] = 1
+        if journal is not None:
+            journal.append(e >> 2)
+
+    def trianguler(debut: int, fin: int) -> tuple[int, int]:
+        if (debut, fin) in blocs:
+            return blocs[(debut, fin)]
+
+        taille = fin - debut
+        if taille == 2:
+            a = creer_arete(tries[debut], tries[debut + 1])
+            if signaler is not None:
+                signaler(2)
+            return a, a ^ 2
+
+        if taille == 3:
+            s1, s2, s3 = tries[debut], tries[debut + 1], tries[debut + 2]
+            a = creer_arete(s1, s2)
+            b = creer_arete(s2, s3)
+            raccorder(a ^ 2, b)
+            if signaler is not None:
+                signaler(3)
+            if ccw(s1, s2, s3):
+                relier(b, a)
+                return a, b ^ 2
+            if ccw(s1, s3, s2):
+                c = relier(b, a)
+                return c ^ 2, c
+            # Trois points alignés : deux arêtes sans triangle
+            return a, b ^ 2
+
+        milieu = (debut + fin) // 2
+        ldo, ldi = trianguler(debut, milieu)
+        rdi, rdo = trianguler(milieu, fin)
+
+        # Arête commune basse des deux enveloppes
+        while True:
+            if ccw(origine[rdi], origine[ldi], origine[ldi ^ 2]):
+                ldi = lnext(ldi)
+            elif ccw(origine[ldi], origine[rdi ^ 2], origine[rdi]):
+                rdi = suivant[rdi ^ 2]
+            else:
+                break
+
+        base = relier(rdi ^ 2, ldi)
+        if origine[ldi] == origine[ldo]:
+            ldo = base ^ 2
+        if origine[rdi] == origine[rdo]:
+            rdo = base
+
+        # Fusion : remonter la base en ajoutant à chaque pas l'arête
+        # de Delaunay vers le candidat gauche ou droit
+        while True:
+            base_org = origine[base]
+            base_dest = origine[base ^ 2]
+
+            gauche = suivant[base ^ 2]
+            gauche_valide = ccw(origine[gauche ^ 2], base_dest, base_org)
+            if gauche_valide:
+                while dans_cercle(base_dest, base_org, origine[gauche ^ 2], origine[suivant[gauche] ^ 2]):
+                    t = suivant[gauche]
+                    supprimer(gauche)
+                    gauche = t
+
+            droite = oprev(base)
+            droite_valide = ccw(origine[droite ^ 2], base_dest, base_org)
+            if droite_valide:
+                while dans_cercle(base_dest, base_org, origine[droite ^ 2], origine[oprev(droite) ^ 2]):
+                    t = oprev(droite)
+                    supprimer(droite)
+                    droite = t
+
+            if not gauche_valide and not droite_valide:
+                break
+
+            if not gauche_valide or (
+                droite_valide
+                and dans_cercle(origine[gauche ^ 2], origine[gauche], origine[droite], origine[droite ^ 2])
+            ):
+                base = relier(droite, base ^ 2)
+            else:
+                base = relier(base ^ 2, gauche ^ 2)
+
+        return ldo, rdo
+
+    return trianguler(debut, fin)
+
+
+def _extraire_triangles(
+    xs, ys, suivant, origine, supprimee, premier_groupe: int = 0, groupes=None
+) -> list[tuple[int, int, int]]:
+    """Retourne les triangles d'une subdivision, en sens horaire.
+
+    Chaque face intérieure est le cycle lnext de longueur 3, parcouru dans le
+    sens trigonométrique, à gauche de ses trois arêtes.
+
+    :param xs: Abscisses des points
+    :param ys: Ordonnées des points
+    :param suivant: Pointeurs onext de la subdivision
+    :param origine: Origines des arêtes
+    :param supprimee: Marqueurs de suppression par groupe de quatre arêtes
+    :param premier_groupe: Seules les faces bordées par une arête de groupe
+        supérieur ou égal sont retournées
+    :param groupes: Liste recevant, pour chaque triangle, les groupes de ses
+        trois arêtes (optionnel)
+    :return: Liste de triangles (indices des points)
+    """
+    def lnext(e: int) -> int:
+        s = suivant[(e & ~3) | ((e + 3) & 3)]
+        return (s & ~3) | ((s + 1) & 3)
+
+    triangles = []
+    vues = bytearray(len(suivant))
+    for groupe in range(premier_groupe, len(supprimee)):
+        if supprimee[groupe]:
+            continue
+        for e in (4 * groupe, 4 * groupe + 2):
+            if vues[e]:
+                continue
+            f = lnext(e)
+            g = lnext(f)
+            vues[e] = vues[f] = vues[g] = 1
+            if lnext(g) != e:
+                continue
+            a, b, c = origine[e], origine[f], origine[g]
+            if orient2d(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) > 0:
+                triangles.append((a, c, b))
+                if groupes is not None:
+                    groupes.append((e >> 2, f >> 2, g >> 2))
+
+    return triangles
+
+
+def _delaunay_parallele(xs, ys, tries, processus: int, progression=None) -> list[tuple[int, int, int]]:
+    """Retourne la triangulation de Delaunay en triangulant des bandes en parallèle.
+
+    Les bandes sont les plages de ``tries`` (points triés par abscisse) au
+    niveau de la récursion où elles sont au moins aussi nombreuses que les
+    processus : chacune contient le même nombre de points. Chaque processus
+    lit les coordonnées dans une mémoire partagée, triangule sa bande et en
+    extrait les triangles. Les subdivisions des bandes sont ensuite mises bout
+    à bout et fusionnées par la même étape que l'algorithme séquentiel, ce qui
+    donne exactement la triangulation de Delaunay de l'ensemble : seuls les
+    triangles dont une arête est supprimée par les fusions sont retirés, et
+    seuls ceux qui touchent une arête créée par les fusions sont ajoutés.
+
+    :param xs: Abscisses des points
+    :param ys: Ordonnées des points
+    :param tries: Indices des points triés par abscisse puis ordonnée
+    :param processus: Nombre de processus
+    :param progression: Fonction appelée avec (points traités, nombre total)
+        à la fin de chaque bande
+    :return: Liste de triangles (indices des points), en sens horaire
+    """
+    n = len(tries)
+    bandes = [(0, n)]
+    while len(bandes) < processus and (n // len(bandes)) // 2 >= TAILLE_MIN_BANDE:
+        # Mêmes coupures que la récursion de _construire : (debut + fin) // 2
+        bandes = [
+            moitie
+            for debut, fin in bandes
+            for moitie in ((debut, (debut + fin) // 2), ((debut + fin) // 2, fin))
+        ]
+
+    # Coordonnées puis ordre de tri, lus directement par les processus
+    memoire = shared_memory.SharedMemory(create=True, size=24 * n)
+    try:
+        memoire.buf[: 8 * n] = array('d', xs).tobytes()
+        memoire.buf[8 * n : 16 * n] = array('d', ys).tobytes()
+        memoire.buf[16 * n :] = array('q', tries).tobytes()
+
+        with ProcessPoolExecutor(
+            max_workers=min(processus, len(bandes)),
+            mp_context=multiprocessing.get_context('spawn'),
+        ) as executeur:
+            futures = {
+                executeur.submit(_trianguler_bande, memoire.name, n, debut, fin): (debut, fin)
+                for debut, fin in bandes
+            }
+            resultats = {}
+            traites = 0
+            for future in as_completed(futures):
+                debut, fin = futures[future]
+                resultats[debut] = future.result()
+                traites += fin - debut
+                if progression is not None:
+                    progression(traites, n)
+    finally:
+        memoire.close()
+        memoire.unlink()
+
+    # Une bande [debut, fin) possède les groupes d'arêtes [3 * debut, 3 * fin) :
+    # ses numéros d'arêtes sont déjà globaux, il suffit de copier ses tableaux
+    suivant = array('q', bytes(8 * 12 * n))
+    origine = array('q', bytes(8 * 12 * n))
+    supprimee = bytearray(b'\x01') * (3 * n)
+    blocs = {}
+    for debut, fin in bandes:
+        suivant_bande, origine_bande, supprimee_bande, ldo, rdo = resultats[debut][:5]
+        suivant[12 * debut : 12 * debut + len(suivant_bande)] = suivant_bande
+        origine[12 * debut : 12 * debut + len(origine_bande)] = origine_bande
+        supprimee[3 * debut : 3 * debut + len(supprimee_bande)] = supprimee_bande
+        blocs[(debut, fin)] = (ldo, rdo)
+
+    supprimees: list[int] = []
+    _construire(xs, ys, tries, 0, n, suivant, origine, supprimee, blocs, journal=supprimees)
+
+    # Triangles des bandes qui ont perdu une arête pendant les fusions
+    debuts = [debut for debut, _ in bandes]
+    retires = {debut: set() for debut in debuts}
+    for groupe in supprimees:
+        if groupe >= 3 * n:
+            continue
+        debut = debuts[bisect_right(debuts, groupe // 3) - 1]
+        adjacents = resultats[debut][6]
+        local = groupe - 3 * debut
+        retires[debut].update(t for t in adjacents[2 * local : 2 * local + 2] if t >= 0)
+
+    sommets = array('q')
+    for debut in debuts:
+        triangles_bande = resultats[debut][5]
+        precedent = 0
+        for t in sorted(retires[debut]):
+            sommets.extend(triangles_bande[3 * precedent : 3 * t])
+            precedent = t + 1
+        sommets.extend(triangles_bande[3 * precedent :])
+
+    # Triangles créés par les fusions : ils touchent une arête de groupe >= 3n
+    iterateur = iter(sommets)
+    triangles = list(zip(iterateur, iterateur, iterateur, strict=True))
+    triangles.extend(_extraire_triangles(xs, ys, suivant, origine, supprimee, premier_groupe=3 * n))
+    return triangles
+
+
+def _trianguler_bande(nom_memoire: str, n: int, debut: int, fin: int):
+    """Triangule une bande (exécuté dans un processus du pool).
+
+    Les groupes d'arêtes supprimés sont éliminés et les autres renumérotés à
+    partir du groupe 3 * debut, pour que les numéros soient globaux.
+
+    :param nom_memoire: Nom de la mémoire partagée (abscisses, ordonnées,
+        ordre de tri)
+    :param n: Nombre total de points
+    :param debut: Début de la bande dans l'ordre de tri
+    :param fin: Fin (exclue) de la bande
+    :return: Tuple (suivant, origine, supprimee, ldo, rdo, triangles,
+        adjacents) : subdivision de la bande, sommets de ses triangles (3 par
+        triangle) et, pour chaque groupe d'arêtes, les deux triangles qui le
+        bordent (-1 si aucun)
+    """
+    # Les processus "spawn" partagent le resource_tracker du processus
+    # principal, qui reste seul à libérer la mémoire (unlink)
+    memoire = shared_memory.SharedMemory(name=nom_memoire)
+    vue = memoire.buf
+    xs = vue[: 8 * n].cast('d')
+    ys = vue[8 * n : 16 * n].cast('d')
+    tries = vue[16 * n :].cast('q')
+    try:
+        suivant: list[int] = []
+        origine: list[int] = []
+        supprimee = bytearray()
+        ldo, rdo = _construire(xs, ys, tries, debut, fin, suivant, origine, supprimee)
+
+        # Renumérotation compacte des groupes conservés
+        premier = 3 * debut
+        nouveaux = array('q', [-1]) * len(supprimee)
+        compte = 0
+        for groupe, est_supprimee in enumerate(supprimee):
+            if not est_supprimee:
+                nouveaux[groupe] = premier + compte
+                compte += 1
+
+        def renumeroter(e: int) -> int:
+            return 4 * nouveaux[e >> 2] + (e & 3)
+
+        suivant_bande = array('q', bytes(8 * 4 * compte))
+        origine_bande = array('q', bytes(8 * 4 * compte))
+        for groupe, nouveau in enumerate(nouveaux):
+            if nouveau >= 0:
+                local = 4 * (nouveau - premier)
+                for r in range(4):
+                    suivant_bande[local + r] = renumeroter(suivant[4 * groupe + r])
+                    origine_bande[local + r] = origine[4 * groupe + r]
+
+        groupes: list[tuple[int, int, int]] = []
+        triangles = _extraire_triangles(xs, ys, suivant, origine, supprimee, groupes=groupes)
+        adjacents = array('q', [-1]) * (2 * compte)
+        for t, trio in enumerate(groupes):
+            for groupe in trio:
+                local = 2 * (nouveaux[groupe] - premier)
+                adjacents[local if adjacents[local] < 0 else local + 1] = t
+
+        sommets = array('q', [sommet for triangle in triangles for sommet in triangle])
+        return (
+            suivant_bande, origine_bande, bytes(compte), renumeroter(ldo), renumeroter(rdo), sommets, adjacents
+        )
+    finally:
+        xs.release()
+        ys.release()
+        tries.release()
+        memoire.close()
@@ -11,3 +11,41 @@ class ErreurDecodage(Exception):
     """Exception levée lorsque le décodage d'un flux binaire échoue."""
 
     pass
+
+
+class ErreurTailleExcessive(ErreurDecodage):
+    """Exception levée lorsqu'un flux dépasse la taille maximale acceptée."""
+
+    pass
+
+
+class ErreurEncodage(Exception):
+    """Exception levée lorsque l'encodage d'un résultat échoue."""
+
+    pass
+
+
+class ErreurSurcharge(Exception):
+    """Exception levée lorsque la file de calcul est pleine."""
+
+    pass
+
+
+class ErreurAnnulation(Exception):
+    """Exception levée pour interrompre un calcul dont l'annulation a été demandée."""
+
+    pass
+
+
+class ErreurPointSetManager(Exception):
+    """Exception levée lorsque le PointSetManager ne peut pas fournir un PointSet."""
+
+    def __init__(self, message: str, statut: int | None = None):
+        """Initialise l'exception.
+
+        :param message: Description de l'erreur
+        :param statut: Statut HTTP renvoyé par le PointSetManager (None si la
+            communication elle-même a échoué)
+        """
+        super().__init__(message)
+        self.statut = statut
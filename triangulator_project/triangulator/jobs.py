@@ -0,0 +1,225 @@
+"""Module de gestion des tâches de triangulation asynchrones.
+
+Une tâche est soumise, exécutée en arrière-plan par un nombre borné de
+threads, puis interrogée (état, progression) et enfin récupérée. Le calcul
+signale sa progression en appelant ``Tache.progresser``, qui interrompt le
+calcul (ErreurAnnulation) dès que l'annulation de la tâche est demandée.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from triangulator.exceptions import ErreurAnnulation, ErreurSurcharge
+
+# États d'une tâche (valeurs exposées par l'API)
+EN_ATTENTE = "pending"
+EN_COURS = "running"
+TERMINEE = "done"
+ECHOUEE = "failed"
+ANNULEE = "cancelled"
+
+ETATS_FINAUX = (TERMINEE, ECHOUEE, ANNULEE)
+
+
+class Tache:
+    """Tâche de triangulation d'un PointSet et son état d'avancement."""
+
+    def __init__(self, pointset_id: str):
+        """Initialise une tâche en attente.
+
+        :param pointset_id: L'ID du PointSet à trianguler
+        """
+        self.identifiant = uuid.uuid4().hex
+        self.pointset_id = pointset_id
+        self.etat = EN_ATTENTE
+        self.inseres = 0
+        self.total = None
+        self.resultat: bytes | None = None
+        self.erreur: dict | None = None
+        self.statut_erreur: int | None = None
+        self.fin: float | None = None
+        self._annulation = threading.Event()
+        self._future = None
+
+    def progresser(self, inseres: int, total: int) -> None:
+        """Enregistre la progression du calcul.
+
+        :param inseres: Nombre de points déjà insérés
+        :param total: Nombre total de points
+        :raises ErreurAnnulation: Si l'annulation de la tâche a été demandée
+        """
+        self.inseres = inseres
+        self.total = total
+        if self._annulation.is_set():
+            raise ErreurAnnulation(f"Tâche {self.identifiant} annulée")
+
+    def description(self) -> dict:
+        """Retourne l'état de la tâche sous forme sérialisable en JSON.
+
+        :return: Dictionnaire jobId / pointSetId / status / progress (et error
+            si la tâche a échoué)
+        """
+        description = {
+            'jobId': self.identifiant,
+            'pointSetId': self.pointset_id,
+            'status': self.etat,
+            'progress': {'inserted': self.inseres, 'total': self.total},
+        }
+        if self.erreur is not None:
+            description['error'] = self.erreur
+        return description
+
+
+class GestionnaireTaches:
+    """Exécute les tâches en arrière-plan sur un nombre borné de threads.
+
+    Au-delà de ``file_max`` tâches en attente ou en cours, les soumissions sont
+    refusées. Les tâches terminées sont oubliées ``retention`` secondes après
+    leur fin, ou plus tôt (les plus anciennes d'abord) quand elles sont plus de
+    ``conservees_max`` ou que leurs résultats dépassent ``taille_resultats_max``
+    octets au total.
+    """
+
+    def __init__(
+        self,
+        travailleurs: int = 1,
+        file_max: int = 16,
+        retention: float = 3600.0,
+        conservees_max: int = 256,
+        taille_resultats_max: int = 256 * 1024 * 1024,
+    ):
+        """Initialise le gestionnaire (les threads sont créés à la demande).
+
+        :param travailleurs: Nombre de tâches exécutées simultanément
+        :param file_max: Nombre maximal de tâches en attente ou en cours
+        :param retention: Durée de conservation d'une tâche terminée, en secondes
+        :param conservees_max: Nombre maximal de tâches terminées conservées
+        :param taille_resultats_max: Taille totale maximale des résultats
+            conservés, en octets (un résultat plus gros est oublié dès sa fin)
+        """
+        self.file_max = file_max
+        self.retention = retention
+        self.conservees_max = conservees_max
+        self.taille_resultats_max = taille_resultats_max
+        self._taches: dict[str, Tache] = {}
+        self._verrou = threading.Lock()
+        self._executeur = ThreadPoolExecutor(max_workers=travailleurs, thread_name_prefix='triangulation-job')
+
+    def soumettre(self, pointset_id: str, calcul) -> Tache:
+        """Soumet une tâche.
+
+        :param pointset_id: L'ID du PointSet à trianguler
+        :param calcul: Fonction appelée avec la tâche, retournant le couple
+            (flux Triangles, 200) ou (erreur JSON, statut HTTP)
+        :return: La tâche créée, en attente
+        :raises ErreurSurcharge: Si trop de tâches sont en attente ou en cours
+        """
+        tache = Tache(pointset_id)
+        with self._verrou:
+            self._purger()
+            actives = sum(1 for t in self._taches.values() if t.etat not in ETATS_FINAUX)
+            if actives >= self.file_max:
+                raise ErreurSurcharge(f"{actives} tâches déjà en attente ou en cours")
+            self._taches[tache.identifiant] = tache
+            tache._future = self._executeur.submit(self._executer, tache, calcul)
+        return tache
+
+    def obtenir(self, identifiant: str) -> Tache | None:
+        """Retourne une tâche, ou None si elle est inconnue (ou expirée).
+
+        :param identifiant: Identifiant de la tâche
+        :return: La tâche ou None
+        """
+        with self._verrou:
+            self._purger()
+            return self._taches.get(identifiant)
+
+    def annuler(self, identifiant: str) -> Tache | None:
+        """Demande l'annulation d'une tâche.
+
+        Une tâche en attente est annulée immédiatement ; une tâche en cours
+        s'arrête au prochain signalement de progression. Une tâche déjà
+        terminée n'est pas modifiée.
+
+        :param identifiant: Identifiant de la tâche
+        :return: La tâche, ou None si elle est inconnue
+        """
+        with self._verrou:
+            tache = self._taches.get(identifiant)
+            if tache is None or tache.etat in ETATS_FINAUX:
+                return tache
+            tache._annulation.set()
+            if tache._future.cancel():
+                self._finir(tache, ANNULEE)
+        return tache
+
+    def fermer(self) -> None:
+        """Annule les tâches en attente et arrête les threads."""
+        with self._verrou:
+            for tache in self._taches.values():
+                tache._annulation.set()
+        self._executeur.shutdown(cancel_futures=True)
+
+    def _executer(self, tache: Tache, calcul) -> None:
+        """Exécute une tâche dans un thread du gestionnaire.
+
+        :param tache: Tâche à exécuter
+        :param calcul: Fonction de calcul (voir soumettre)
+        """
+        with self._verrou:
+            if tache._annulation.is_set():
+                self._finir(tache, ANNULEE)
+                return
+            tache.etat = EN_COURS
+
+        try:
+            corps, statut = calcul(tache)
+        except ErreurAnnulation:
+            etat = ANNULEE
+        except Exception as e:
+            etat = ECHOUEE
+            tache.erreur = {'code': 'INTERNAL_ERROR', 'message': str(e)}
+            tache.statut_erreur = 500
+        else:
+            if statut == 200:
+                etat = TERMINEE
+                tache.resultat = corps
+            else:
+                etat = ECHOUEE
+                tache.erreur = corps
+                tache.statut_erreur = statut
+
+        with self._verrou:
+            self._finir(tache, etat)
+
+    def _finir(self, tache: Tache, etat: str) -> None:
+        """Enregistre l'état final d'une tâche (verrou déjà pris).
+
+        :param tache: Tâche terminée
+        :param etat: État final
+        """
+        tache.etat = etat
+        tache.fin = time.monotonic()
+        # Libérer la place d'éventuels résultats plus anciens sans attendre la prochaine requête
+        self._purger()
+
+    def _purger(self) -> None:
+        """Oublie les tâches terminées expirées ou en excès (verrou déjà pris).
+
+        Sont oubliées les tâches terminées depuis plus de ``retention``
+        secondes, puis les plus anciennes tant que les tâches terminées sont
+        trop nombreuses ou leurs résultats trop volumineux.
+        """
+        limite = time.monotonic() - self.retention
+        terminees = sorted((t for t in self._taches.values() if t.fin is not None), key=lambda t: t.fin)
+        nombre = len(terminees)
+        taille = sum(len(t.resultat) for t in terminees if t.resultat is not None)
+        for tache in terminees:
+            if tache.fin >= limite and nombre <= self.conservees_max and taille <= self.taille_resultats_max:
+                break
+            del self._taches[tache.identifiant]
+            nombre -= 1
+            if tache.resultat is not None:
+                taille -= len(tache.resultat)
@@ -0,0 +1,234 @@
+"""Module de mesure de l'activité du service.
+
+Les durées de chaque étape d'une triangulation, le nombre de points et de
+triangles traités et les erreurs par code sont agrégés en mémoire, puis
+exposés au format texte de Prometheus (endpoint /metrics). Enregistrer une
+mesure coûte une recherche dichotomique et quelques additions, sans verrou,
+pour rester sous la microseconde par étape.
+"""
+
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# Bornes des histogrammes de durée, en secondes
+BORNES_DUREES = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Bornes des histogrammes de taille (nombre de points ou de triangles)
+BORNES_TAILLES = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class Histogramme:
+    """Répartition de valeurs observées dans des intervalles aux bornes fixes."""
+
+    __slots__ = ("bornes", "comptes", "somme")
+
+    def __init__(self, bornes: tuple):
+        """Initialise un histogramme vide.
+
+        :param bornes: Bornes supérieures (incluses) des intervalles, croissantes ;
+            un dernier intervalle reçoit les valeurs au-delà
+        """
+        self.bornes = bornes
+        self.comptes = [0] * (len(bornes) + 1)
+        self.somme = 0
+
+    def observer(self, valeur) -> None:
+        """Ajoute une valeur à l'histogramme.
+
+        :param valeur: Valeur observée
+        """
+        self.comptes[bisect_left(self.bornes, valeur)] += 1
+        self.somme += valeur
+
+
+class Chronometre:
+    """Durées successives des étapes d'une requête.
+
+    Chaque étape commence à la fin de la précédente (ou à la création du
+    chronomètre) : un seul appel à perf_counter par étape.
+    """
+
+    __slots__ = ("durees", "_origine", "_debut")
+
+    def __init__(self):
+        """Démarre le chronomètre."""
+        self.durees: dict[str, float] = {}
+        self._origine = self._debut = perf_counter()
+
+    def etape(self, nom: str) -> None:
+        """Enregistre la fin d'une étape.
+
+        :param nom: Nom de l'étape
+        """
+        maintenant = perf_counter()
+        self.durees[nom] = maintenant - self._debut
+        self._debut = maintenant
+
+    def total(self) -> float:
+        """Retourne le temps écoulé depuis le démarrage du chronomètre, en secondes."""
+        return perf_counter() - self._origine
+
+    def server_timing(self) -> str:
+        """Retourne les durées au format de l'en-tête HTTP Server-Timing (en millisecondes).
+
+        :return: Valeur de l'en-tête, par exemple ``decode;dur=0.120, triangulate;dur=4.512, total;dur=4.700``
+        """
+        durees = [*self.durees.items(), ("total", self.total())]
+        return ", ".join(f"{nom};dur={duree * 1e3:.3f}" for nom, duree in durees)
+
+
+class _Series:
+    """Histogrammes et compteurs enregistrés par un thread (ou cumulés)."""
+
+    __slots__ = ("durees", "tailles", "erreurs")
+
+    def __init__(self):
+        """Initialise des séries vides."""
+        self.durees: dict[str, Histogramme] = {}
+        self.tailles: dict[str, Histogramme] = {}
+        self.erreurs: dict[str, int] = {}
+
+    def ajouter(self, autres: "_Series") -> None:
+        """Ajoute les valeurs d'autres séries à celles-ci.
+
+        Les autres séries peuvent être modifiées en même temps par leur
+        thread : seules des copies (atomiques sous le GIL) en sont lues.
+
+        :param autres: Séries à ajouter
+        """
+        for mes_histogrammes, leurs_histogrammes in ((self.durees, autres.durees), (self.tailles, autres.tailles)):
+            for nom, histogramme in list(leurs_histogrammes.items()):
+                cumul = mes_histogrammes.get(nom)
+                if cumul is None:
+                    cumul = mes_histogrammes[nom] = Histogramme(histogramme.bornes)
+                for i, compte in enumerate(list(histogramme.comptes)):
+                    cumul.comptes[i] += compte
+                cumul.somme += histogramme.somme
+        for code, nombre in list(autres.erreurs.items()):
+            self.erreurs[code] = self.erreurs.get(code, 0) + nombre
+
+
+class Metriques:
+    """Métriques agrégées du service, partagées entre les threads des requêtes.
+
+    Chaque thread enregistre dans ses propres séries, sans verrou : le verrou
+    n'est pris qu'à la première mesure d'un thread et lors de l'exposition,
+    qui additionne les séries de tous les threads. Les séries des threads
+    terminés sont cumulées dans une archive pour ne pas s'accumuler.
+    """
+
+    def __init__(self):
+        """Initialise des métriques vides."""
+        self._verrou = threading.Lock()
+        self._local = threading.local()
+        self._threads: list[tuple[threading.Thread, _Series]] = []
+        self._archive = _Series()
+
+    def observer_duree(self, etape: str, secondes: float) -> None:
+        """Enregistre la durée d'une étape.
+
+        :param etape: Nom de l'étape
+        :param secondes: Durée en secondes
+        """
+        try:
+            histogramme = self._local.series.durees[etape]
+        except (AttributeError, KeyError):
+            histogramme = self._series().durees.setdefault(etape, Histogramme(BORNES_DUREES))
+        # Histogramme.observer, sans l'appel de méthode : chemin appelé à chaque étape
+        histogramme.comptes[bisect_left(histogramme.bornes, secondes)] += 1
+        histogramme.somme += secondes
+
+    def observer_durees(self, chronometre: Chronometre) -> None:
+        """Enregistre toutes les durées d'un chronomètre.
+
+        :param chronometre: Chronomètre d'une requête
+        """
+        for etape, secondes in chronometre.durees.items():
+            self.observer_duree(etape, secondes)
+
+    def observer_taille(self, nom: str, valeur: int) -> None:
+        """Enregistre une taille (nombre de points ou de triangles).
+
+        :param nom: Nom de la grandeur (``points`` ou ``triangles``)
+        :param valeur: Valeur observée
+        """
+        self._series().tailles.setdefault(nom, Histogramme(BORNES_TAILLES)).observer(valeur)
+
+    def compter_erreur(self, code: str) -> None:
+        """Compte une réponse en erreur.
+
+        :param code: Code d'erreur de la réponse JSON (par exemple ``NOT_FOUND``)
+        """
+        erreurs = self._series().erreurs
+        erreurs[code] = erreurs.get(code, 0) + 1
+
+    def exposition(self) -> str:
+        """Retourne les métriques au format texte d'exposition de Prometheus.
+
+        :return: Texte des métriques, une ligne par série
+        """
+        total = _Series()
+        with self._verrou:
+            self._archiver()
+            total.ajouter(self._archive)
+            for _, series in self._threads:
+                total.ajouter(series)
+
+        lignes = [
+            "# HELP triangulator_stage_duration_seconds Durée de chaque étape d'une triangulation.",
+            "# TYPE triangulator_stage_duration_seconds histogram",
+        ]
+        for etape, histogramme in sorted(total.durees.items()):
+            _lignes_histogramme(lignes, "triangulator_stage_duration_seconds", f'stage="{etape}"', histogramme)
+
+        for nom, histogramme in sorted(total.tailles.items()):
+            metrique = f"triangulator_{nom}"
+            lignes.append(f"# HELP {metrique} Nombre de {nom} par triangulation servie.")
+            lignes.append(f"# TYPE {metrique} histogram")
+            _lignes_histogramme(lignes, metrique, "", histogramme)
+
+        lignes.append("# HELP triangulator_errors_total Réponses en erreur, par code.")
+        lignes.append("# TYPE triangulator_errors_total counter")
+        for code, nombre in sorted(total.erreurs.items()):
+            lignes.append(f'triangulator_errors_total{{code="{code}"}} {nombre}')
+
+        return "\n".join(lignes) + "\n"
+
+    def _series(self) -> _Series:
+        """Retourne les séries du thread courant, créées à sa première mesure."""
+        series = getattr(self._local, "series", None)
+        if series is None:
+            series = self._local.series = _Series()
+            with self._verrou:
+                self._archiver()
+                self._threads.append((threading.current_thread(), series))
+        return series
+
+    def _archiver(self) -> None:
+        """Cumule dans l'archive les séries des threads terminés (verrou déjà pris)."""
+        vivants = []
+        for thread, series in self._threads:
+            if thread.is_alive():
+                vivants.append((thread, series))
+            else:
+                self._archive.ajouter(series)
+        self._threads = vivants
+
+
+def _lignes_histogramme(lignes: list[str], nom: str, etiquettes: str, histogramme: Histogramme) -> None:
+    """Ajoute les séries _bucket (cumulées), _sum et _count d'un histogramme.
+
+    :param lignes: Lignes du texte d'exposition, complétées sur place
+    :param nom: Nom de la métrique
+    :param etiquettes: Étiquettes communes aux séries (par exemple ``stage="decode"``), éventuellement vides
+    :param histogramme: Histogramme à exposer
+    """
+    prefixe = f"{etiquettes}," if etiquettes else ""
+    cumul = 0
+    for borne, compte in zip((*histogramme.bornes, "+Inf"), histogramme.comptes, strict=True):
+        cumul += compte
+        lignes.append(f'{nom}_bucket{{{prefixe}le="{borne}"}} {cumul}')
+    suffixe = f"{{{etiquettes}}}" if etiquettes else ""
+    lignes.append(f"{nom}_sum{suffixe} {histogramme.somme}")
+    lignes.append(f"{nom}_count{suffixe} {cumul}")
@@ -0,0 +1,245 @@
+"""Client HTTP du PointSetManager (contrat point_set_manager.yml).
+
+Implémente ``GET /pointset/{pointSetId}`` avec :
+- un pool de connexions persistantes (keep-alive), réutilisées d'une requête
+  à l'autre au lieu d'ouvrir une connexion TCP par PointSet ;
+- des délais de connexion et de lecture configurables ;
+- des nouvelles tentatives avec attente exponentielle sur les erreurs
+  transitoires (connexion, 503) ;
+- une récupération groupée de plusieurs PointSet en parallèle ;
+- un décodage au fil de la réception (``get_pointset_points``), qui se
+  superpose au transfert réseau au lieu de commencer après lui.
+
+Le client respecte l'interface attendue par create_app : ``get_pointset(id)``
+retourne le flux binaire, None si le PointSet n'existe pas (404), et lève
+ErreurPointSetManager sinon.
+"""
+
+import http.client
+import json
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+from triangulator.exceptions import ErreurPointSetManager
+from triangulator.serializers import DecodeurPointSet
+
+# Statuts HTTP pour lesquels une nouvelle tentative a une chance d'aboutir
+_STATUTS_TRANSITOIRES = (502, 503, 504)
+
+
+class PointSetClient:
+    """Client du PointSetManager avec pool de connexions persistantes."""
+
+    def __init__(
+        self,
+        url_base: str,
+        taille_pool: int = 10,
+        timeout_connexion: float = 2.0,
+        timeout_lecture: float = 10.0,
+        tentatives: int = 3,
+        delai_initial: float = 0.05,
+        points_max: int = 10_000_000,
+    ):
+        """Initialise le client (aucune connexion n'est ouverte d'avance).
+
+        :param url_base: URL du PointSetManager, par exemple "http://psm:8080"
+        :param taille_pool: Nombre maximal de connexions simultanées
+        :param timeout_connexion: Délai maximal d'établissement d'une connexion (s)
+        :param timeout_lecture: Délai maximal d'attente des données (s)
+        :param tentatives: Nombre total d'essais pour les erreurs transitoires
+        :param delai_initial: Attente avant le deuxième essai, doublée ensuite (s)
+        :param points_max: Nombre maximal de points accepté par
+            get_pointset_points, quel que soit l'en-tête reçu
+        """
+        url = urlsplit(url_base)
+        if url.scheme not in ('http', 'https') or not url.hostname:
+            raise ValueError(f"URL du PointSetManager invalide : {url_base!r}")
+
+        self._classe_connexion = (
+            http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        )
+        self._hote = url.hostname
+        self._port = url.port
+        self._prefixe = url.path.rstrip('/')
+        self.timeout_connexion = timeout_connexion
+        self.timeout_lecture = timeout_lecture
+        self.tentatives = max(1, tentatives)
+        self.delai_initial = delai_initial
+        self.taille_pool = taille_pool
+        self.points_max = points_max
+
+        # Connexions libres (la plus récente d'abord : c'est la moins
+        # susceptible d'avoir été fermée par le serveur)
+        self._libres: queue.LifoQueue = queue.LifoQueue()
+        self._places = threading.BoundedSemaphore(taille_pool)
+
+    def get_pointset(self, pointset_id: str) -> bytes | None:
+        """Récupère le flux binaire d'un PointSet.
+
+        :param pointset_id: L'ID du PointSet
+        :return: Flux binaire du PointSet, ou None s'il n'existe pas
+        :raises ErreurPointSetManager: Si le PointSetManager refuse la requête
+            ou reste injoignable après toutes les tentatives
+        """
+        return self._recuperer(pointset_id, _lire_corps)
+
+    def get_pointset_points(
+        self, pointset_id: str, taille_morceau: int = 64 * 1024
+    ) -> list[tuple[float, float]] | None:
+        """Récupère un PointSet en le décodant au fur et à mesure de sa réception.
+
+        :param pointset_id: L'ID du PointSet
+        :param taille_morceau: Nombre d'octets lus à la fois sur la connexion
+        :return: Liste de tuples (x, y), ou None si le PointSet n'existe pas
+        :raises ErreurDecodage: Si le flux reçu est invalide ou tronqué
+        :raises ErreurTailleExcessive: Si le PointSet annonce plus de
+            ``points_max`` points
+        :raises ErreurPointSetManager: Si le PointSetManager refuse la requête
+            ou reste injoignable après toutes les tentatives
+        """
+        def lire_points(reponse):
+            if reponse.status != 200:
+                return reponse.read()
+            # Content-Length (absent si la réponse est découpée) permet de
+            # rejeter dès l'en-tête un flux trop court
+            decodeur = DecodeurPointSet(taille_totale=reponse.length, nombre_points_max=self.points_max)
+            while morceau := reponse.read(taille_morceau):
+                decodeur.ajouter(morceau)
+            return decodeur.terminer()
+
+        return self._recuperer(pointset_id, lire_points)
+
+    def get_pointsets(self, pointset_ids: list[str]) -> dict[str, bytes | None | ErreurPointSetManager]:
+        """Récupère plusieurs PointSet en parallèle sur les connexions du pool.
+
+        :param pointset_ids: IDs des PointSet
+        :return: Pour chaque ID, le flux binaire, None (404) ou l'erreur rencontrée
+        """
+        def recuperer(pointset_id):
+            try:
+                return self.get_pointset(pointset_id)
+            except ErreurPointSetManager as e:
+                return e
+
+        ids = list(dict.fromkeys(pointset_ids))
+        if not ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.taille_pool, len(ids))) as executor:
+            return dict(zip(ids, executor.map(recuperer, ids), strict=True))
+
+    def fermer(self) -> None:
+        """Ferme toutes les connexions libres du pool."""
+        while True:
+            try:
+                self._libres.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _recuperer(self, pointset_id: str, lire):
+        """Exécute GET /pointset/{id} avec nouvelles tentatives sur les erreurs transitoires.
+
+        :param pointset_id: L'ID du PointSet
+        :param lire: Fonction lisant le corps d'une réponse
+        :return: Corps lu en cas de succès, ou None si le PointSet n'existe pas
+        :raises ErreurPointSetManager: Si le PointSetManager refuse la requête
+            ou reste injoignable après toutes les tentatives
+        """
+        chemin = f"{self._prefixe}/pointset/{quote(pointset_id, safe='')}"
+        delai = self.delai_initial
+
+        for essai in range(1, self.tentatives + 1):
+            try:
+                statut, corps = self._requete('GET', chemin, lire)
+            except (OSError, http.client.HTTPException) as e:
+                erreur = ErreurPointSetManager(f"PointSetManager injoignable : {e}")
+            else:
+                if statut == 200:
+                    return corps
+                if statut == 404:
+                    return None
+                erreur = ErreurPointSetManager(
+                    f"PointSetManager a répondu {statut} : {_message_erreur(corps)}", statut
+                )
+                if statut not in _STATUTS_TRANSITOIRES:
+                    raise erreur
+
+            if essai < self.tentatives:
+                time.sleep(delai)
+                delai *= 2
+
+        raise erreur
+
+    def _requete(self, methode: str, chemin: str, lire=None) -> tuple[int, object]:
+        """Envoie une requête sur une connexion du pool et lit toute la réponse.
+
+        :param methode: Méthode HTTP
+        :param chemin: Chemin de la ressource
+        :param lire: Fonction lisant le corps de la réponse (par défaut, tout
+            le corps en bytes) ; elle doit consommer le corps entièrement
+        :return: Couple (statut HTTP, corps de la réponse lu par ``lire``)
+        """
+        lire = lire or _lire_corps
+        with self._places:
+            while True:
+                connexion, reutilisee = self._prendre_connexion()
+                try:
+                    connexion.request(methode, chemin, headers={'Connection': 'keep-alive'})
+                    reponse = connexion.getresponse()
+                    corps = lire(reponse)
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    connexion.close()
+                    # Le serveur a fermé une connexion restée inactive dans le
+                    # pool : réessayer aussitôt sur une connexion neuve
+                    if reutilisee:
+                        continue
+                    raise
+                except BaseException:
+                    connexion.close()
+                    raise
+
+                if reponse.will_close:
+                    connexion.close()
+                else:
+                    self._libres.put(connexion)
+                return reponse.status, corps
+
+    def _prendre_connexion(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Retourne une connexion libre du pool, ou en ouvre une nouvelle.
+
+        :return: Couple (connexion prête à envoyer une requête, True si elle
+            provient du pool)
+        """
+        try:
+            return self._libres.get_nowait(), True
+        except queue.Empty:
+            pass
+
+        connexion = self._classe_connexion(self._hote, self._port, timeout=self.timeout_connexion)
+        connexion.connect()
+        connexion.sock.settimeout(self.timeout_lecture)
+        return connexion, False
+
+
+def _lire_corps(reponse: http.client.HTTPResponse) -> bytes:
+    """Retourne le corps complet d'une réponse.
+
+    :param reponse: Réponse HTTP
+    :return: Corps de la réponse
+    """
+    return reponse.read()
+
+
+def _message_erreur(corps: bytes) -> str:
+    """Extrait le message d'une réponse d'erreur JSON du PointSetManager.
+
+    :param corps: Corps de la réponse
+    :return: Message lisible
+    """
+    try:
+        erreur = json.loads(corps)
+        return f"{erreur['code']} - {erreur['message']}"
+    except (ValueError, KeyError, TypeError):
+        return corps[:200].decode('utf-8', errors='replace')
@@ -0,0 +1,184 @@
+"""Prédicats géométriques robustes : orientation et cercle circonscrit.
+
+Les deux prédicats suivent l'approche adaptative de Shewchuk :
+- un filtre flottant calcule le déterminant habituel et une borne de l'erreur
+  d'arrondi ; si le déterminant dépasse cette borne, son signe est sûr et il
+  est retourné tel quel (cas courant, aussi rapide qu'un simple déterminant) ;
+- sinon le déterminant est recalculé exactement (les flottants sont convertis
+  sans perte en entiers), ce qui tranche les cas dégénérés ou presque.
+
+incircle_perturbe départage en plus les points cocycliques par perturbation
+symbolique, pour que la triangulation des grilles régulières soit unique.
+
+Seul le signe du résultat a un sens.
+"""
+
+# Précision machine des flottants double précision (arrondi au plus proche)
+_EPSILON = 2.0 ** -53
+
+# Bornes d'erreur relatives des filtres (Shewchuk, « ccwerrboundA » et « iccerrboundA »)
+ERREUR_ORIENTATION = (3.0 + 16.0 * _EPSILON) * _EPSILON
+ERREUR_CERCLE = (10.0 + 96.0 * _EPSILON) * _EPSILON
+
+# En deçà de cette somme des produits (ou de ce permanent pour le cercle), ceux-ci
+# peuvent avoir perdu leur précision relative (nombres sous-normaux) : la borne
+# relative du filtre ne vaut plus
+_SOMME_MIN_ORIENTATION = 2.0**-1022 / ERREUR_ORIENTATION
+_PERMANENT_MIN_CERCLE = 2.0**-1022 / ERREUR_CERCLE
+
+
+def orient2d(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Retourne le signe de l'orientation du triangle (a, b, c).
+
+    :return: Valeur positive si (a, b, c) tourne dans le sens trigonométrique,
+        négative dans le sens horaire, nulle si les points sont exactement alignés
+    """
+    gauche = (ax - cx) * (by - cy)
+    droite = (ay - cy) * (bx - cx)
+    det = gauche - droite
+
+    # Si les deux produits sont de signes opposés (ou nuls), le signe d'un
+    # déterminant non nul est exact ; un déterminant nul peut venir de produits
+    # sous-normaux arrondis à zéro et doit être recalculé
+    if gauche > 0:
+        if droite <= 0:
+            return det
+        somme = gauche + droite
+    elif gauche < 0:
+        if droite >= 0:
+            return det
+        somme = -gauche - droite
+    elif det != 0:
+        return det
+    else:
+        return _orient2d_exact(ax, ay, bx, by, cx, cy)
+
+    borne = ERREUR_ORIENTATION * somme
+    if (det >= borne or -det >= borne) and somme >= _SOMME_MIN_ORIENTATION:
+        return det
+    return _orient2d_exact(ax, ay, bx, by, cx, cy)
+
+
+def incircle(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float, dx: float, dy: float
+) -> float:
+    """Retourne le signe du test du cercle circonscrit de (a, b, c) pour le point d.
+
+    :return: Valeur positive si d est strictement dans le cercle passant par a,
+        b et c lorsque (a, b, c) tourne dans le sens trigonométrique (signe
+        inversé dans le sens horaire), nulle si les quatre points sont cocycliques
+    """
+    adx = ax - dx
+    ady = ay - dy
+    bdx = bx - dx
+    bdy = by - dy
+    cdx = cx - dx
+    cdy = cy - dy
+
+    bdxcdy = bdx * cdy
+    cdxbdy = cdx * bdy
+    alift = adx * adx + ady * ady
+
+    cdxady = cdx * ady
+    adxcdy = adx * cdy
+    blift = bdx * bdx + bdy * bdy
+
+    adxbdy = adx * bdy
+    bdxady = bdx * ady
+    clift = cdx * cdx + cdy * cdy
+
+    det = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+
+    permanent = (
+        (abs(bdxcdy) + abs(cdxbdy)) * alift
+        + (abs(cdxady) + abs(adxcdy)) * blift
+        + (abs(adxbdy) + abs(bdxady)) * clift
+    )
+    borne = ERREUR_CERCLE * permanent
+    if (det > borne or -det > borne) and permanent >= _PERMANENT_MIN_CERCLE:
+        return det
+    return _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def _entiers(*valeurs: float) -> list[int]:
+    """Convertit des flottants en entiers exacts, à un facteur commun positif près.
+
+    Chaque flottant est une fraction dont le dénominateur est une puissance de
+    deux : en les ramenant au plus grand de ces dénominateurs, les déterminants
+    homogènes peuvent être calculés en arithmétique entière exacte, bien plus
+    vite qu'avec des Fraction.
+
+    :param valeurs: Flottants finis
+    :return: Entiers proportionnels aux valeurs
+    """
+    ratios = [v.as_integer_ratio() for v in valeurs]
+    commun = max(d for _, d in ratios)
+    return [n * (commun // d) for n, d in ratios]
+
+
+def incircle_perturbe(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float, dx: float, dy: float
+) -> float:
+    """Retourne le signe du test du cercle, départagé par perturbation symbolique si les points sont cocycliques.
+
+    Chaque point est relevé sur le paraboloïde z = x² + y² puis sa hauteur est
+    augmentée de ε^r, où r est le rang du point dans l'ordre lexicographique
+    des coordonnées et ε un infinitésimal. Le déterminant devient
+    incircle + Σ coef(p) · ε^r(p), où coef(p) est, au signe près,
+    l'orientation des trois autres points : pour quatre points cocycliques,
+    le signe est celui du premier coefficient non nul dans l'ordre des rangs.
+    Le résultat ne dépend que des coordonnées : toute triangulation qui
+    utilise ce prédicat est la même, quel que soit l'ordre d'insertion.
+
+    :return: Même convention que incircle, jamais nulle sauf si les quatre
+        points sont alignés ou si deux d'entre eux sont confondus
+    """
+    det = incircle(ax, ay, bx, by, cx, cy, dx, dy)
+    if det != 0:
+        return det
+
+    sommets = sorted(((ax, ay), (bx, by), (cx, cy), (dx, dy)))
+    if sommets[0] == sommets[1] or sommets[1] == sommets[2] or sommets[2] == sommets[3]:
+        return det
+
+    for p in sommets:
+        if p == (ax, ay):
+            coef = orient2d(dx, dy, bx, by, cx, cy)
+        elif p == (bx, by):
+            coef = orient2d(ax, ay, dx, dy, cx, cy)
+        elif p == (cx, cy):
+            coef = orient2d(ax, ay, bx, by, dx, dy)
+        else:
+            coef = -orient2d(ax, ay, bx, by, cx, cy)
+        if coef != 0:
+            return coef
+    return 0.0
+
+
+def _orient2d_exact(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Retourne exactement le signe de orient2d.
+
+    :return: 1.0, -1.0 ou 0.0
+    """
+    ax, ay, bx, by, cx, cy = _entiers(ax, ay, bx, by, cx, cy)
+    det = (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+    return float((det > 0) - (det < 0))
+
+
+def _incircle_exact(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float, dx: float, dy: float
+) -> float:
+    """Retourne exactement le signe de incircle.
+
+    :return: 1.0, -1.0 ou 0.0
+    """
+    ax, ay, bx, by, cx, cy, dx, dy = _entiers(ax, ay, bx, by, cx, cy, dx, dy)
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    det = (
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+    return float((det > 0) - (det < 0))
@@ -0,0 +1,177 @@
+"""Module de profilage à la demande des requêtes de triangulation.
+
+Un profil est capturé pour une seule requête, quand elle le demande (en-tête
+``X-Profile``) ou quand la configuration l'impose, au plus une fois par
+intervalle de temps et jamais deux à la fois. Deux modes sont proposés :
+
+- ``cprofile`` : profil déterministe de cProfile, téléchargeable au format
+  pstats (lisible par ``pstats.Stats`` ou snakeviz) ;
+- ``sampling`` : piles du thread de la requête relevées périodiquement,
+  téléchargeables au format « collapsed stacks » (flamegraph.pl, speedscope).
+
+Seul le thread de la requête est profilé : un calcul délégué au pool de
+processus n'apparaît que comme une attente.
+"""
+
+import cProfile
+import marshal
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+
+# Modes de profilage (valeurs de l'en-tête X-Profile)
+MODES = ("cprofile", "sampling")
+
+
+class Profil:
+    """Profil capturé pendant une requête."""
+
+    def __init__(self, mode: str):
+        """Initialise un profil vide.
+
+        :param mode: Mode de profilage (voir MODES)
+        """
+        self.identifiant = uuid.uuid4().hex
+        self.mode = mode
+        self.contenu: bytes | None = None
+
+    @property
+    def type_mime(self) -> str:
+        """Retourne le type MIME du contenu téléchargeable."""
+        return "application/octet-stream" if self.mode == "cprofile" else "text/plain; charset=utf-8"
+
+    @property
+    def nom_fichier(self) -> str:
+        """Retourne le nom de fichier proposé au téléchargement."""
+        return f"profile-{self.identifiant}.{'pstats' if self.mode == 'cprofile' else 'folded'}"
+
+
+class _Echantillonneur(threading.Thread):
+    """Thread relevant périodiquement la pile d'un autre thread."""
+
+    def __init__(self, ident: int, periode: float):
+        """Initialise l'échantillonneur (démarré par start).
+
+        :param ident: Identifiant du thread à observer
+        :param periode: Intervalle entre deux relevés, en secondes
+        """
+        super().__init__(name="triangulation-profilage", daemon=True)
+        self.ident_cible = ident
+        self.periode = periode
+        self.piles: Counter[str] = Counter()
+        self._arret = threading.Event()
+
+    def run(self) -> None:
+        """Relève la pile du thread observé jusqu'à l'arrêt."""
+        while not self._arret.wait(self.periode):
+            frame = sys._current_frames().get(self.ident_cible)
+            pile = []
+            while frame is not None:
+                pile.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            if pile:
+                self.piles[";".join(reversed(pile))] += 1
+
+    def arreter(self) -> str:
+        """Arrête les relevés.
+
+        :return: Piles au format « collapsed stacks » : une ligne
+            ``appelant;...;appelé nombre`` par pile distincte
+        """
+        self._arret.set()
+        self.join()
+        return "".join(f"{pile} {nombre}\n" for pile, nombre in self.piles.most_common())
+
+
+class Profileur:
+    """Capture et conserve les profils de requêtes, à débit limité."""
+
+    def __init__(
+        self,
+        intervalle: float = 60.0,
+        conservation: int = 16,
+        automatique: str | None = None,
+        periode: float = 0.001,
+    ):
+        """Initialise le profileur.
+
+        :param intervalle: Délai minimal entre deux profils, en secondes
+        :param conservation: Nombre de profils conservés (les plus anciens
+            sont oubliés)
+        :param automatique: Mode appliqué aux requêtes sans en-tête
+            X-Profile (None : seules les requêtes qui le demandent sont
+            profilées)
+        :param periode: Intervalle entre deux relevés de pile en mode
+            ``sampling``, en secondes
+        :raises ValueError: Si le mode automatique est inconnu
+        """
+        if automatique is not None and automatique not in MODES:
+            raise ValueError(f"Mode de profilage inconnu : {automatique}")
+        self.intervalle = intervalle
+        self.conservation = conservation
+        self.automatique = automatique
+        self.periode = periode
+        self._profils: OrderedDict[str, Profil] = OrderedDict()
+        self._verrou = threading.Lock()
+        self._en_cours = False
+        self._prochain = 0.0
+
+    def demarrer(self, mode: str):
+        """Démarre le profilage du thread courant, si le débit le permet.
+
+        :param mode: Mode de profilage (voir MODES)
+        :return: Jeton à passer à terminer, ou None si un profil est déjà en
+            cours ou trop récent
+        :raises ValueError: Si le mode est inconnu
+        """
+        if mode not in MODES:
+            raise ValueError(f"Mode de profilage inconnu : {mode}")
+
+        with self._verrou:
+            maintenant = time.monotonic()
+            if self._en_cours or maintenant < self._prochain:
+                return None
+            self._en_cours = True
+            self._prochain = maintenant + self.intervalle
+
+        profil = Profil(mode)
+        if mode == "cprofile":
+            capture = cProfile.Profile()
+            capture.enable()
+        else:
+            capture = _Echantillonneur(threading.get_ident(), self.periode)
+            capture.start()
+        return profil, capture
+
+    def terminer(self, jeton) -> Profil:
+        """Arrête un profilage et conserve son résultat.
+
+        :param jeton: Jeton retourné par demarrer
+        :return: Profil capturé
+        """
+        profil, capture = jeton
+        if profil.mode == "cprofile":
+            capture.disable()
+            capture.create_stats()
+            # Même contenu que Profile.dump_stats, sans passer par un fichier
+            profil.contenu = marshal.dumps(capture.stats)
+        else:
+            profil.contenu = capture.arreter().encode("utf-8")
+
+        with self._verrou:
+            self._en_cours = False
+            self._profils[profil.identifiant] = profil
+            while len(self._profils) > self.conservation:
+                self._profils.popitem(last=False)
+        return profil
+
+    def obtenir(self, identifiant: str) -> Profil | None:
+        """Retourne un profil conservé.
+
+        :param identifiant: Identifiant du profil
+        :return: Le profil, ou None s'il est inconnu ou oublié
+        """
+        with self._verrou:
+            return self._profils.get(identifiant)
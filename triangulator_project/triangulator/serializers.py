@@ -9,8 +9,20 @@ Structure du binaire choisi:
 """
 
 import struct
+import sys
+from array import array
+from itertools import chain
 
-from triangulator.exceptions import ErreurDecodage
+from triangulator.exceptions import ErreurDecodage, ErreurTailleExcessive
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : seuls les tableaux et les vues en profitent
+    np = None
+
+# Nombre d'éléments (sommets ou triangles) encodés par morceau en streaming :
+# 64 Kio de sommets, 96 Kio d'indices
+ELEMENTS_PAR_MORCEAU = 8192
 
 
 def encoder_pointset(points: list[tuple[float, float]]) -> bytes:
@@ -22,15 +34,16 @@ def encoder_pointset(points: list[tuple[float, float]]) -> bytes:
     > : big-endian (ordre des octets de poids fort en premier).
     I : entier non signé (unsigned int) sur 4 octets.
 
-    :param points: Liste de tuples (x, y)
+    Le flux est écrit en une seule passe dans un bytearray de taille connue
+    d'avance, au lieu d'être reconstruit à chaque point.
+
+    :param points: Liste de tuples (x, y) ou tableau NumPy (N, 2)
     :return: Flux binaire encodé
     """
-    flux = struct.pack('>I', len(points))
-
-    for x, y in points:
-        # "ff" = 2 flottants 32 bits
-        flux += struct.pack('>ff', x, y)
-    return flux
+    flux = bytearray(4 + len(points) * 8)
+    struct.pack_into('>I', flux, 0, len(points))
+    _ecrire_coordonnees(flux, 4, points)
+    return bytes(flux)
 
 
 def decoder_pointset(flux: bytes) -> list[tuple[float, float]]:
@@ -40,13 +53,63 @@ def decoder_pointset(flux: bytes) -> list[tuple[float, float]]:
     :return: Liste de tuples (x, y)
     :raises ErreurDecodage: Si le flux est invalide ou corrompu
     """
+    nombre_points = _lire_nombre_points(flux)
+
+    try:
+        # Chaque point = 8 octets → 4 pour X + 4 pour Y, lus sans recopier le flux
+        corps = memoryview(flux)[4 : 4 + nombre_points * 8]
+        points = list(struct.iter_unpack('>ff', corps))
+    except struct.error as e:
+        raise ErreurDecodage(
+            f"Erreur lors du décodage des points : {e}"
+        ) from e
+
+    return points
+
+
+def decoder_pointset_vue(flux: bytes):
+    """Décode un flux binaire sans créer d'objet par point.
+
+    Avec NumPy, retourne une vue en lecture seule de forme (N, 2) sur le flux
+    lui-même (dtype '>f4'), sans aucune copie. Sans NumPy, retourne un
+    memoryview de format 'f' et de forme (N, 2) : sur une machine big-endian
+    il porte directement sur le flux, sinon sur une seule copie permutée
+    (array.byteswap) des coordonnées.
+
+    :param flux: bytes provenant du PointSetManager
+    :return: Vue (N, 2) sur les coordonnées float32
+    :raises ErreurDecodage: Si le flux est invalide ou corrompu
+    """
+    nombre_points = _lire_nombre_points(flux)
+
+    if np is not None:
+        vue = np.frombuffer(flux, dtype='>f4', count=nombre_points * 2, offset=4).reshape(-1, 2)
+        vue.flags.writeable = False
+        return vue
+
+    corps = memoryview(flux)[4 : 4 + nombre_points * 8]
+    if sys.byteorder == 'little':
+        coordonnees = array('f')
+        coordonnees.frombytes(corps)
+        coordonnees.byteswap()
+        corps = memoryview(coordonnees).cast('B')
+    return corps.cast('f', (nombre_points, 2)).toreadonly()
+
+
+def _lire_nombre_points(flux: bytes) -> int:
+    """Lit et valide l'en-tête d'un flux PointSet.
+
+    :param flux: bytes provenant du PointSetManager
+    :return: Nombre de points annoncé par l'en-tête
+    :raises ErreurDecodage: Si le flux est trop court ou incomplet
+    """
     # Validation : le flux doit contenir au moins 4 octets (pour le nombre de points)
     if len(flux) < 4:
         raise ErreurDecodage("Flux trop court : au moins 4 octets sont nécessaires")
 
     try:
         # Lire le nombre de points dans les 4 premiers octets
-        nombre_points = struct.unpack('>I', flux[:4])[0]
+        nombre_points = struct.unpack_from('>I', flux)[0]
     except struct.error as e:
         raise ErreurDecodage(
             f"Erreur lors du décodage du nombre de points : {e}"
@@ -59,22 +122,131 @@ def decoder_pointset(flux: bytes) -> list[tuple[float, float]]:
             f"Flux incomplet : {len(flux)} octets reçus, {taille_attendue} attendus"
         )
 
-    points = []
-    # Chaque point = 8 octets → 4 pour X + 4 pour Y
-    offset = 4  # on commence juste après le nombre de points
+    return nombre_points
 
-    try:
-        for _ in range(nombre_points):
-            # Lire 8 octets = 2 floats
-            x, y = struct.unpack('>ff', flux[offset : offset + 8])
-            points.append((x, y))
-            offset += 8
-    except struct.error as e:
-        raise ErreurDecodage(
-            f"Erreur lors du décodage des points : {e}"
-        ) from e
 
-    return points
+class DecodeurPointSet:
+    """Décodeur incrémental d'un flux PointSet reçu par morceaux.
+
+    Les morceaux sont passés à ``ajouter`` au fur et à mesure de leur
+    réception (par exemple en lisant une réponse HTTP) : l'en-tête est validé
+    dès ses 4 premiers octets, puis les coordonnées sont converties et rangées
+    dans un tableau float32, sans garder le flux brut. Le tableau grandit avec
+    les données reçues : un en-tête annonçant des milliards de points ne
+    provoque pas d'allocation à lui seul. Les octets au-delà des points
+    annoncés sont ignorés, comme pour decoder_pointset.
+
+    Sans conversion, seule la structure du flux est validée (en-tête, nombre
+    d'octets) : ``verifier`` remplace alors ``terminer``, par exemple quand le
+    flux brut est transmis tel quel à un autre processus.
+    """
+
+    def __init__(
+        self, taille_totale: int | None = None, nombre_points_max: int | None = None, convertir: bool = True
+    ):
+        """Initialise le décodeur.
+
+        :param taille_totale: Taille totale du flux si elle est connue (par
+            exemple l'en-tête Content-Length), pour rejeter dès l'en-tête un
+            flux qui ne pourra pas être complet
+        :param nombre_points_max: Nombre maximal de points accepté (aucune
+            limite si None)
+        :param convertir: False pour seulement compter les octets des
+            coordonnées, sans les convertir (terminer n'est alors pas disponible)
+        """
+        self.taille_totale = taille_totale
+        self.nombre_points_max = nombre_points_max
+        self.convertir = convertir
+        self.nombre_points: int | None = None
+        self._entete = bytearray()
+        self._octets = 0  # Octets de coordonnées reçus
+        self._coordonnees = array('f')  # Coordonnées déjà converties
+        self._reste = b''  # Octets d'une coordonnée incomplète
+
+    def ajouter(self, morceau: bytes) -> None:
+        """Décode un nouveau morceau du flux.
+
+        :param morceau: Octets reçus, à la suite des précédents
+        :raises ErreurDecodage: Si l'en-tête annonce un flux invalide
+        :raises ErreurTailleExcessive: Si l'en-tête annonce plus de points que
+            la limite
+        """
+        vue = memoryview(morceau)
+
+        if self.nombre_points is None:
+            manquant = 4 - len(self._entete)
+            self._entete += vue[:manquant]
+            vue = vue[manquant:]
+            if len(self._entete) < 4:
+                return
+            self._lire_entete()
+
+        # Ne garder que les octets des coordonnées encore attendues
+        vue = vue[:self.nombre_points * 8 - self._octets]
+        self._octets += len(vue)
+        if not self.convertir:
+            return
+
+        donnees = self._reste + vue if self._reste else vue
+        complet = len(donnees) - len(donnees) % 4
+        self._reste = bytes(donnees[complet:])
+        if not complet:
+            return
+
+        bloc = array('f')
+        bloc.frombytes(donnees[:complet])
+        if sys.byteorder == 'little':
+            bloc.byteswap()
+        self._coordonnees += bloc
+
+    def verifier(self) -> None:
+        """Vérifie que le flux a été entièrement reçu, sans construire les points.
+
+        :raises ErreurDecodage: Si le flux reçu est incomplet
+        """
+        if self.nombre_points is None:
+            raise ErreurDecodage("Flux trop court : au moins 4 octets sont nécessaires")
+        if self._octets < self.nombre_points * 8:
+            raise ErreurDecodage(
+                f"Flux incomplet : {4 + self._octets} octets reçus, {4 + self.nombre_points * 8} attendus"
+            )
+
+    def terminer(self) -> list[tuple[float, float]]:
+        """Retourne les points décodés une fois le flux entièrement reçu.
+
+        :return: Liste de tuples (x, y), identique à decoder_pointset
+        :raises ErreurDecodage: Si le flux reçu est incomplet
+        :raises ValueError: Si le décodeur a été créé sans conversion
+        """
+        if not self.convertir:
+            raise ValueError("Décodeur créé sans conversion des coordonnées : utiliser verifier")
+        self.verifier()
+
+        coordonnees = self._coordonnees
+        return list(zip(coordonnees[0::2], coordonnees[1::2], strict=True))
+
+    def _lire_entete(self) -> None:
+        """Lit l'en-tête et le valide.
+
+        :raises ErreurTailleExcessive: Si le nombre de points dépasse la limite
+        :raises ErreurDecodage: Si le nombre de points est incompatible avec
+            la taille totale annoncée
+        """
+        nombre_points = struct.unpack('>I', self._entete)[0]
+
+        # La limite passe avant la cohérence avec la taille totale : un en-tête
+        # annonçant trop de points est refusé comme tel, même avec un corps court
+        if self.nombre_points_max is not None and nombre_points > self.nombre_points_max:
+            raise ErreurTailleExcessive(
+                f"Trop de points : {nombre_points} annoncés, au plus {self.nombre_points_max} acceptés"
+            )
+        taille_attendue = 4 + nombre_points * 8
+        if self.taille_totale is not None and self.taille_totale < taille_attendue:
+            raise ErreurDecodage(
+                f"Flux incomplet : {self.taille_totale} octets annoncés, {taille_attendue} attendus"
+            )
+
+        self.nombre_points = nombre_points
 
 
 def encoder_triangles(triangles: list[list[tuple[float, float]]]) -> bytes:
@@ -102,19 +274,189 @@ def encoder_triangles(triangles: list[list[tuple[float, float]]]) -> bytes:
                 vertex_to_index[point] = len(vertices)
                 vertices.append(point)
 
-    # Part 1 : Encoder les vertices (comme un PointSet)
-    flux = encoder_pointset(vertices)
+    # Pour chaque triangle, les 3 indices de ses sommets
+    indices = [[vertex_to_index[point] for point in triangle] for triangle in triangles]
 
-    # Part 2 : Encoder les triangles (indices)
-    flux += struct.pack('>I', len(triangles))
+    return encoder_triangles_indices(vertices, indices)
 
-    for triangle in triangles:
-        # Pour chaque triangle, encoder les 3 indices de ses sommets
-        for point in triangle:
-            index = vertex_to_index[point]
-            flux += struct.pack('>I', index)
 
-    return flux
+def encoder_triangles_indices(vertices, indices) -> bytes:
+    """Encode des triangles déjà indexés au format binaire Triangles.
+
+    Contrairement à encoder_triangles, les sommets ne sont pas retrouvés en
+    hachant leurs coordonnées : la triangulation fournit directement les
+    indices. Les deux parties du format sont écrites dans un seul bytearray
+    dimensionné d'avance.
+
+    :param vertices: Sommets, liste de tuples (x, y) ou tableau NumPy (N, 2)
+    :param indices: Triangles, liste de triplets d'indices, array('I') à plat
+        (3 indices par triangle) ou tableau NumPy (T, 3)
+    :return: Flux binaire encodé
+    """
+    nombre_vertices = len(vertices)
+    nombre_triangles = len(indices) // 3 if isinstance(indices, array) else len(indices)
+    debut_triangles = 4 + nombre_vertices * 8
+
+    flux = bytearray(debut_triangles + 4 + nombre_triangles * 12)
+
+    # Part 1 : les vertices (comme un PointSet)
+    struct.pack_into('>I', flux, 0, nombre_vertices)
+    _ecrire_coordonnees(flux, 4, vertices)
+
+    # Part 2 : les triangles (indices)
+    struct.pack_into('>I', flux, debut_triangles, nombre_triangles)
+    if isinstance(indices, array):
+        # Copie permutée en big-endian si nécessaire, puis une seule écriture
+        if sys.byteorder == 'little':
+            indices = array(indices.typecode, indices)
+            indices.byteswap()
+        flux[debut_triangles + 4 :] = indices.tobytes()
+    elif np is not None and isinstance(indices, np.ndarray):
+        flux[debut_triangles + 4 :] = indices.astype('>u4', copy=False).tobytes()
+    else:
+        struct.pack_into(f'>{nombre_triangles * 3}I', flux, debut_triangles + 4, *chain.from_iterable(indices))
+
+    return bytes(flux)
+
+
+def encoder_triangulation(triangulation) -> bytes:
+    """Encode directement le résultat de triangulate(..., result="triangulation").
+
+    :param triangulation: Objet Triangulation (sommets + indices)
+    :return: Flux binaire encodé au format Triangles
+    """
+    return encoder_triangles_indices(triangulation.vertices, triangulation.indices)
+
+
+def taille_triangles(nombre_vertices: int, nombre_triangles: int) -> int:
+    """Retourne la taille en octets d'un flux Triangles.
+
+    :param nombre_vertices: Nombre de sommets
+    :param nombre_triangles: Nombre de triangles
+    :return: Taille du flux encodé (en-têtes compris)
+    """
+    return 4 + nombre_vertices * 8 + 4 + nombre_triangles * 12
+
+
+def tailles_triangles(flux: bytes) -> tuple[int, int]:
+    """Retourne le nombre de sommets et de triangles d'un flux Triangles, sans le décoder.
+
+    :param flux: Flux binaire Triangles (supposé bien formé)
+    :return: Couple (nombre de sommets, nombre de triangles)
+    """
+    nombre_vertices = struct.unpack_from('>I', flux, 0)[0]
+    return nombre_vertices, (len(flux) - taille_triangles(nombre_vertices, 0)) // 12
+
+
+def encoder_triangles_morceaux(vertices, indices, taille_morceau: int = ELEMENTS_PAR_MORCEAU):
+    """Encode des triangles indexés au format Triangles, morceau par morceau.
+
+    Variante génératrice de encoder_triangles_indices : le flux n'est jamais
+    construit en entier. Chaque en-tête est émis dès le début de sa partie
+    (les nombres de sommets et de triangles sont connus d'avance), puis les
+    sommets et les indices par blocs de ``taille_morceau`` éléments. La
+    concaténation des morceaux est identique à encoder_triangles_indices.
+
+    :param vertices: Sommets, liste de tuples (x, y) ou tableau NumPy (N, 2)
+    :param indices: Triangles, liste de triplets d'indices, array('I') à plat
+        (3 indices par triangle) ou tableau NumPy (T, 3)
+    :param taille_morceau: Nombre de sommets ou de triangles par morceau
+    :return: Générateur de morceaux (bytes)
+    """
+    nombre_triangles = len(indices) // 3 if isinstance(indices, array) else len(indices)
+
+    # Part 1 : les vertices (comme un PointSet)
+    yield struct.pack('>I', len(vertices))
+    for debut in range(0, len(vertices), taille_morceau):
+        if np is not None and isinstance(vertices, np.ndarray):
+            yield vertices[debut : debut + taille_morceau].astype('>f4', copy=False).tobytes()
+        else:
+            bloc = list(chain.from_iterable(vertices[debut : debut + taille_morceau]))
+            yield struct.pack(f'>{len(bloc)}f', *bloc)
+
+    # Part 2 : les triangles (indices)
+    yield struct.pack('>I', nombre_triangles)
+    for debut in range(0, nombre_triangles, taille_morceau):
+        if isinstance(indices, array):
+            bloc = indices[3 * debut : 3 * (debut + taille_morceau)]
+            if sys.byteorder == 'little':
+                bloc.byteswap()
+            yield bloc.tobytes()
+        elif np is not None and isinstance(indices, np.ndarray):
+            yield indices[debut : debut + taille_morceau].astype('>u4', copy=False).tobytes()
+        else:
+            bloc = list(chain.from_iterable(indices[debut : debut + taille_morceau]))
+            yield struct.pack(f'>{len(bloc)}I', *bloc)
+
+
+def encoder_triangulation_morceaux(triangulation, taille_morceau: int = ELEMENTS_PAR_MORCEAU):
+    """Encode un résultat de triangulate(..., result="triangulation") morceau par morceau.
+
+    :param triangulation: Objet Triangulation (sommets + indices)
+    :param taille_morceau: Nombre de sommets ou de triangles par morceau
+    :return: Générateur de morceaux (bytes) du flux Triangles
+    """
+    return encoder_triangles_morceaux(triangulation.vertices, triangulation.indices, taille_morceau)
+
+
+def encoder_lot(elements: list[tuple[int, bytes]]) -> bytes:
+    """Encode les résultats d'un lot de triangulations.
+
+    Structure du binaire :
+    - 4 octets (unsigned long) : nombre d'éléments K
+    - Puis K répétitions de :
+      * 4 octets (unsigned long) : statut HTTP de l'élément (200 si réussi)
+      * 4 octets (unsigned long) : taille L du contenu
+      * L octets : flux Triangles (statut 200) ou erreur JSON {"code", "message"}
+
+    :param elements: Couples (statut, contenu), dans l'ordre du lot
+    :return: Flux binaire encodé
+    """
+    flux = bytearray(4 + sum(8 + len(contenu) for _, contenu in elements))
+    struct.pack_into('>I', flux, 0, len(elements))
+    offset = 4
+    for statut, contenu in elements:
+        struct.pack_into('>II', flux, offset, statut, len(contenu))
+        flux[offset + 8 : offset + 8 + len(contenu)] = contenu
+        offset += 8 + len(contenu)
+    return bytes(flux)
+
+
+def decoder_lot(flux: bytes) -> list[tuple[int, bytes]]:
+    """Décode le résultat d'un lot de triangulations (voir encoder_lot).
+
+    :param flux: Flux binaire du lot
+    :return: Couples (statut, contenu), dans l'ordre du lot
+    :raises ErreurDecodage: Si le flux est tronqué
+    """
+    if len(flux) < 4:
+        raise ErreurDecodage("Flux trop court : au moins 4 octets sont nécessaires")
+    nombre_elements = struct.unpack_from('>I', flux, 0)[0]
+
+    elements = []
+    offset = 4
+    for i in range(nombre_elements):
+        if len(flux) < offset + 8:
+            raise ErreurDecodage(f"Flux incomplet : en-tête de l'élément {i} manquant")
+        statut, taille = struct.unpack_from('>II', flux, offset)
+        if len(flux) < offset + 8 + taille:
+            raise ErreurDecodage(f"Flux incomplet : contenu de l'élément {i} tronqué")
+        elements.append((statut, bytes(flux[offset + 8 : offset + 8 + taille])))
+        offset += 8 + taille
+    return elements
+
+
+def _ecrire_coordonnees(flux: bytearray, offset: int, points) -> None:
+    """Écrit les coordonnées float32 big-endian des points dans un flux.
+
+    :param flux: Flux de destination, déjà dimensionné
+    :param offset: Position du premier octet à écrire
+    :param points: Liste de tuples (x, y) ou tableau NumPy (N, 2)
+    """
+    if np is not None and isinstance(points, np.ndarray):
+        flux[offset : offset + len(points) * 8] = points.astype('>f4', copy=False).tobytes()
+    else:
+        struct.pack_into(f'>{len(points) * 2}f', flux, offset, *chain.from_iterable(points))
 
 
 if __name__ == "__main__":
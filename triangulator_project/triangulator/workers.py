@@ -0,0 +1,162 @@
+"""Module d'exécution des triangulations hors du thread de la requête.
+
+La chaîne complète (décodage, triangulation, encodage) travaille sur des flux
+binaires : c'est ce qui circule entre le serveur et les processus de calcul,
+sans jamais sérialiser de listes de points.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from triangulator.core import Triangulation, triangulate
+from triangulator.exceptions import ErreurEncodage, ErreurSurcharge
+from triangulator.serializers import decoder_pointset, encoder_triangulation
+
+
+def calculer_triangulation(flux: bytes, progression=None, chronometre=None) -> Triangulation:
+    """Retourne la triangulation (sommets + indices) d'un flux PointSet.
+
+    :param flux: Flux binaire du PointSet
+    :param progression: Fonction de suivi de l'insertion (voir core.triangulate)
+    :param chronometre: Chronomètre (triangulator.metriques.Chronometre) où
+        enregistrer les étapes ``decode`` et ``triangulate``, ou None
+    :return: Objet Triangulation, prêt à être encodé
+    :raises ErreurDecodage: Si le flux PointSet est invalide
+    :raises ErreurTriangulation: Si la triangulation ne peut pas être effectuée
+    """
+    # Décoder le flux binaire en liste de points
+    points = decoder_pointset(flux)
+    if chronometre is not None:
+        chronometre.etape("decode")
+
+    # Calculer la triangulation (sommets + indices, sans repasser
+    # par les coordonnées de chaque triangle)
+    triangulation = triangulate(points, result="triangulation", progression=progression)
+    if chronometre is not None:
+        chronometre.etape("triangulate")
+    return triangulation
+
+
+def calculer_triangles(flux: bytes, progression=None, chronometre=None) -> bytes:
+    """Retourne le flux Triangles correspondant à un flux PointSet.
+
+    :param flux: Flux binaire du PointSet
+    :param progression: Fonction de suivi de l'insertion (voir core.triangulate)
+    :param chronometre: Chronomètre où enregistrer les étapes ``decode``,
+        ``triangulate`` et ``encode``, ou None
+    :return: Flux binaire Triangles
+    :raises ErreurDecodage: Si le flux PointSet est invalide
+    :raises ErreurTriangulation: Si la triangulation ne peut pas être effectuée
+    :raises ErreurEncodage: Si l'encodage du résultat échoue
+    """
+    triangulation = calculer_triangulation(flux, progression, chronometre)
+
+    try:
+        # Encoder le résultat en format binaire Triangles
+        resultat = encoder_triangulation(triangulation)
+    except Exception as e:
+        raise ErreurEncodage(str(e)) from e
+    if chronometre is not None:
+        chronometre.etape("encode")
+    return resultat
+
+
+class PoolTriangulation:
+    """Pool de processus exécutant calculer_triangles.
+
+    Le nombre de calculs en attente ou en cours est borné : au-delà, les
+    nouvelles demandes sont refusées immédiatement plutôt que d'allonger la
+    file. Chaque demande attend son résultat au plus ``timeout`` secondes.
+    Si un processus meurt (mémoire épuisée, signal), les calculs en cours sont
+    refusés comme en surcharge et les processus sont redémarrés.
+    """
+
+    def __init__(self, processus: int | None = None, file_max: int | None = None, timeout: float = 30.0):
+        """Démarre le pool.
+
+        :param processus: Nombre de processus (nombre de cœurs si None)
+        :param file_max: Nombre maximal de calculs en attente ou en cours
+            (deux par processus si None)
+        :param timeout: Temps d'attente maximal d'un résultat, en secondes
+        """
+        self.processus = processus or multiprocessing.cpu_count()
+        self.timeout = timeout
+        self.capacite = 2 * self.processus if file_max is None else file_max
+        self._places = threading.BoundedSemaphore(self.capacite)
+        self._verrou = threading.Lock()
+        self._executeur = self._creer_executeur()
+
+    def _creer_executeur(self) -> ProcessPoolExecutor:
+        """Retourne un nouvel exécuteur de processus."""
+        # "spawn" : forker un serveur multi-threadé peut bloquer les processus fils
+        return ProcessPoolExecutor(
+            max_workers=self.processus,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+
+    def _remplacer(self, executeur: ProcessPoolExecutor) -> None:
+        """Remplace un exécuteur dont un processus est mort.
+
+        Plusieurs requêtes peuvent constater la même panne : seule la première
+        recrée l'exécuteur.
+
+        :param executeur: Exécuteur constaté hors service
+        """
+        with self._verrou:
+            if self._executeur is executeur:
+                self._executeur = self._creer_executeur()
+        executeur.shutdown(wait=False, cancel_futures=True)
+
+    def calculer(self, flux: bytes) -> bytes:
+        """Retourne le flux Triangles d'un flux PointSet, calculé dans un processus du pool.
+
+        :param flux: Flux binaire du PointSet
+        :return: Flux binaire Triangles
+        :raises ErreurSurcharge: Si la file de calcul est pleine ou si le
+            processus de calcul s'est arrêté brutalement
+        :raises TimeoutError: Si le résultat n'est pas disponible à temps
+        :raises ErreurDecodage: Si le flux PointSet est invalide
+        :raises ErreurTriangulation: Si la triangulation ne peut pas être effectuée
+        :raises ErreurEncodage: Si l'encodage du résultat échoue
+        """
+        if not self._places.acquire(blocking=False):
+            raise ErreurSurcharge("File de calcul pleine")
+
+        executeur = self._executeur
+        try:
+            future = executeur.submit(calculer_triangles, bytes(flux))
+        except BrokenProcessPool as e:
+            self._places.release()
+            self._remplacer(executeur)
+            raise ErreurSurcharge("Processus de calcul interrompu") from e
+        except BaseException:
+            self._places.release()
+            raise
+
+        # La place n'est rendue qu'à la fin réelle du calcul, même si la
+        # requête a abandonné entre-temps
+        future.add_done_callback(lambda _: self._places.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+        except BrokenProcessPool as e:
+            self._remplacer(executeur)
+            raise ErreurSurcharge("Processus de calcul interrompu") from e
+
+    def fermer(self) -> None:
+        """Arrête les processus du pool."""
+        with self._verrou:
+            executeur = self._executeur
+        executeur.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        """Permet d'utiliser le pool dans un bloc with."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Arrête le pool en sortie de bloc with."""
+        self.fermer()